@@ -5,8 +5,11 @@ from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
+import pytest
+from fastapi import HTTPException
 
-from yomitalk.app import PaperPodcastApp
+from yomitalk.app import PaperPodcastApp, serve_hls_file
+from yomitalk.components.hls_segmenter import hls_playlists
 from yomitalk.user_session import UserSession
 
 
@@ -421,3 +424,35 @@ class TestCreateProgressHTML:
         result = self.app._create_progress_html(current_part=5, total_parts=10, status_message="音声生成中...", is_completed=False, start_time=start_time)
 
         assert "経過: 61:05" in result
+
+
+class TestServeHlsFile:
+    """Test serve_hls_file route handler."""
+
+    def test_serves_only_files_of_registered_session(self, tmp_path):
+        """Test that playlists are served by token and unknown tokens get 404."""
+        (tmp_path / "playlist.m3u8").write_text("#EXTM3U\n")
+        token = hls_playlists.register(tmp_path)
+        try:
+            response = serve_hls_file(token, "playlist.m3u8")
+            assert Path(response.path) == tmp_path / "playlist.m3u8"
+            assert response.media_type == "application/vnd.apple.mpegurl"
+
+            with pytest.raises(HTTPException) as exc_info:
+                serve_hls_file("another-session", "playlist.m3u8")
+            assert exc_info.value.status_code == 404
+        finally:
+            hls_playlists.release(token)
+
+
+class TestEstimateAudioPartsCount:
+    """Test _estimate_audio_parts_count method."""
+
+    def test_estimate_matches_generated_turns(self):
+        """Test that the estimate uses the same turns as audio generation (full-width colons and continuation lines included)."""
+        app = PaperPodcastApp()
+        script = "ずんだもん：こんにちはなのだ\n四国めたん: よろしくね\n補足: これは続きの行ではなく話者の行\n四国めたん：まとめです"
+
+        # The previous estimate only counted lines with a half-width colon (2 here)
+        assert app._estimate_audio_parts_count(script) == 4
+        assert app._estimate_audio_parts_count(script) == len(UserSession("estimate").audio_generator._extract_conversation_parts(script))
@@ -0,0 +1,113 @@
+"""Unit tests for audio caches."""
+
+import os
+
+from yomitalk.components.audio_cache import AudioQueryCache, UtteranceCache
+
+
+class TestUtteranceCache:
+    """Test class for UtteranceCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """A stored utterance is returned on the next lookup and counted as a hit."""
+        cache = UtteranceCache(tmp_path, max_bytes=1024 * 1024)
+        key = cache.make_key("なるほど", 3, 1.1, "0.16.1+dict.abc")
+
+        assert cache.get(key) is None
+        cache.put(key, b"RIFF-wav-data")
+        assert cache.get(key) == b"RIFF-wav-data"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_key_depends_on_all_inputs(self):
+        """Changing text, style, speed or engine version changes the key."""
+        base = UtteranceCache.make_key("なるほど", 3, 1.1, "v1")
+        assert base == UtteranceCache.make_key("なるほど", 3, 1.1, "v1")
+        assert base != UtteranceCache.make_key("なるほどね", 3, 1.1, "v1")
+        assert base != UtteranceCache.make_key("なるほど", 2, 1.1, "v1")
+        assert base != UtteranceCache.make_key("なるほど", 3, 1.0, "v1")
+        assert base != UtteranceCache.make_key("なるほど", 3, 1.1, "v2")
+
+    def test_shared_between_instances(self, tmp_path):
+        """Entries written by one instance (process) are visible to another."""
+        writer = UtteranceCache(tmp_path, max_bytes=1024 * 1024)
+        reader = UtteranceCache(tmp_path, max_bytes=1024 * 1024)
+        key = writer.make_key("こんにちは", 2, 1.0, "v1")
+
+        writer.put(key, b"shared")
+        assert reader.get(key) == b"shared"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """When the size budget is exceeded, the least recently used entries are deleted."""
+        cache = UtteranceCache(tmp_path, max_bytes=250)
+        keys = [cache.make_key(f"text{i}", 1, 1.0, "v1") for i in range(3)]
+
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, b"x" * 100)
+            os.utime(cache._path_for(key), (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so that the second one becomes least recently used
+        assert cache.get(keys[0]) is not None
+        cache.put(keys[2], b"x" * 100)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_and_empty_entries_are_not_stored(self, tmp_path):
+        """Empty data and entries larger than the whole cache are ignored."""
+        cache = UtteranceCache(tmp_path, max_bytes=10)
+        cache.put("a" * 64, b"")
+        cache.put("b" * 64, b"x" * 11)
+
+        assert cache.get("a" * 64) is None
+        assert cache.get("b" * 64) is None
+
+
+class TestAudioQueryCache:
+    """Test class for AudioQueryCache."""
+
+    def test_get_returns_query_for_same_style_and_dictionary(self):
+        """A query is returned only for the style and dictionary version it was stored with."""
+        cache = AudioQueryCache(max_entries=10)
+        query = object()
+        cache.put("こんにちは", 3, "dict1", query)
+
+        assert cache.get("こんにちは", 3, "dict1") is query
+        assert cache.get("こんにちは", 2, "dict1") is None
+        assert cache.get("こんにちは", 3, "dict2") is None
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_get_any_style_finds_analysis_of_other_style(self):
+        """Analysis results of another style can be found for style swaps."""
+        cache = AudioQueryCache(max_entries=10)
+        query = object()
+        cache.put("こんにちは", 3, "dict1", query)
+
+        assert cache.get_any_style("こんにちは", "dict1") == (3, query)
+        assert cache.get_any_style("こんにちは", "dict2") is None
+        assert cache.get_any_style("さようなら", "dict1") is None
+
+    def test_evicts_least_recently_used_text(self):
+        """The least recently used text is dropped when the cache is full."""
+        cache = AudioQueryCache(max_entries=2)
+        cache.put("一", 1, "d", "q1")
+        cache.put("二", 1, "d", "q2")
+        assert cache.get("一", 1, "d") == "q1"
+        cache.put("三", 1, "d", "q3")
+
+        assert cache.get("一", 1, "d") == "q1"
+        assert cache.get("二", 1, "d") is None
+        assert cache.get("三", 1, "d") == "q3"
+
+    def test_clear(self):
+        """clear() drops every entry."""
+        cache = AudioQueryCache(max_entries=2)
+        cache.put("一", 1, "d", "q1")
+        cache.clear()
+        assert cache.get("一", 1, "d") is None
@@ -0,0 +1,78 @@
+"""Unit tests for the audio encoder."""
+
+import os
+import stat
+from unittest.mock import patch
+
+from yomitalk.components.audio_encoder import AudioEncoder, find_audio_files
+
+
+def _write_script(path, body):
+    """Write an executable shell script standing in for ffmpeg."""
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+class TestAudioEncoder:
+    """Test class for AudioEncoder."""
+
+    def test_wav_format_is_passed_through(self, tmp_path):
+        """With the WAV format the source file is delivered without encoding."""
+        wav_path = tmp_path / "audio_1.wav"
+        wav_path.write_bytes(b"RIFF")
+        encoder = AudioEncoder(output_format="wav")
+
+        assert not encoder.enabled
+        assert encoder.submit(wav_path).result() == str(wav_path)
+        assert wav_path.exists()
+        encoder.shutdown()
+
+    def test_missing_ffmpeg_disables_encoding(self):
+        """Without an ffmpeg binary the encoder falls back to WAV."""
+        with patch("shutil.which", return_value=None):
+            encoder = AudioEncoder(output_format="mp3")
+        assert not encoder.enabled
+        encoder.shutdown()
+
+    def test_encodes_in_background_and_removes_source(self, tmp_path):
+        """The encoded file replaces the WAV file, which is kept only on request."""
+        # Copy the input (argument after -i) to the last argument
+        ffmpeg = _write_script(tmp_path / "ffmpeg", 'while [ "$1" != "-i" ]; do shift; done; input="$2"; for last; do :; done; cp "$input" "$last"')
+        encoder = AudioEncoder(output_format="mp3", ffmpeg_path=ffmpeg)
+        final_wav = tmp_path / "audio_1.wav"
+        final_wav.write_bytes(b"final")
+        part_wav = tmp_path / "part_000_ずんだもん.wav"
+        part_wav.write_bytes(b"part")
+
+        assert encoder.submit(final_wav).result() == str(tmp_path / "audio_1.mp3")
+        assert encoder.submit(part_wav, keep_source=True).result() == str(tmp_path / "part_000_ずんだもん.mp3")
+        encoder.shutdown()
+
+        assert (tmp_path / "audio_1.mp3").read_bytes() == b"final"
+        assert not final_wav.exists()
+        assert part_wav.exists()
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_failed_encoding_keeps_wav(self, tmp_path):
+        """When ffmpeg fails the WAV file is delivered and no partial output is left."""
+        ffmpeg = _write_script(tmp_path / "ffmpeg", 'for last; do :; done; echo broken > "$last"; echo "encoder error" >&2; exit 1')
+        encoder = AudioEncoder(output_format="aac", ffmpeg_path=ffmpeg)
+        wav_path = tmp_path / "audio_1.wav"
+        wav_path.write_bytes(b"final")
+
+        assert encoder.encode(wav_path) == str(wav_path)
+        assert wav_path.exists()
+        assert sorted(os.listdir(tmp_path)) == ["audio_1.wav", "ffmpeg"]
+        encoder.shutdown()
+
+
+def test_find_audio_files_prefers_output_format(tmp_path):
+    """Final audio of any format is found, files of the output format first."""
+    for name in ["audio_1.wav", "audio_1.mp3", "audio_2.mp3.partial", "part_000_a.wav", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+
+    with patch("yomitalk.components.audio_encoder.OUTPUT_AUDIO_FORMAT", "mp3"):
+        assert [path.name for path in find_audio_files(tmp_path)] == ["audio_1.mp3", "audio_1.wav"]
+    assert [path.name for path in find_audio_files(tmp_path, "part_")] == ["part_000_a.wav"]
+    assert find_audio_files(tmp_path / "missing") == []
@@ -1,16 +1,30 @@
 """Unit tests for AudioGenerator class."""
 
+import json
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from yomitalk.components.part_manifest import PartManifest
+from yomitalk.utils.audio_postprocess import SPEAKER_CHANGE_PAUSE_SECONDS
 from yomitalk.components.audio_generator import (
     AudioGenerator,
+    VoicevoxCoreManager,
     WordType,
 )
 
 
+def _resolved(value):
+    """Create a Future already resolved with a value."""
+    from concurrent.futures import Future
+
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
 class TestAudioGenerator:
     """Test class for AudioGenerator."""
 
@@ -119,6 +133,566 @@ class TestAudioGenerator:
         assert isinstance(self.audio_generator.output_dir, Path)
         assert isinstance(self.audio_generator.temp_dir, Path)
 
+    def test_synthesize_conversation_chunks_with_pool_keeps_script_order(self):
+        """ワーカープール使用時も台本順にパートが返されることのテスト"""
+        from concurrent.futures import Future
+
+        conversation_parts = [("ずんだもん", "一つ目"), ("四国めたん", " "), ("四国めたん", "三つ目"), ("ずんだもん", "四つ目")]
+        submitted = []
+
+        def submit(text, style_id):
+            submitted.append(text)
+            future: Future = Future()
+            future.set_result(text.encode())
+            return future
+
+        mock_pool = MagicMock()
+        mock_pool.size = 1
+        mock_pool.submit.side_effect = submit
+
+        with patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=mock_pool):
+            results = list(self.audio_generator._synthesize_conversation_chunks(conversation_parts, start_part=0))
+
+        assert [(i, speaker, j, is_last) for i, speaker, j, is_last, _ in results] == [(0, "ずんだもん", 0, True), (2, "四国めたん", 0, True), (3, "ずんだもん", 0, True)]
+        assert [wav for *_, wav in results] == ["一つ目".encode(), "三つ目".encode(), "四つ目".encode()]
+        assert submitted == ["一つ目", "三つ目", "四つ目"]
+
+    def test_synthesize_conversation_chunks_with_scheduler_uses_session_queue(self):
+        """スケジューラー有効時はセッションIDごとのキューに合成が投入されることのテスト"""
+        from yomitalk.components.synthesis_scheduler import SynthesisScheduler
+
+        scheduler = SynthesisScheduler(capacity=1)
+        scheduler.start()
+        conversation_parts = [("ずんだもん", "一つ目"), ("四国めたん", "二つ目")]
+        try:
+            with (
+                patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+                patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=scheduler),
+                patch.object(scheduler, "submit", wraps=scheduler.submit) as mock_submit,
+                patch.object(self.audio_generator, "_text_to_speech", side_effect=lambda text, style_id: text.encode()),
+            ):
+                results = list(self.audio_generator._synthesize_conversation_chunks(conversation_parts))
+        finally:
+            scheduler.shutdown()
+
+        assert [wav for *_, wav in results] == ["一つ目".encode(), "二つ目".encode()]
+        assert [call.args[0] for call in mock_submit.call_args_list] == [self.audio_generator.session_id] * 2
+
+    def test_first_turns_of_job_use_priority_lane(self):
+        """ジョブの最初のパートのみ優先レーンに投入されることのテスト"""
+        from concurrent.futures import Future
+
+        conversation_parts = [("ずんだもん", f"{i}つ目") for i in range(5)]
+        priorities = []
+
+        def submit(text, style_id, priority=False):
+            priorities.append(priority)
+            future: Future = Future()
+            future.set_result(text.encode())
+            return future
+
+        with (
+            patch("yomitalk.components.audio_generator.PRIORITY_TURNS", 2),
+            patch.object(self.audio_generator, "_submit_chunk", side_effect=submit),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=MagicMock(capacity=1)),
+        ):
+            list(self.audio_generator._synthesize_conversation_chunks(conversation_parts, start_part=1))
+
+        assert priorities == [True, True, False, False]
+
+    def test_cancelled_render_does_not_block_segments(self):
+        """逐次生成の合成ジョブが取り消されても、セグメントの受け取りで待ち続けないことのテスト"""
+        from concurrent.futures import Future
+
+        def submit(session_id, func, priority=False):
+            future: Future = Future()
+            future.cancel()
+            return future
+
+        scheduler = MagicMock(capacity=1)
+        scheduler.submit.side_effect = submit
+        with patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=scheduler):
+            segments = list(self.audio_generator._text_to_speech_segments("こんにちは", 3))
+
+        assert segments == [(b"", True)]
+
+    def test_async_chunks_with_scheduler_keep_script_order(self):
+        """非同期版でもスケジューラーのFutureをawaitして台本順にパートが返されることのテスト"""
+        import asyncio
+        from concurrent.futures import Future
+
+        conversation_parts = [("ずんだもん", "一つ目"), ("四国めたん", " "), ("四国めたん", "三つ目")]
+
+        def submit(text, style_id, priority=False):
+            future: Future = Future()
+            future.set_result(text.encode())
+            return future
+
+        async def collect():
+            return [result async for result in self.audio_generator._synthesize_conversation_chunks_async(conversation_parts)]
+
+        with (
+            patch.object(self.audio_generator, "_submit_chunk", side_effect=submit),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=MagicMock(capacity=1)),
+        ):
+            results = asyncio.run(collect())
+
+        assert [(i, speaker, j, is_last) for i, speaker, j, is_last, _ in results] == [(0, "ずんだもん", 0, True), (2, "四国めたん", 0, True)]
+        assert [wav for *_, wav in results] == ["一つ目".encode(), "三つ目".encode()]
+
+    def test_async_chunks_without_scheduler_use_manager_async_api(self):
+        """スケジューラーもプールも無い場合はマネージャーの非同期APIで合成されることのテスト"""
+        import asyncio
+
+        mock_manager = MagicMock()
+
+        async def text_to_speech_async(text, style_id):
+            return text.encode()
+
+        mock_manager.text_to_speech_async.side_effect = text_to_speech_async
+
+        async def collect():
+            return [result async for result in self.audio_generator._synthesize_conversation_chunks_async([("ずんだもん", "こんにちは")])]
+
+        with (
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_voicevox_manager", return_value=mock_manager),
+        ):
+            results = asyncio.run(collect())
+
+        assert [wav for *_, wav in results] == ["こんにちは".encode()]
+        mock_manager.text_to_speech.assert_not_called()
+
+    def test_streaming_render_segments_are_numbered_per_part(self):
+        """逐次生成時はパート内のセグメントが通し番号でyieldされることのテスト"""
+        conversation_parts = [("ずんだもん", "一文目です。二文目です。")]
+        mock_manager = MagicMock()
+        mock_manager.text_to_speech_stream.side_effect = lambda text, style_id: iter([(text.encode(), False), (b"end", True)])
+
+        with (
+            patch("yomitalk.components.audio_generator.STREAMING_RENDER", True),
+            patch("yomitalk.components.audio_generator.SYNTHESIS_CHUNK_CHARS", 6),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_voicevox_manager", return_value=mock_manager),
+        ):
+            results = list(self.audio_generator._synthesize_conversation_chunks(conversation_parts))
+
+        assert [(j, is_last, wav) for _, _, j, is_last, wav in results] == [
+            (0, False, "一文目です。".encode()),
+            (1, False, b"end"),
+            (2, False, "二文目です。".encode()),
+            (3, True, b"end"),
+        ]
+
+    def test_async_streaming_render_segments_are_numbered_per_part(self):
+        """非同期版でもSTREAMING_RENDER有効時はフレーム単位で逐次生成されることのテスト"""
+        import asyncio
+
+        conversation_parts = [("ずんだもん", "一文目です。二文目です。")]
+        mock_manager = MagicMock()
+        mock_manager.text_to_speech_stream.side_effect = lambda text, style_id: iter([(text.encode(), False), (b"end", True)])
+
+        async def collect():
+            return [result async for result in self.audio_generator._synthesize_conversation_chunks_async(conversation_parts)]
+
+        with (
+            patch("yomitalk.components.audio_generator.STREAMING_RENDER", True),
+            patch("yomitalk.components.audio_generator.SYNTHESIS_CHUNK_CHARS", 6),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_voicevox_manager", return_value=mock_manager),
+        ):
+            results = asyncio.run(collect())
+
+        assert [(j, is_last, wav) for _, _, j, is_last, wav in results] == [
+            (0, False, "一文目です。".encode()),
+            (1, False, b"end"),
+            (2, False, "二文目です。".encode()),
+            (3, True, b"end"),
+        ]
+        mock_manager.text_to_speech_async.assert_not_called()
+
+    def test_async_assembly_runs_off_event_loop(self, tmp_path):
+        """非同期版ではパートの結合とファイルの書き込みがイベントループのスレッド外で行われることのテスト"""
+        import asyncio
+        import threading
+
+        loop_threads = []
+        assemble_threads = []
+        assemble_segment = self.audio_generator._assemble_segment
+
+        def record_assemble_segment(*args):
+            assemble_threads.append(threading.get_ident())
+            return assemble_segment(*args)
+
+        async def text_to_speech_async(text, style_id):
+            return b""
+
+        async def collect():
+            loop_threads.append(threading.get_ident())
+            return [path async for path in self.audio_generator._generate_and_combine_audio_with_resume_async([("ずんだもん", "一つ目")], tmp_path / "stream")]
+
+        (tmp_path / "stream").mkdir()
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        with (
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=None),
+            patch.object(self.audio_generator, "_text_to_speech_async", side_effect=text_to_speech_async),
+            patch.object(self.audio_generator, "_assemble_segment", side_effect=record_assemble_segment),
+        ):
+            asyncio.run(collect())
+
+        assert assemble_threads and loop_threads[0] not in assemble_threads
+
+    @pytest.mark.parametrize(
+        "text, max_chars, expected",
+        [
+            ("短いセリフです。", 10, ["短いセリフです。"]),
+            ("一文目です。二文目です！三文目？", 6, ["一文目です。", "二文目です！", "三文目？"]),
+            ("一文目です。二文目です！三文目？", 12, ["一文目です。二文目です！", "三文目？"]),
+            ("一行目\n二行目\n三行目", 4, ["一行目", "二行目", "三行目"]),
+            ("とても長い文章で、読点で区切られています。", 12, ["とても長い文章で、", "読点で区切られています。"]),
+            ("区切りのない長い文章", 5, ["区切りのない長い文章"]),
+            ("一文目です。二文目です。", 0, ["一文目です。二文目です。"]),
+        ],
+    )
+    def test_split_into_sentence_chunks(self, text, max_chars, expected):
+        """長いセリフが文の区切りでチャンクに分割されることのテスト"""
+        assert self.audio_generator._split_into_sentence_chunks(text, max_chars) == expected
+
+    def test_long_part_is_streamed_in_chunks_and_stitched(self, tmp_path):
+        """長いパートはチャンクごとにyieldされ、1つのパートファイルに結合されることのテスト"""
+        import io
+        import wave
+
+        def make_wav(text, style_id):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        conversation_parts = [("ずんだもん", "一文目です。二文目です。"), ("四国めたん", "短い")]
+        self.audio_generator.output_dir = tmp_path
+        with (
+            patch("yomitalk.components.audio_generator.SYNTHESIS_CHUNK_CHARS", 6),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav),
+        ):
+            paths = list(self.audio_generator._generate_and_combine_audio_with_resume(conversation_parts, tmp_path))
+
+        names = [Path(path).name for path in paths]
+        assert names[:4] == ["chunk_000_000_ずんだもん.wav", "chunk_000_001_ずんだもん.wav", "part_000_ずんだもん.wav", "part_001_四国めたん.wav"]
+        assert names[4].startswith("audio_")
+        # チャンクファイルはパートファイルへの結合後に削除される
+        assert not list(tmp_path.glob("chunk_*.wav"))
+        with wave.open(paths[2], "rb") as wav_file:
+            assert wav_file.getnframes() == len("一文目です。二文目です。")
+        # 最終ファイルは全パートのフレームを逐次追記して作成される（話者交代の間を含む）
+        pause_frames = int(SPEAKER_CHANGE_PAUSE_SECONDS * 24000)
+        with wave.open(paths[4], "rb") as wav_file:
+            assert wav_file.getnframes() == len("一文目です。二文目です。短い") + pause_frames
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_final_audio_is_encoded_by_global_encoder(self, tmp_path):
+        """最終ファイルはエンコーダーで圧縮したパスが提供されることのテスト"""
+        import io
+        import wave
+        from concurrent.futures import Future
+
+        def make_wav(text, style_id):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        def submit(wav_path, keep_source=False):
+            future: Future = Future()
+            future.set_result(str(Path(wav_path).with_suffix(".mp3")))
+            return future
+
+        mock_encoder = MagicMock()
+        mock_encoder.submit.side_effect = submit
+        self.audio_generator.output_dir = tmp_path / "output"
+        with (
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_audio_encoder", return_value=mock_encoder),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav),
+        ):
+            paths = list(self.audio_generator._generate_and_combine_audio_with_resume([("ずんだもん", "こんにちは")], tmp_path))
+
+        # パートはWAVのまま提供され、最終ファイルのみエンコードされる
+        assert Path(paths[0]).name == "part_000_ずんだもん.wav"
+        assert paths[-1].endswith(".mp3")
+        assert self.audio_generator.final_audio_path == paths[-1]
+        mock_encoder.submit.assert_called_once()
+
+    def test_hls_playlist_is_written_alongside_parts(self, tmp_path):
+        """HLS出力が有効な場合はパートの音声を1つのffmpegのHLSマルチプレクサーに順に渡すことのテスト"""
+        import io
+        import stat
+        import wave
+
+        def make_wav(text, style_id):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * 24000)
+            return buffer.getvalue()
+
+        # 標準入力に渡された音声を記録するffmpegの代わりのスクリプト
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text(f'#!/bin/sh\ncat > "{tmp_path}/input.pcm"\n')
+        ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+
+        self.audio_generator.output_dir = tmp_path / "output"
+        (tmp_path / "stream_1").mkdir()
+        with (
+            patch("yomitalk.components.audio_generator.HLS_STREAMING", True),
+            patch("yomitalk.utils.audio_postprocess.POSTPROCESS_ENABLED", False),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_audio_encoder", return_value=MagicMock(ffmpeg_path=str(ffmpeg))),
+            patch.object(self.audio_generator, "_encode_output", side_effect=lambda path: _resolved(path)),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav),
+        ):
+            list(self.audio_generator._generate_and_combine_audio_with_resume([("ずんだもん", "一つ目"), ("四国めたん", "二つ目")], tmp_path / "stream_1"))
+
+        assert self.audio_generator.hls_playlist_path is not None
+        assert Path(self.audio_generator.hls_playlist_path).parent == tmp_path / "output" / "hls" / "stream_1"
+        assert (tmp_path / "input.pcm").read_bytes() == b"\x00\x01" * 48000
+        # プレイリストはファイルパスではなくこのセッションのトークンで配信する
+        assert self.audio_generator.hls_playlist_url == f"/hls/{self.audio_generator.hls_token}/playlist.m3u8"
+        self.audio_generator.reset_audio_generation_state()
+        assert self.audio_generator.hls_playlist_url is None
+
+    def test_hls_output_is_disabled_without_ffmpeg(self, tmp_path):
+        """ffmpegが無い場合はHLS出力を行わないことのテスト"""
+        with (
+            patch("yomitalk.components.audio_generator.HLS_STREAMING", True),
+            patch("yomitalk.components.audio_generator.get_global_audio_encoder", return_value=MagicMock(ffmpeg_path=None)),
+        ):
+            assert self.audio_generator._create_segmenter(tmp_path / "stream_1") is None
+        assert self.audio_generator.hls_playlist_path is None
+
+    def test_resume_appends_existing_parts_to_final_audio(self, tmp_path):
+        """再開時は既存パートのファイルを最終ファイルに追記し、新しいパートを続けることのテスト"""
+        import io
+        import wave
+
+        def make_wav(text, style_id=None):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        existing_part = tmp_path / "part_000_ずんだもん.wav"
+        existing_part.write_bytes(make_wav("既存"))
+        conversation_parts = [("ずんだもん", "既存"), ("四国めたん", "新しいパート")]
+        self.audio_generator.output_dir = tmp_path / "output"
+        with (
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav),
+        ):
+            paths = list(self.audio_generator._generate_and_combine_audio_with_resume(conversation_parts, tmp_path, 1, [str(existing_part)]))
+
+        assert paths[0] == str(existing_part)
+        assert paths[-1] == self.audio_generator.final_audio_path
+        # 再開したパートの前には、既存パートの話者からの話者交代の間が入る
+        with wave.open(paths[-1], "rb") as wav_file:
+            assert wav_file.getnframes() == len("既存新しいパート") + int(SPEAKER_CHANGE_PAUSE_SECONDS * 24000)
+
+    def test_synthesis_does_not_wait_for_part_encoding(self, tmp_path):
+        """パートのエンコードの完了を待たずに次のパートを合成し、エンコード済みのパートを順に提供することのテスト"""
+        import io
+        import wave
+        from concurrent.futures import Future
+
+        def make_wav(text):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        encoding = []
+        pending_when_synthesized = []
+
+        def encode_output(audio_path):
+            future: Future = Future()
+            if os.path.basename(audio_path).startswith("part_000"):
+                # 最初のパートのエンコードは次のパートの合成中に完了する
+                encoding.append((audio_path, future))
+            else:
+                future.set_result(audio_path)
+            return future
+
+        def text_to_speech(text, style_id):
+            pending_when_synthesized.append([path for path, future in encoding if not future.done()])
+            for path, future in encoding:
+                if not future.done():
+                    future.set_result(path.replace(".wav", ".mp3"))
+            return make_wav(text)
+
+        (tmp_path / "stream").mkdir()
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        with (
+            patch("yomitalk.utils.audio_postprocess.POSTPROCESS_ENABLED", False),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_scheduler", return_value=None),
+            patch.object(self.audio_generator, "_encode_output", side_effect=encode_output),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=text_to_speech),
+        ):
+            paths = list(self.audio_generator._generate_and_combine_audio_with_resume([("ずんだもん", "一つ目"), ("四国めたん", "二つ目")], tmp_path / "stream"))
+
+        assert len(pending_when_synthesized[1]) == 1
+        assert [Path(path).name for path in paths[:2]] == ["part_000_ずんだもん.mp3", "part_001_四国めたん.wav"]
+
+    def test_edited_script_reuses_parts_of_unchanged_turns(self, tmp_path):
+        """編集後の台本では変更のないセリフのパートを再利用し、挿入・変更したセリフのみ合成することのテスト"""
+        import io
+        import wave
+
+        def make_wav(text, style_id=None):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        old_script = [("ずんだもん", "一つ目"), ("四国めたん", "二つ目"), ("ずんだもん", "三つ目")]
+        new_script = [("ずんだもん", "一つ目"), ("四国めたん", "二つ目を修正"), ("ずんだもん", "三つ目"), ("四国めたん", "追加")]
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        manifest = PartManifest(tmp_path)
+        with (
+            patch("yomitalk.utils.audio_postprocess.POSTPROCESS_ENABLED", False),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav) as text_to_speech,
+        ):
+            (tmp_path / "stream_old").mkdir()
+            list(self.audio_generator._generate_and_combine_audio_with_resume(old_script, tmp_path / "stream_old"))
+            text_to_speech.reset_mock()
+
+            (tmp_path / "stream_new").mkdir()
+            new_paths = list(self.audio_generator._generate_and_combine_audio_with_resume(new_script, tmp_path / "stream_new", previous_parts=manifest.latest_parts()))
+
+        assert [call.args[0] for call in text_to_speech.call_args_list] == ["二つ目を修正", "追加"]
+        assert [Path(path).name for path in new_paths[:4]] == ["part_000_ずんだもん.wav", "part_001_四国めたん.wav", "part_002_ずんだもん.wav", "part_003_四国めたん.wav"]
+        # 再利用したパートは新しいストリームディレクトリに移動し、再利用しないパートは削除する
+        assert not list((tmp_path / "stream_old").glob("part_*.wav"))
+        assert not (tmp_path / "stream_new" / "reusable").exists()
+        with wave.open(new_paths[-1], "rb") as wav_file:
+            assert wav_file.getnframes() == len("一つ目二つ目を修正三つ目追加")
+        # 再利用したパートと新しいパートがマニフェストに記録され、次の編集で再利用できる
+        assert [record.path for record in manifest.latest_parts()] == new_paths[:4]
+        assert manifest.latest_parts()[0].size == os.path.getsize(new_paths[0])
+
+    def test_reused_parts_count_towards_speaker_loudness(self, tmp_path):
+        """再利用したパートの音量も話者ごとの音量の履歴に含め、新しいパートを全体を合成した場合と同じ音量にそろえることのテスト"""
+        import io
+        import wave
+
+        import numpy as np
+
+        def make_wav(text, style_id=None):
+            amplitude = 8000 if text.startswith("大") else 1000
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(np.where(np.arange(4800) % 2 == 0, amplitude, -amplitude).astype("<i2").tobytes())
+            return buffer.getvalue()
+
+        old_script = [("ずんだもん", "大きな声"), ("四国めたん", "大きな声")]
+        new_script = [*old_script, ("ずんだもん", "小さな声")]
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        manifest = PartManifest(tmp_path)
+        with (
+            patch("yomitalk.utils.audio_postprocess.POSTPROCESS_ENABLED", True),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav) as text_to_speech,
+        ):
+            for stream in ("stream_old", "stream_new", "stream_full"):
+                (tmp_path / stream).mkdir()
+            list(self.audio_generator._generate_and_combine_audio_with_resume(old_script, tmp_path / "stream_old"))
+            assert manifest.latest_parts()[0].loudness == 8000
+            list(self.audio_generator._generate_and_combine_audio_with_resume(new_script, tmp_path / "stream_new", previous_parts=manifest.latest_parts()))
+            list(self.audio_generator._generate_and_combine_audio_with_resume(new_script, tmp_path / "stream_full"))
+
+        assert text_to_speech.call_count == 2 + 1 + 3
+        new_part = (tmp_path / "stream_new" / "part_002_ずんだもん.wav").read_bytes()
+        assert new_part == (tmp_path / "stream_full" / "part_002_ずんだもん.wav").read_bytes()
+
+    def test_parts_are_not_reused_after_engine_version_change(self, tmp_path):
+        """辞書の再読み込みなどでエンジンのバージョンが変わった場合はパートを再利用しないことのテスト"""
+        import io
+        import wave
+
+        def make_wav(text, style_id=None):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(24000)
+                wav_file.writeframes(b"\x00\x01" * len(text))
+            return buffer.getvalue()
+
+        script = [("ずんだもん", "一つ目"), ("四国めたん", "二つ目")]
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        manifest = PartManifest(tmp_path)
+        manager = MagicMock(engine_version="core+dict.old")
+        with (
+            patch("yomitalk.utils.audio_postprocess.POSTPROCESS_ENABLED", False),
+            patch("yomitalk.components.audio_generator.get_global_synthesis_pool", return_value=None),
+            patch("yomitalk.components.audio_generator.get_global_voicevox_manager", return_value=manager),
+            patch.object(self.audio_generator, "_text_to_speech", side_effect=make_wav) as text_to_speech,
+        ):
+            (tmp_path / "stream_old").mkdir()
+            list(self.audio_generator._generate_and_combine_audio_with_resume(script, tmp_path / "stream_old"))
+            text_to_speech.reset_mock()
+
+            manager.engine_version = "core+dict.new"
+            (tmp_path / "stream_new").mkdir()
+            list(self.audio_generator._generate_and_combine_audio_with_resume(script, tmp_path / "stream_new", previous_parts=manifest.latest_parts()))
+
+        assert [call.args[0] for call in text_to_speech.call_args_list] == ["一つ目", "二つ目"]
+
+    def test_stale_reusable_parts_are_removed_on_next_start(self, tmp_path):
+        """中断された生成が退避したまま残したパートは、次の生成の開始時に削除されることのテスト"""
+        stash_dir = tmp_path / "stream_interrupted" / "reusable"
+        stash_dir.mkdir(parents=True)
+        (stash_dir / "001.wav").write_bytes(b"RIFF")
+        self.audio_generator.output_dir = tmp_path / "output"
+        self.audio_generator.temp_dir = tmp_path
+        (tmp_path / "stream_new").mkdir()
+
+        self.audio_generator._create_assembly([("ずんだもん", "一つ目")], tmp_path / "stream_new")
+
+        assert not stash_dir.exists()
+        assert (tmp_path / "stream_interrupted").exists()
+
     @pytest.mark.parametrize(
         "text, expected",
         [
@@ -229,6 +803,58 @@ class TestAudioGenerator:
         result = self.audio_generator._convert_english_to_katakana(text)
         assert result == expected
 
+    def test_convert_english_to_katakana_converts_unique_words_in_one_batch(self):
+        """繰り返し出現する英単語も変換器には一度だけまとめて渡されることのテスト"""
+        mock_converter = MagicMock()
+        mock_converter.convert_batch.side_effect = lambda words: {word: f"<{word}>" for word in words}
+
+        with patch("yomitalk.components.audio_generator.get_global_katakana_converter", return_value=mock_converter):
+            result = self.audio_generator._convert_english_to_katakana("modelとmodel、Transformerのmodel")
+
+        assert result == "<model>と<model>、<Transformer>の<model>"
+        mock_converter.convert_batch.assert_called_once()
+        assert sorted(set(mock_converter.convert_batch.call_args.args[0])) == ["Transformer", "model"]
+
+    def test_convert_english_to_katakana_matches_golden_corpus(self):
+        """トークナイザーによる変換結果（空白・息継ぎの規則）がゴールデンコーパスと完全に一致することのテスト"""
+        corpus = json.loads((Path(__file__).parent.parent / "data" / "katakana_golden.json").read_text(encoding="utf-8"))
+        mock_converter = MagicMock()
+        mock_converter.convert_batch.side_effect = lambda words: {word: f"[{word}]" for word in words}
+
+        with patch("yomitalk.components.audio_generator.get_global_katakana_converter", return_value=mock_converter):
+            results = [self.audio_generator._convert_english_to_katakana(case["text"]) for case in corpus]
+
+        assert results == [case["expected"] for case in corpus]
+
+    def test_prepare_conversation_resolves_romanized_speaker_names(self):
+        """ローマ字表記の話者名がカタカナ変換後の名前で正しいキャラクターに解決されることのテスト"""
+        with patch.object(AudioGenerator, "core_initialized", new_callable=PropertyMock, return_value=True):
+            prepared = self.audio_generator._prepare_conversation("Metan: こんにちは。\nZundamon: よろしくなのだ！", 0, None)
+
+        assert prepared is not None
+        conversation_parts, temp_dir = prepared
+        temp_dir.rmdir()
+        assert [speaker for speaker, _ in conversation_parts] == ["四国めたん", "ずんだもん"]
+
+    def test_prepare_conversation_converts_whole_script_before_parsing(self):
+        """息継ぎの空白がテキスト全体を変換してから解析した結果と一致することのテスト"""
+        podcast_text = "ずんだもん: LLM GPT is LLMofにゃmodel is\n四国めたん:LLMdata\nずんだもん：ですthe model"
+        mock_converter = MagicMock()
+        mock_converter.convert_batch.side_effect = lambda words: {word: f"[{word}]" for word in words}
+
+        with (
+            patch("yomitalk.components.audio_generator.get_global_katakana_converter", return_value=mock_converter),
+            patch.object(AudioGenerator, "core_initialized", new_callable=PropertyMock, return_value=True),
+        ):
+            prepared = self.audio_generator._prepare_conversation(podcast_text, 0, None)
+            expected = self.audio_generator._extract_conversation_parts(self.audio_generator._convert_english_to_katakana(podcast_text))
+
+        assert prepared is not None
+        conversation_parts, temp_dir = prepared
+        temp_dir.rmdir()
+        assert conversation_parts == expected
+        assert conversation_parts[2] == ("ずんだもん", "ですザ [model]")
+
     @pytest.mark.parametrize(
         "text, expected",
         [
@@ -407,3 +1033,297 @@ class TestAudioGenerator:
         result = calculate_text_similarity(str1, str2)
         min_expected, max_expected = expected_similarity_range
         assert min_expected <= result <= max_expected, f"Similarity {result} not in range [{min_expected}, {max_expected}]"
+
+
+class TestVoicevoxCoreManagerAnalysisCache:
+    """Test class for the text analysis cache of VoicevoxCoreManager."""
+
+    def setup_method(self):
+        """Create a manager with a mocked synthesizer."""
+        from dataclasses import dataclass, field
+
+        @dataclass
+        class FakeAudioQuery:
+            accent_phrases: list = field(default_factory=list)
+            speed_scale: float = 1.0
+
+        self.fake_query_class = FakeAudioQuery
+        with patch.object(VoicevoxCoreManager, "_init_voicevox_core"):
+            self.manager = VoicevoxCoreManager()
+        self.manager.utterance_cache = None
+        self.manager.voice_model_index = {2: Path("0.vvm"), 3: Path("0.vvm")}
+        patch.object(self.manager, "_ensure_voice_model", return_value=True).start()
+        self.synthesizer = MagicMock()
+        self.synthesizer.create_audio_query.side_effect = lambda text, style_id: FakeAudioQuery(accent_phrases=[f"{text}:{style_id}"])
+        self.synthesizer.replace_mora_data.side_effect = lambda accent_phrases, style_id: [f"{accent_phrases[0]}->{style_id}"]
+        self.synthesizer.synthesis.return_value = b"wav"
+        self.manager.core_synthesizer = self.synthesizer
+
+    def teardown_method(self):
+        """Stop patches."""
+        patch.stopall()
+
+    def test_speed_change_skips_analysis(self):
+        """同じテキストの再合成ではテキスト解析を再実行しないことのテスト"""
+        synthesizer = self.synthesizer
+
+        assert self.manager.text_to_speech("こんにちは", 3) == b"wav"
+        assert self.manager.text_to_speech("こんにちは", 3) == b"wav"
+
+        synthesizer.create_audio_query.assert_called_once_with("こんにちは", 3)
+        # キャッシュされたクエリは変更されず、速度はコピーに設定される
+        cached_query = self.manager.audio_query_cache.get("こんにちは", 3, self.manager.dictionary_version)
+        assert cached_query is not None
+        assert cached_query.speed_scale == 1.0
+        synthesized_query = synthesizer.synthesis.call_args[0][0]
+        assert synthesized_query.speed_scale == 1.1
+
+    def test_style_swap_reuses_accent_phrases(self):
+        """話者を変更した場合はモーラ情報の置き換えのみ行うことのテスト"""
+        synthesizer = self.synthesizer
+
+        self.manager.text_to_speech("こんにちは", 3)
+        self.manager.text_to_speech("こんにちは", 2)
+
+        synthesizer.create_audio_query.assert_called_once_with("こんにちは", 3)
+        synthesizer.replace_mora_data.assert_called_once_with(["こんにちは:3"], 2)
+        synthesized_query = synthesizer.synthesis.call_args[0][0]
+        assert synthesized_query.accent_phrases == ["こんにちは:3->2"]
+
+    def test_text_to_speech_async_matches_blocking_api(self):
+        """非同期APIが同期APIと同じ結果を返すことのテスト"""
+        import asyncio
+
+        assert asyncio.run(self.manager.text_to_speech_async("こんにちは", 3)) == b"wav"
+        self.synthesizer.create_audio_query.assert_called_once_with("こんにちは", 3)
+
+
+class TestVoicevoxCoreManagerModelLoading:
+    """Test class for lazy voice model loading of VoicevoxCoreManager."""
+
+    def setup_method(self):
+        """Create a manager with a mocked synthesizer and three model files."""
+        with patch.object(VoicevoxCoreManager, "_init_voicevox_core"):
+            self.manager = VoicevoxCoreManager()
+        self.manager.utterance_cache = None
+        self.synthesizer = MagicMock()
+        self.synthesizer.create_audio_query.return_value = MagicMock()
+        self.synthesizer.synthesis.return_value = b"wav"
+        self.manager.core_synthesizer = self.synthesizer
+        self.manager.voice_model_index = {3: Path("0.vvm"), 2: Path("0.vvm"), 16: Path("2.vvm"), 61: Path("3.vvm")}
+
+    def _open_model(self, path):
+        model = MagicMock()
+        model.id = f"id-{Path(path).name}"
+        model.__enter__.return_value = model
+        return model
+
+    def test_models_are_loaded_on_first_use(self):
+        """音声モデルは最初に使用された時にのみ読み込まれることのテスト"""
+        with patch("yomitalk.components.audio_generator.VoiceModelFile") as model_file:
+            model_file.open.side_effect = self._open_model
+            assert self.manager.get_loaded_model_files() == []
+
+            self.manager.text_to_speech("こんにちは", 3)
+            self.manager.text_to_speech("こんばんは", 2)
+
+        assert model_file.open.call_count == 1
+        assert self.manager.get_loaded_model_files() == ["0.vvm"]
+
+    def test_least_recently_used_model_is_unloaded(self):
+        """常駐モデル数の上限を超えた場合に最も長く使われていないモデルが解放されることのテスト"""
+        with patch("yomitalk.components.audio_generator.VoiceModelFile") as model_file, patch("yomitalk.components.audio_generator.MAX_LOADED_VOICE_MODELS", 2):
+            model_file.open.side_effect = self._open_model
+            self.manager.text_to_speech("一", 3)
+            self.manager.text_to_speech("二", 16)
+            self.manager.text_to_speech("三", 3)
+            self.manager.text_to_speech("四", 61)
+
+        self.synthesizer.unload_voice_model.assert_called_once_with("id-2.vvm")
+        assert self.manager.get_loaded_model_files() == ["0.vvm", "3.vvm"]
+
+    def test_unknown_style_returns_empty_audio(self):
+        """モデルが存在しないスタイルIDの場合は空の音声データを返すことのテスト"""
+        assert self.manager.text_to_speech("こんにちは", 9999) == b""
+        self.synthesizer.synthesis.assert_not_called()
+
+
+class TestVoicevoxCoreManagerDictionaryReload:
+    """Test class for hot reloading of the user dictionary."""
+
+    def setup_method(self):
+        """Create a manager whose user dictionary points at a temporary file."""
+        with patch.object(VoicevoxCoreManager, "_init_voicevox_core"):
+            self.manager = VoicevoxCoreManager()
+        self.open_jtalk = MagicMock()
+        self.manager.open_jtalk = self.open_jtalk
+        self.user_dict_patch = patch("yomitalk.components.audio_generator.UserDict")
+        self.mock_user_dict_class = self.user_dict_patch.start()
+
+    def teardown_method(self):
+        """Stop patches."""
+        self.user_dict_patch.stop()
+
+    def _write_dictionary(self, path, surfaces):
+        """Write a dictionary file and make UserDict report the given surface forms."""
+        path.write_text(",".join(surfaces), encoding="utf-8")
+        self.mock_user_dict_class.return_value.to_dict.return_value = {i: MagicMock(surface=surface, pronunciation="ヨミ") for i, surface in enumerate(surfaces)}
+
+    def test_changed_dictionary_is_swapped_in(self, tmp_path):
+        """辞書ファイルの変更時に辞書・単語・バージョンが差し替えられ解析キャッシュが破棄されることのテスト"""
+        dict_path = tmp_path / "user_dictionary.json"
+        self._write_dictionary(dict_path, ["ＧＰＴ"])
+        with patch.object(VoicevoxCoreManager, "USER_DICT_PATH", dict_path):
+            assert self.manager.reload_user_dictionary() is True
+            first_version = self.manager.dictionary_version
+            assert self.manager.is_word_in_user_dict("GPT")
+
+            self.manager.audio_query_cache.put("こんにちは", 3, first_version, object())
+            # 変更がなければ再読み込みしない
+            assert self.manager.reload_user_dictionary() is False
+
+            self._write_dictionary(dict_path, ["ＬＬＭ", "ＡＰＩ"])
+            os.utime(dict_path, ns=(dict_path.stat().st_atime_ns, dict_path.stat().st_mtime_ns + 1_000_000))
+            assert self.manager.reload_user_dictionary() is True
+
+        assert self.manager.dictionary_version != first_version
+        assert self.manager.is_word_in_user_dict("LLM")
+        assert not self.manager.is_word_in_user_dict("GPT")
+        assert self.manager.audio_query_cache.get_any_style("こんにちは", first_version) is None
+        assert self.open_jtalk.use_user_dict.call_count == 2
+
+    def test_broken_dictionary_keeps_current_one(self, tmp_path):
+        """読み込みに失敗した場合は現在の辞書を使い続けることのテスト"""
+        dict_path = tmp_path / "user_dictionary.json"
+        self._write_dictionary(dict_path, ["ＧＰＴ"])
+        with patch.object(VoicevoxCoreManager, "USER_DICT_PATH", dict_path):
+            self.manager.reload_user_dictionary()
+            version = self.manager.dictionary_version
+
+            self.mock_user_dict_class.return_value.load.side_effect = ValueError("broken")
+            dict_path.write_text("broken", encoding="utf-8")
+            assert self.manager.reload_user_dictionary() is False
+
+        assert self.manager.dictionary_version == version
+        assert self.manager.is_word_in_user_dict("GPT")
+
+
+class TestVoicevoxCoreManagerStreamingRender:
+    """Test class for frame-streaming synthesis of VoicevoxCoreManager."""
+
+    def setup_method(self):
+        """Create a manager with a mocked synthesizer that supports incremental rendering."""
+        with patch.object(VoicevoxCoreManager, "_init_voicevox_core"):
+            self.manager = VoicevoxCoreManager()
+        self.utterance_cache = MagicMock()
+        self.utterance_cache.get.return_value = None
+        self.manager.utterance_cache = self.utterance_cache
+        self.manager.voice_model_index = {3: Path("0.vvm")}
+        patch.object(self.manager, "_ensure_voice_model", return_value=True).start()
+        patch.object(self.manager, "_get_audio_query", return_value=MagicMock()).start()
+        self.manager.core_synthesizer = MagicMock()
+        self.manager.core_synthesizer.precompute_render.return_value = MagicMock(frame_length=200)
+        self.manager.core_synthesizer.render.side_effect = lambda feature, start, stop: f"{start}-{stop}".encode()
+
+    def teardown_method(self):
+        """Stop patches."""
+        patch.stopall()
+
+    def test_renders_fixed_size_windows(self):
+        """音声がフレーム単位のウィンドウごとに生成されることのテスト"""
+        with (
+            patch("yomitalk.components.audio_generator.dataclasses.replace", side_effect=lambda query, **kwargs: query),
+            patch("yomitalk.components.audio_generator.combine_wav_data", side_effect=b"".join),
+        ):
+            windows = list(self.manager.text_to_speech_stream("こんにちは", 3, window_frames=94))
+
+        assert windows == [(b"0-94", False), (b"94-188", False), (b"188-200", True)]
+        # 全ウィンドウを結合した音声が発話キャッシュに保存される
+        self.utterance_cache.put.assert_called_once()
+        assert self.utterance_cache.put.call_args[0][1] == b"0-9494-188188-200"
+
+    def test_falls_back_to_whole_synthesis_without_render_support(self):
+        """逐次生成に未対応の場合は発話全体を一度に合成することのテスト"""
+        self.manager.core_synthesizer = MagicMock(spec=["synthesis"])
+        with patch.object(self.manager, "text_to_speech", return_value=b"wav") as mock_tts:
+            windows = list(self.manager.text_to_speech_stream("こんにちは", 3))
+
+        assert windows == [(b"wav", True)]
+        mock_tts.assert_called_once_with("こんにちは", 3)
+
+
+class TestVoicevoxCoreManagerWarmup:
+    """Test class for the startup warmup of VoicevoxCoreManager."""
+
+    def setup_method(self):
+        """Create an initialized manager with a mocked synthesizer."""
+        import io
+        import wave
+        from dataclasses import dataclass, field
+
+        @dataclass
+        class FakeAudioQuery:
+            accent_phrases: list = field(default_factory=list)
+
+        self.fake_query_class = FakeAudioQuery
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(24000)
+            wav_file.writeframes(b"\x00\x00" * 24000)
+
+        with patch.object(VoicevoxCoreManager, "_init_voicevox_core"):
+            self.manager = VoicevoxCoreManager()
+        self.manager.core_initialized = True
+        self.manager.voice_model_index = {3: Path("0.vvm"), 2: Path("0.vvm"), 108: Path("21.vvm")}
+        self.manager._loaded_models[Path("0.vvm")] = "id-0"
+        patch.object(self.manager, "_ensure_voice_model", return_value=True).start()
+        self.synthesizer = MagicMock()
+        self.synthesizer.create_audio_query.side_effect = lambda text, style_id: self.fake_query_class(accent_phrases=[text])
+        self.synthesizer.synthesis.return_value = buffer.getvalue()
+        self.manager.core_synthesizer = self.synthesizer
+
+    def teardown_method(self):
+        """Stop patches."""
+        patch.stopall()
+
+    def test_warmup_synthesizes_loaded_styles_and_becomes_ready(self):
+        """ウォームアップで読み込み済みモデルの各スタイルを合成し、準備完了になることのテスト"""
+        assert not self.manager.is_ready()
+
+        mock_converter = MagicMock()
+        with patch("yomitalk.components.audio_generator.get_global_katakana_converter", return_value=mock_converter):
+            self.manager._warmup()
+
+        mock_converter.convert.assert_called_once_with("warmup")
+        assert sorted(call.args[1] for call in self.synthesizer.synthesis.call_args_list) == [2, 3]
+        assert set(self.manager.warmup_rtf) == {2, 3}
+        assert self.manager.is_ready()
+        assert self.manager.get_status()["state"] == "ready"
+
+    def test_warmup_failure_still_marks_ready(self):
+        """ウォームアップが失敗しても音声生成を妨げないことのテスト"""
+        self.synthesizer.synthesis.side_effect = RuntimeError("boom")
+
+        with patch("yomitalk.components.audio_generator.get_global_katakana_converter"):
+            self.manager._warmup()
+
+        assert self.manager.is_ready()
+        assert self.manager.warmup_rtf == {}
+
+    def test_start_warmup_without_core(self):
+        """VOICEVOX Coreが初期化されていない場合は準備完了にならないことのテスト"""
+        self.manager.core_initialized = False
+        self.manager.start_warmup()
+
+        assert self.manager.warmup_state == "unavailable"
+        assert not self.manager.wait_until_ready(timeout=0)
+
+    def test_start_warmup_disabled(self):
+        """ウォームアップ無効時は即座に準備完了になることのテスト"""
+        with patch("yomitalk.components.audio_generator.WARMUP_ENABLED", False):
+            self.manager.start_warmup()
+
+        assert self.manager.is_ready()
@@ -0,0 +1,194 @@
+"""Unit tests for audio post-processing utilities."""
+
+import io
+import wave
+
+import numpy as np
+
+from yomitalk.utils.audio_postprocess import AudioPostProcessor, apply_gain, pan_to_stereo, resample, trim_silence, voiced_rms
+
+FRAMERATE = 24000
+
+
+def make_wav(samples: np.ndarray, framerate: int = FRAMERATE) -> bytes:
+    """Create mono 16-bit WAV data from samples."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def read_samples(wav_data: bytes) -> np.ndarray:
+    """Read the samples of mono 16-bit WAV data."""
+    with wave.open(io.BytesIO(wav_data), "rb") as wav_file:
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype="<i2")
+
+
+def read_format(wav_data: bytes) -> tuple:
+    """Read the (channels, sampling rate, frames) of WAV data."""
+    with wave.open(io.BytesIO(wav_data), "rb") as wav_file:
+        return wav_file.getnchannels(), wav_file.getframerate(), wav_file.getnframes()
+
+
+def sine(frequency: float, frames: int, framerate: int = FRAMERATE, amplitude: int = 10000) -> np.ndarray:
+    """Create a sine wave shaped (frames, 1)."""
+    return (amplitude * np.sin(2 * np.pi * frequency * np.arange(frames) / framerate)).astype(np.int16).reshape(-1, 1)
+
+
+def tone(amplitude: int, frames: int) -> np.ndarray:
+    """Create a square wave of the given amplitude."""
+    return np.where(np.arange(frames) % 2 == 0, amplitude, -amplitude).astype(np.int16)
+
+
+class TestAudioPostprocessFunctions:
+    """Test class for the post-processing functions."""
+
+    def test_trim_silence_keeps_margin_around_voiced_part(self):
+        """Test that leading and trailing silence is trimmed down to the margin."""
+        samples = np.concatenate([np.zeros(2400, np.int16), tone(3000, 4800), np.zeros(2400, np.int16)]).reshape(-1, 1)
+
+        trimmed = trim_silence(samples, FRAMERATE, margin_seconds=0.01)
+
+        assert len(trimmed) == 4800 + 2 * 240
+        assert np.abs(trimmed[:240]).max() == 0
+        assert np.abs(trimmed[240:-240]).min() == 3000
+
+    def test_trim_silence_empties_silent_turn(self):
+        """Test that an entirely silent turn is trimmed to nothing."""
+        assert len(trim_silence(np.zeros((4800, 1), np.int16), FRAMERATE)) == 0
+
+    def test_voiced_rms_ignores_silence(self):
+        """Test that silent samples do not lower the measured loudness."""
+        samples = np.concatenate([tone(1000, 1000), np.zeros(9000, np.int16)]).reshape(-1, 1)
+        assert voiced_rms(samples) == 1000.0
+
+    def test_apply_gain_saturates(self):
+        """Test that gain saturates at the int16 range instead of wrapping around."""
+        gained = apply_gain(np.array([[20000], [-20000]], np.int16), 2.0)
+        assert gained.tolist() == [[32767], [-32768]]
+
+    def test_resample_keeps_speech_frequencies(self):
+        """Test that resampling keeps the duration and the frequency of speech-band content."""
+        resampled = resample(sine(1000, FRAMERATE), FRAMERATE, 16000)
+
+        assert resampled.shape == (16000, 1)
+        spectrum = np.abs(np.fft.rfft(resampled[:, 0]))
+        assert np.argmax(spectrum) == 1000
+        assert np.abs(resampled).max() > 9000
+
+    def test_resample_filters_content_above_new_nyquist(self):
+        """Test that content above the new Nyquist frequency is removed instead of aliased."""
+        resampled = resample(sine(10000, FRAMERATE), FRAMERATE, 16000)
+        assert np.abs(resampled[100:-100]).max() < 500
+
+    def test_pan_to_stereo(self):
+        """Test that panning places the mono signal on the requested side."""
+        samples = np.full((10, 1), 10000, np.int16)
+
+        center = pan_to_stereo(samples, 0.0)
+        left = pan_to_stereo(samples, -1.0)
+
+        assert center.shape == (10, 2)
+        assert center[0].tolist() == [10000, 10000]
+        assert left[0, 0] > 14000
+        assert left[0, 1] == 0
+
+
+class TestAudioPostProcessor:
+    """Test class for AudioPostProcessor."""
+
+    def test_pause_depends_on_speaker_change(self):
+        """Test that pauses differ between speaker changes and consecutive turns of a speaker."""
+        processor = AudioPostProcessor(speaker_change_pause=0.5, same_speaker_pause=0.1, enabled=True)
+        wav_data = make_wav(tone(3000, 2400))
+
+        first = read_samples(processor.process_turn(wav_data, "A"))
+        same = read_samples(processor.process_turn(wav_data, "A", previous_speaker="A"))
+        change = read_samples(processor.process_turn(wav_data, "B", previous_speaker="A"))
+
+        assert len(first) == 2400
+        assert len(same) == 2400 + int(0.1 * FRAMERATE)
+        assert len(change) == 2400 + int(0.5 * FRAMERATE)
+        assert np.abs(change[: int(0.5 * FRAMERATE)]).max() == 0
+
+    def test_characters_are_normalized_to_target_loudness(self):
+        """Test that quiet and loud characters are levelled to the target loudness."""
+        processor = AudioPostProcessor(target_loudness_dbfs=-20, max_gain_db=20, enabled=True)
+
+        quiet = read_samples(processor.process_turn(make_wav(tone(1000, 2400)), "A"))
+        loud = read_samples(processor.process_turn(make_wav(tone(10000, 2400)), "B"))
+
+        target = 32768 * 10 ** (-20 / 20)
+        assert abs(np.abs(quiet).mean() - target) < 1
+        assert abs(np.abs(loud).mean() - target) < 1
+
+    def test_observed_loudness_counts_like_processed_turns(self):
+        """Test that feeding the loudness of a turn that is not processed again gives later turns the same gain."""
+        processed = AudioPostProcessor(target_loudness_dbfs=-20, max_gain_db=20, enabled=True)
+        observed = AudioPostProcessor(target_loudness_dbfs=-20, max_gain_db=20, enabled=True)
+
+        processed.process_turn(make_wav(tone(8000, 2400)), "A")
+        assert processed.last_turn_loudness == 8000
+        observed.observe_loudness("A", processed.last_turn_loudness)
+
+        quiet = make_wav(tone(1000, 2400))
+        assert observed.process_turn(quiet, "A") == processed.process_turn(quiet, "A")
+
+    def test_gain_is_limited(self):
+        """Test that the gain never exceeds max_gain_db."""
+        processor = AudioPostProcessor(target_loudness_dbfs=-20, max_gain_db=6, enabled=True)
+        processed = read_samples(processor.process_turn(make_wav(tone(300, 2400)), "A"))
+        assert np.abs(processed).max() == round(300 * 10 ** (6 / 20))
+
+    def test_disabled_returns_input(self):
+        """Test that a disabled post-processor returns turns unchanged."""
+        wav_data = make_wav(np.concatenate([np.zeros(2400, np.int16), tone(100, 2400)]))
+        assert AudioPostProcessor(enabled=False).process_turn(wav_data, "A", previous_speaker="B") == wav_data
+
+    def test_non_16bit_audio_is_returned_unchanged(self):
+        """Test that audio other than 16-bit PCM is passed through."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(1)
+            wav_file.setframerate(FRAMERATE)
+            wav_file.writeframes(b"\x80" * 100)
+        assert AudioPostProcessor(enabled=True).process_turn(buffer.getvalue(), "A") == buffer.getvalue()
+
+    def test_turns_are_converted_to_output_format(self):
+        """Test that turns are resampled and characters are panned to opposite sides."""
+        processor = AudioPostProcessor(speaker_change_pause=0.5, enabled=True, output_sample_rate=16000, stereo=True, stereo_pan=0.5)
+
+        first = processor.process_turn(make_wav(sine(500, 2400)), "ずんだもん")
+        second = processor.process_turn(make_wav(sine(500, 2400)), "四国めたん", previous_speaker="ずんだもん")
+
+        assert read_format(first) == (2, 16000, 1600)
+        assert read_format(second) == (2, 16000, 1600 + 8000)
+        first_levels = np.abs(read_samples(first).reshape(-1, 2)).sum(axis=0)
+        second_levels = np.abs(read_samples(second).reshape(-1, 2)).sum(axis=0)
+        assert first_levels[0] > first_levels[1]
+        assert second_levels[0] < second_levels[1]
+
+    def test_pan_position_does_not_depend_on_turn_order(self):
+        """Test that a processor whose first turn is another character (resume, reuse) keeps every character on its side."""
+        first_job = AudioPostProcessor(stereo=True, stereo_pan=0.5)
+        resumed_job = AudioPostProcessor(stereo=True, stereo_pan=0.5)
+
+        first_job.process_turn(make_wav(sine(500, 2400)), "ずんだもん")
+        resumed = resumed_job.process_turn(make_wav(sine(500, 2400)), "四国めたん")
+        resumed_levels = np.abs(read_samples(resumed).reshape(-1, 2)).sum(axis=0)
+
+        assert resumed_levels[0] < resumed_levels[1]
+        assert first_job._pan_for("ずんだもん") == resumed_job._pan_for("ずんだもん") == -0.5
+        assert first_job._pan_for("四国めたん") == resumed_job._pan_for("四国めたん") == 0.5
+        # Speakers that are not characters stay in the center
+        assert resumed_job._pan_for("A") == 0.0
+
+    def test_output_format_is_applied_when_disabled(self):
+        """Test that the output format is applied even when trimming and normalization are disabled."""
+        wav_data = make_wav(np.concatenate([np.zeros(2400, np.int16), tone(3000, 2400)]))
+        processed = AudioPostProcessor(enabled=False, output_sample_rate=16000).process_turn(wav_data, "A", previous_speaker="B")
+        assert read_format(processed) == (1, 16000, 3200)
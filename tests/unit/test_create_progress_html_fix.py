@@ -106,3 +106,34 @@ class TestCreateProgressHtmlFix:
 
         assert isinstance(result, str)
         assert "Zero total" in result
+
+    def test_queue_status_shown_when_sharing_engine(self):
+        """Queue depth and waiting time are shown while other sessions are generating."""
+        queue_status = {"queue_depth": 2, "total_queued": 7, "active_sessions": 3, "average_wait": 1.25}
+
+        result = self.app._create_progress_html(3, 10, "Test status", start_time=time.time(), queue_status=queue_status)
+        assert "待ち行列: 2件 (全体 7件)" in result
+        assert "平均待ち: 1.2秒" in result
+
+        # Not shown when this session is the only one, or when completed
+        alone = dict(queue_status, active_sessions=1)
+        assert "待ち行列" not in self.app._create_progress_html(3, 10, "Test status", queue_status=alone)
+        assert "待ち行列" not in self.app._create_progress_html(10, 10, "Done", is_completed=True, queue_status=queue_status)
+
+    def test_predicted_remaining_time_and_duration(self):
+        """Predicted remaining time and total duration are shown instead of the part-count estimate."""
+        result = self.app._create_progress_html(0, 10, "Test status", start_time=time.time(), remaining_seconds=125.0, total_audio_seconds=610.0)
+        assert "推定残り: 02:05" in result
+        assert "総再生時間: 約10:10" in result
+
+        assert "総再生時間" not in self.app._create_progress_html(10, 10, "Done", is_completed=True, start_time=time.time(), total_audio_seconds=610.0)
+
+    def test_remaining_time_is_slowed_by_observed_pace(self):
+        """The observed pace of the job only slows the predicted remaining time down."""
+        turn_estimates = [(1.0, 2.0), (1.0, 2.0), (1.0, 6.0)]
+        # Two parts predicted at 4 seconds took 8 seconds: the remaining 6 seconds are doubled
+        assert self.app._estimate_remaining_seconds(turn_estimates, 0, 2, 8.0) == 12.0
+        # Faster than predicted (e.g. reused parts): the prediction is kept
+        assert self.app._estimate_remaining_seconds(turn_estimates, 0, 2, 1.0) == 6.0
+        # Restored parts before the job started are not part of the pace
+        assert self.app._estimate_remaining_seconds(turn_estimates, 1, 2, 4.0) == 12.0
@@ -0,0 +1,101 @@
+"""Unit tests for the HLS segmenter."""
+
+import stat
+import wave
+
+from yomitalk.components.hls_segmenter import HlsPlaylistRegistry, HlsSegmenter
+
+
+def _write_wav(path, num_frames, framerate=1000, sample=b"\x01\x00"):
+    """Write a mono 16-bit WAV file with num_frames frames."""
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(sample * num_frames)
+    return path
+
+
+def _fake_ffmpeg(tmp_path, body='cat > "$(dirname "$0")/input.pcm"'):
+    """Write a shell script standing in for ffmpeg that records its arguments and runs body."""
+    path = tmp_path / "ffmpeg"
+    path.write_text(f'#!/bin/sh\necho "$@" > "$(dirname "$0")/args.txt"\n{body}\n')
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+class TestHlsSegmenter:
+    """Test class for HlsSegmenter."""
+
+    def test_parts_are_streamed_into_one_hls_muxer(self, tmp_path):
+        """All parts go through a single ffmpeg HLS muxer, so timestamps stay continuous across segments."""
+        segmenter = HlsSegmenter(tmp_path / "hls", _fake_ffmpeg(tmp_path), segment_seconds=1.0)
+
+        assert segmenter.append_file(_write_wav(tmp_path / "part_000.wav", 1500))
+        assert segmenter.append_file(_write_wav(tmp_path / "part_001.wav", 500, sample=b"\x02\x00"))
+        segmenter.finish()
+
+        args = (tmp_path / "args.txt").read_text().split()
+        assert args[args.index("-f") + 1] == "s16le"
+        assert args[args.index("-ar") + 1] == "1000"
+        assert args[args.index("-hls_time") + 1] == "1"
+        assert args[args.index("-hls_playlist_type") + 1] == "event"
+        assert args[-1] == str(segmenter.playlist_path)
+        assert (tmp_path / "input.pcm").read_bytes() == b"\x01\x00" * 1500 + b"\x02\x00" * 500
+        # Nothing is appended after the playlist has ended
+        assert not segmenter.append_file(tmp_path / "part_001.wav")
+
+    def test_parts_of_another_format_are_converted(self, tmp_path):
+        """Parts are converted to the format of the first part before being streamed."""
+        segmenter = HlsSegmenter(tmp_path / "hls", _fake_ffmpeg(tmp_path), segment_seconds=1.0)
+
+        segmenter.append_file(_write_wav(tmp_path / "part_000.wav", 10, framerate=1000))
+        segmenter.append_file(_write_wav(tmp_path / "part_001.wav", 20, framerate=2000))
+        segmenter.finish()
+
+        assert len((tmp_path / "input.pcm").read_bytes()) == 2 * (10 + 10)
+
+    def test_failed_ffmpeg_stops_segmenting(self, tmp_path):
+        """When ffmpeg exits early, later parts are rejected instead of raising."""
+        segmenter = HlsSegmenter(tmp_path / "hls", _fake_ffmpeg(tmp_path, "exit 1"), segment_seconds=1.0)
+        part = _write_wav(tmp_path / "part_000.wav", 100000)
+
+        results = [segmenter.append_file(part) for _ in range(5)]
+        segmenter.finish()
+
+        assert results[-1] is False
+
+    def test_abort_stops_ffmpeg(self, tmp_path):
+        """Aborting an interrupted generation kills ffmpeg."""
+        segmenter = HlsSegmenter(tmp_path / "hls", _fake_ffmpeg(tmp_path, "sleep 30"), segment_seconds=1.0)
+        segmenter.append_file(_write_wav(tmp_path / "part_000.wav", 10))
+
+        segmenter.abort()
+
+        assert segmenter._process is not None and segmenter._process.poll() is not None
+        assert not segmenter.append_file(tmp_path / "part_000.wav")
+
+
+class TestHlsPlaylistRegistry:
+    """Test class for HlsPlaylistRegistry."""
+
+    def test_only_files_of_the_registered_directory_are_served(self, tmp_path):
+        """A token only gives access to the playlist and segments of its own directory."""
+        own, other = tmp_path / "session_a", tmp_path / "session_b"
+        for directory in (own, other):
+            directory.mkdir()
+            (directory / "playlist.m3u8").write_text("#EXTM3U\n")
+            (directory / "segment_00000.ts").write_bytes(b"ts")
+        (own / "audio.wav").write_bytes(b"wav")
+        registry = HlsPlaylistRegistry()
+        token = registry.register(own)
+
+        assert registry.resolve(token, "playlist.m3u8") == own / "playlist.m3u8"
+        assert registry.resolve(token, "segment_00000.ts") == own / "segment_00000.ts"
+        assert registry.resolve(token, "segment_00001.ts") is None
+        assert registry.resolve(token, "audio.wav") is None
+        assert registry.resolve(token, "../session_b/playlist.m3u8") is None
+        assert registry.resolve("unknown", "playlist.m3u8") is None
+
+        registry.release(token)
+        assert registry.resolve(token, "playlist.m3u8") is None
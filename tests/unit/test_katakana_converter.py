@@ -0,0 +1,73 @@
+"""Unit tests for the memoized katakana converter."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from yomitalk.components.katakana_converter import E2K_VERSION, KatakanaConverter
+
+
+def make_fake_e2k() -> MagicMock:
+    """Create a fake e2k module whose converter returns marked words."""
+    fake_e2k = MagicMock()
+    fake_e2k.C2K.return_value.side_effect = lambda word: f"<{word}>"
+    return fake_e2k
+
+
+class TestKatakanaConverter:
+    """Test class for KatakanaConverter."""
+
+    def test_batch_converts_each_unique_word_once(self):
+        """Test that repeated words are converted once and the model is created once."""
+        fake_e2k = make_fake_e2k()
+        with patch("yomitalk.components.katakana_converter.e2k", fake_e2k):
+            converter = KatakanaConverter()
+            result = converter.convert_batch(["model", "Transformer", "model", "model"])
+            converter.convert_batch(["model", "attention"])
+
+        assert result == {"model": "<model>", "Transformer": "<Transformer>"}
+        fake_e2k.C2K.assert_called_once()
+        assert [call.args[0] for call in fake_e2k.C2K.return_value.call_args_list] == ["model", "Transformer", "attention"]
+        assert (converter.hits, converter.misses) == (1, 3)
+
+    def test_memo_table_is_bounded(self):
+        """Test that the least recently used words are evicted."""
+        fake_e2k = make_fake_e2k()
+        with patch("yomitalk.components.katakana_converter.e2k", fake_e2k):
+            converter = KatakanaConverter(max_entries=2)
+            converter.convert_batch(["one", "two"])
+            converter.convert("one")
+            converter.convert("three")
+            converter.convert("two")
+
+        assert fake_e2k.C2K.return_value.call_count == 4
+        assert list(converter._memo) == ["three", "two"]
+
+    def test_memo_table_is_persisted(self, tmp_path):
+        """Test that conversions survive a restart when a memo path is configured."""
+        memo_path = tmp_path / "cache" / "katakana.json"
+        fake_e2k = make_fake_e2k()
+        with patch("yomitalk.components.katakana_converter.e2k", fake_e2k):
+            KatakanaConverter(memo_path=str(memo_path)).convert_batch(["model", "data"])
+            restarted = KatakanaConverter(memo_path=str(memo_path))
+            result = restarted.convert_batch(["model", "data"])
+
+        assert result == {"model": "<model>", "data": "<data>"}
+        assert fake_e2k.C2K.return_value.call_count == 2
+        assert json.loads(memo_path.read_text(encoding="utf-8"))["e2k_version"] == E2K_VERSION
+
+    def test_memo_of_other_e2k_version_is_ignored(self, tmp_path):
+        """Test that a memo written by another e2k version is not reused."""
+        memo_path = tmp_path / "katakana.json"
+        memo_path.write_text(json.dumps({"e2k_version": "0.0.0-other", "words": {"model": "モデ"}}), encoding="utf-8")
+
+        with patch("yomitalk.components.katakana_converter.e2k", make_fake_e2k()):
+            converter = KatakanaConverter(memo_path=str(memo_path))
+            assert converter.convert("model") == "<model>"
+
+    def test_corrupt_memo_is_ignored(self, tmp_path):
+        """Test that a corrupt memo file does not break conversion."""
+        memo_path = tmp_path / "katakana.json"
+        memo_path.write_text("{not json", encoding="utf-8")
+
+        with patch("yomitalk.components.katakana_converter.e2k", make_fake_e2k()):
+            assert KatakanaConverter(memo_path=str(memo_path)).convert("model") == "<model>"
@@ -0,0 +1,78 @@
+"""Unit tests for metrics module."""
+
+import pytest
+
+from yomitalk.utils.metrics import DEFAULT_AUDIO_SECONDS_PER_CHAR, DEFAULT_CHARS_PER_SECOND, LatencyRecorder, ThroughputModel
+
+
+class TestLatencyRecorder:
+    """Test class for LatencyRecorder."""
+
+    def test_percentiles(self):
+        """Percentiles use the nearest-rank method over recent samples."""
+        recorder = LatencyRecorder("test", log_interval=1000)
+        for seconds in range(1, 101):
+            recorder.record(float(seconds))
+
+        assert recorder.percentile(50) == 50.0
+        assert recorder.percentile(95) == 95.0
+        assert recorder.summary() == {"samples": 100.0, "p50": 50.0, "p95": 95.0}
+
+    def test_window_keeps_recent_samples(self):
+        """Only the most recent samples are used."""
+        recorder = LatencyRecorder("test", window=2)
+        for seconds in [100.0, 1.0, 2.0]:
+            recorder.record(seconds)
+
+        assert recorder.percentile(100) == 2.0
+        assert recorder.count == 3
+
+    def test_empty(self):
+        """Percentiles are 0 before anything is recorded."""
+        assert LatencyRecorder("test").percentile(95) == 0.0
+
+
+class TestThroughputModel:
+    """Test class for ThroughputModel."""
+
+    def test_defaults_before_measurement(self):
+        """Unmeasured styles use the default throughput."""
+        model = ThroughputModel()
+        assert model.predict_audio_seconds(3, 100) == pytest.approx(100 * DEFAULT_AUDIO_SECONDS_PER_CHAR)
+        assert model.predict_synthesis_seconds(3, 100) == pytest.approx(100 / DEFAULT_CHARS_PER_SECOND)
+
+    def test_predictions_follow_measurements_per_style(self):
+        """Measurements are smoothed per style and moras are used when measured."""
+        model = ThroughputModel(smoothing=0.5)
+        model.record(3, chars=10, audio_seconds=2.0, wall_seconds=0.5, moras=20)
+        model.record(3, chars=10, audio_seconds=4.0, wall_seconds=1.5)
+
+        # 0.2 s/char then 0.4 s/char, 20 chars/s then ~6.7 chars/s
+        assert model.predict_audio_seconds(3, 100) == pytest.approx(30.0)
+        assert model.predict_synthesis_seconds(3, 40) == pytest.approx(40 / (20 + (10 / 1.5 - 20) / 2))
+        assert model.predict_audio_seconds(3, 100, moras=50) == pytest.approx(5.0)
+        # Other styles are unaffected
+        assert model.predict_audio_seconds(2, 100) == pytest.approx(100 * DEFAULT_AUDIO_SECONDS_PER_CHAR)
+        assert model.predict_audio_seconds(2, 100, moras=50) == pytest.approx(100 * DEFAULT_AUDIO_SECONDS_PER_CHAR)
+
+        audio_seconds, synthesis_seconds = model.predict_turns([(3, 10), (2, 20)])
+        assert audio_seconds == pytest.approx(3.0 + 20 * DEFAULT_AUDIO_SECONDS_PER_CHAR)
+
+    def test_empty_measurements_are_ignored(self):
+        """Empty text or audio does not change the model."""
+        model = ThroughputModel()
+        model.record(3, chars=0, audio_seconds=1.0, wall_seconds=1.0)
+        model.record(3, chars=10, audio_seconds=0.0, wall_seconds=1.0)
+        assert model.predict_audio_seconds(3, 10) == pytest.approx(10 * DEFAULT_AUDIO_SECONDS_PER_CHAR)
+
+    def test_backlog_of_running_jobs(self):
+        """The backlog is the remaining time of jobs that have not ended."""
+        model = ThroughputModel()
+        model.update_job("a", 30.0)
+        model.update_job("b", 10.0)
+        model.update_job("a", 20.0)
+        assert model.backlog_seconds() == pytest.approx(30.0)
+
+        model.end_job("a")
+        model.end_job("unknown")
+        assert model.backlog_seconds() == pytest.approx(10.0)
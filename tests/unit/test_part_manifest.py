@@ -0,0 +1,101 @@
+"""Unit tests for the part manifest."""
+
+import fcntl
+import json
+import os
+import threading
+
+from yomitalk.components.part_manifest import LOCK_FILENAME, MANIFEST_FILENAME, PartManifest, PartRecord, script_hash
+
+
+def make_record(generation, turn_index, path=None, script="script"):
+    """Create a part record."""
+    return PartRecord(generation, script_hash(script), turn_index, f"key{turn_index}", path or f"/tmp/{generation}/part_{turn_index:03d}.wav", 1000, 0.5)
+
+
+class TestPartManifest:
+    """Test class for PartManifest."""
+
+    def test_latest_generation_replaces_earlier_ones(self, tmp_path):
+        """Test that only the parts of the latest generation are returned, in turn order."""
+        manifest = PartManifest(tmp_path)
+        manifest.start_generation("stream_old", script_hash("old"), 3)
+        manifest.add_part(make_record("stream_old", 0, script="old"))
+        manifest.start_generation("stream_new", script_hash("script"), 3)
+        manifest.add_part(make_record("stream_new", 1))
+        manifest.add_part(make_record("stream_new", 0))
+        # Parts appended late by an earlier generation are ignored
+        manifest.add_part(make_record("stream_old", 2, script="old"))
+
+        assert [record.turn_index for record in manifest.latest_parts()] == [0, 1]
+        assert manifest.latest_parts()[0] == make_record("stream_new", 0)
+
+    def test_large_manifest_is_compacted_when_a_generation_starts(self, tmp_path):
+        """Test that the manifest stays append-only until it exceeds the size threshold, then keeps only the new generation."""
+        manifest = PartManifest(tmp_path, compact_bytes=2000)
+        manifest.start_generation("stream_0", script_hash("script"), 2)
+        manifest.add_part(make_record("stream_0", 0))
+        manifest.start_generation("stream_1", script_hash("script"), 2)
+        manifest.add_part(make_record("stream_1", 0))
+        assert len((tmp_path / MANIFEST_FILENAME).read_text(encoding="utf-8").splitlines()) == 4
+
+        for generation in range(2, 12):
+            manifest.start_generation(f"stream_{generation}", script_hash("script"), 2)
+            manifest.add_part(make_record(f"stream_{generation}", 0))
+            manifest.add_part(make_record(f"stream_{generation}", 1))
+
+        assert (tmp_path / MANIFEST_FILENAME).stat().st_size < 2000 + 1000
+        assert [record.generation for record in manifest.latest_parts()] == ["stream_11", "stream_11"]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_part_added_during_compaction_is_kept(self, tmp_path):
+        """Test that a part appended while another process compacts waits for the lock and lands in the compacted file."""
+        manifest = PartManifest(tmp_path, compact_bytes=0)
+        manifest.start_generation("stream_1", script_hash("script"), 2)
+
+        with open(tmp_path / LOCK_FILENAME, "a") as lock_file:
+            # Another process holds the lock while it replaces the manifest
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            writer = threading.Thread(target=manifest.add_part, args=(make_record("stream_1", 0),))
+            writer.start()
+            writer.join(timeout=0.2)
+            assert writer.is_alive()
+            compacted = tmp_path / "compacted.tmp"
+            compacted.write_text((tmp_path / MANIFEST_FILENAME).read_text(encoding="utf-8"), encoding="utf-8")
+            os.replace(compacted, tmp_path / MANIFEST_FILENAME)
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        writer.join(timeout=5)
+
+        assert [record.turn_index for record in manifest.latest_parts()] == [0]
+
+    def test_records_without_loudness_are_read(self, tmp_path):
+        """Test that part records written before the loudness was recorded are still read."""
+        manifest = PartManifest(tmp_path)
+        manifest.start_generation("stream_1", script_hash("script"), 2)
+        manifest.add_part(make_record("stream_1", 0))
+        legacy = {"event": "part", "generation": "stream_1", "script_hash": script_hash("script"), "turn_index": 1, "turn_key": "key1", "path": "/tmp/part_001.wav", "size": 1000, "duration": 0.5}
+        with open(tmp_path / MANIFEST_FILENAME, "a", encoding="utf-8") as f:
+            f.write(json.dumps(legacy) + "\n")
+
+        assert [record.loudness for record in manifest.latest_parts()] == [0.0, 0.0]
+
+    def test_parts_are_filtered_by_script(self, tmp_path):
+        """Test that parts of another script are not returned when a script hash is given."""
+        manifest = PartManifest(tmp_path)
+        manifest.start_generation("stream_1", script_hash("script"), 1)
+        manifest.add_part(make_record("stream_1", 0))
+
+        assert len(manifest.latest_parts(script_hash("script"))) == 1
+        assert manifest.latest_parts(script_hash("edited script")) == []
+
+    def test_missing_and_truncated_manifest(self, tmp_path):
+        """Test that a missing manifest has no parts and a line cut off by a crash is skipped."""
+        manifest = PartManifest(tmp_path)
+        assert manifest.latest_parts() == []
+
+        manifest.start_generation("stream_1", script_hash("script"), 2)
+        manifest.add_part(make_record("stream_1", 0))
+        with open(tmp_path / MANIFEST_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"event": "part", "generation": "stream_1", "turn_')
+
+        assert [record.turn_index for record in manifest.latest_parts()] == [0]
@@ -0,0 +1,53 @@
+"""Unit tests for reusing audio parts across script edits."""
+
+from yomitalk.components.part_manifest import PartRecord
+from yomitalk.components.part_reuse import plan_part_reuse, turn_keys
+
+
+def make_records(conversation_parts):
+    """Create part records of a script."""
+    return [
+        PartRecord("stream_old", "hash", index, key, f"/tmp/stream_old/part_{index:03d}_{speaker}.wav", 100, 1.0)
+        for index, ((speaker, _), key) in enumerate(zip(conversation_parts, turn_keys(conversation_parts), strict=True))
+    ]
+
+
+class TestTurnKeys:
+    """Test class for turn keys."""
+
+    def test_key_depends_on_previous_speaker(self):
+        """Test that the same turn after another speaker gets another key (the pause before it differs)."""
+        first = turn_keys([("ずんだもん", "こんにちは"), ("四国めたん", "よろしく")])
+        second = turn_keys([("四国めたん", "はじめに"), ("四国めたん", "よろしく")])
+        assert first[1] != second[1]
+        assert turn_keys([("ずんだもん", "こんにちは")])[0] == first[0]
+
+    def test_key_depends_on_audio_version(self):
+        """Test that the same turn synthesized with another engine version or output format gets another key."""
+        script = [("ずんだもん", "こんにちは")]
+        assert turn_keys(script, "core+dict.a|24000Hz") != turn_keys(script, "core+dict.b|24000Hz")
+        assert turn_keys(script, "core+dict.a|24000Hz") == turn_keys(script, "core+dict.a|24000Hz")
+
+
+class TestPlanPartReuse:
+    """Test class for plan_part_reuse."""
+
+    def test_unchanged_turns_around_edits_are_matched(self):
+        """Test that turns before and after an insertion and an edit reuse their parts."""
+        records = make_records([("ずんだもん", "一"), ("四国めたん", "二"), ("ずんだもん", "三"), ("四国めたん", "四")])
+        new_script = [("ずんだもん", "一"), ("四国めたん", "二"), ("ずんだもん", "挿入"), ("ずんだもん", "三を修正"), ("四国めたん", "四")]
+
+        reuse = plan_part_reuse(records, turn_keys(new_script))
+
+        assert reuse == {0: records[0], 1: records[1], 4: records[3]}
+
+    def test_parts_are_ordered_by_turn_index(self):
+        """Test that parts are matched in turn order whatever order they are passed in."""
+        script = [(f"話者{index % 2}", str(index)) for index in range(12)]
+        records = make_records(script)
+
+        assert plan_part_reuse(list(reversed(records)), turn_keys(script)) == dict(enumerate(records))
+
+    def test_no_previous_parts(self):
+        """Test that nothing is reused without previous parts."""
+        assert plan_part_reuse([], turn_keys([("ずんだもん", "一")])) == {}
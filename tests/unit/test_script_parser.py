@@ -0,0 +1,111 @@
+"""Unit tests for the script parser."""
+
+import random
+from unittest.mock import patch
+
+from yomitalk.common.character import DISPLAY_NAMES
+from yomitalk.components.script_parser import ScriptParser, SpeakerIndex, Turn
+from yomitalk.utils.text_utils import calculate_text_similarity
+
+
+def reference_best_match(name, names, threshold=0.3):
+    """Resolve a speaker name by comparing it with every name (the behavior the index must keep)."""
+    best_name, best_similarity = None, 0.0
+    for candidate in names:
+        similarity = calculate_text_similarity(name, candidate)
+        if similarity > best_similarity:
+            best_name, best_similarity = candidate, similarity
+    return (best_name, best_similarity) if best_similarity >= threshold else (None, best_similarity)
+
+
+class TestScriptParser:
+    """Test class for ScriptParser."""
+
+    def setup_method(self):
+        """Set up a fresh parser for each test."""
+        self.parser = ScriptParser()
+
+    def test_parse_produces_typed_turns(self):
+        """Test that turns are typed and compatible with (speaker, text) tuples."""
+        turns = self.parser.parse("ずんだもん: こんにちはなのだ！\n四国めたん：よろしくお願いします。\n続きの行です。")
+
+        assert turns == [("ずんだもん", "こんにちはなのだ！"), ("四国めたん", "よろしくお願いします。\n続きの行です。")]
+        assert isinstance(turns[0], Turn)
+        assert turns[1].speaker == "四国めたん"
+
+    def test_speech_containing_colons_is_kept(self):
+        """Test that colons inside speech do not start a new turn."""
+        turns = self.parser.parse("ずんだもん: 時刻は10:30なのだ\n四国めたん: 了解：確認しました")
+        assert turns == [("ずんだもん", "時刻は10:30なのだ"), ("四国めたん", "了解：確認しました")]
+
+    def test_parse_is_memoized_by_script(self):
+        """Test that a script is parsed only once and callers receive independent lists."""
+        script = "ずんだもん: 一つ目\n四国めたん: 二つ目"
+        with patch.object(self.parser, "_parse_lines", wraps=self.parser._parse_lines) as parse_lines:
+            first = self.parser.parse(script)
+            first.append(Turn("ずんだもん", "追加"))
+            second = self.parser.parse(script)
+            self.parser.parse(script + "\nずんだもん: 三つ目")
+
+        assert parse_lines.call_count == 2
+        assert second == [("ずんだもん", "一つ目"), ("四国めたん", "二つ目")]
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used scripts are evicted."""
+        parser = ScriptParser(cache_size=2)
+        for index in range(3):
+            parser.parse(f"ずんだもん: {index}")
+        assert len(parser._cache) == 2
+
+    def test_fuzzy_speaker_matches_are_memoized(self):
+        """Test that each unknown speaker name is resolved only once."""
+        script = "\n".join(["ずんだもんさん: 一つ目", "ずんだもんさん: 二つ目", "ずんだもんさん: 三つ目"])
+        with patch.object(self.parser._speaker_index, "best_match", wraps=self.parser._speaker_index.best_match) as best_match:
+            turns = self.parser.parse(script)
+
+        assert [turn.speaker for turn in turns] == ["ずんだもん"] * 3
+        best_match.assert_called_once_with("ずんだもんさん")
+
+    def test_format_is_fixed_when_no_turns_are_found(self):
+        """Test that scripts without speaker colons are fixed and parsed."""
+        assert self.parser.parse("ずんだもん こんにちはなのだ") == [("ずんだもん", "こんにちはなのだ")]
+
+
+class TestSpeakerIndex:
+    """Test class for SpeakerIndex."""
+
+    def test_best_match_equals_comparison_with_every_name(self):
+        """Test that pruned resolution returns the same match as comparing every name."""
+        index = SpeakerIndex(DISPLAY_NAMES)
+        rng = random.Random(0)
+        alphabet = "".join(sorted(set("".join(DISPLAY_NAMES)))) + "さんちゃ ーab"
+        names = ["ずんだもん", "ずんだ", "ズンダモン", "四国 めたん", "めたん", "zundamon", "ー", "a", "司会"]
+        for _ in range(500):
+            base = list(rng.choice(DISPLAY_NAMES))
+            for _ in range(rng.randint(0, 4)):
+                position = rng.randrange(len(base) + 1)
+                operation = rng.choice(["insert", "delete", "replace"])
+                if operation == "insert" or not base:
+                    base.insert(position, rng.choice(alphabet))
+                elif position < len(base):
+                    if operation == "delete":
+                        del base[position]
+                    else:
+                        base[position] = rng.choice(alphabet)
+            names.append("".join(base) or "x")
+
+        for name in names:
+            expected_name, expected_similarity = reference_best_match(name, DISPLAY_NAMES)
+            matched_name, similarity = index.best_match(name)
+            assert matched_name == expected_name, name
+            if matched_name is not None:
+                assert similarity == expected_similarity
+
+    def test_large_roster(self):
+        """Test resolution against a roster much larger than the built-in characters."""
+        roster = [f"キャラクター{number:03d}" for number in range(300)] + ["ずんだもん"]
+        index = SpeakerIndex(roster)
+
+        assert index.best_match("きゃらくたー123")[0] == "キャラクター123"
+        assert index.best_match("ずんだもんさん")[0] == "ずんだもん"
+        assert index.best_match("無関係な名前")[0] is None
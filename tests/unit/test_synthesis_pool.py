@@ -0,0 +1,203 @@
+"""Unit tests for SynthesisWorkerPool."""
+
+import io
+import os
+import time
+import wave
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yomitalk.components.synthesis_pool import SynthesisWorkerPool, _SynthesisJob, _WorkerHandle, create_voicevox_engine
+from yomitalk.utils.metrics import ThroughputModel
+
+# Marker directory used by the fake engines to fail only on the first attempt
+MARKER_DIR_ENV = "YOMITALK_TEST_POOL_MARKER_DIR"
+
+
+def _echo_synthesize(text: str, style_id: int) -> bytes:
+    """Fake synthesis returning the input as bytes."""
+    if text.startswith("slow"):
+        time.sleep(0.2)
+    return f"{style_id}:{text}".encode()
+
+
+def echo_engine_factory():
+    """Engine factory returning the echo synthesizer."""
+    return _echo_synthesize
+
+
+def _flaky_synthesize(text: str, style_id: int) -> bytes:
+    """Fake synthesis that crashes or hangs the first time it sees a text."""
+    marker = Path(os.environ[MARKER_DIR_ENV]) / text
+    if not marker.exists():
+        marker.touch()
+        if text.startswith("crash"):
+            os._exit(1)
+        if text.startswith("hang"):
+            time.sleep(60)
+    return _echo_synthesize(text, style_id)
+
+
+def flaky_engine_factory():
+    """Engine factory returning the flaky synthesizer."""
+    return _flaky_synthesize
+
+
+def _always_crash_synthesize(text: str, style_id: int) -> bytes:
+    """Fake synthesis that always kills its worker."""
+    os._exit(1)
+
+
+def always_crash_engine_factory():
+    """Engine factory returning a synthesizer that always crashes."""
+    return _always_crash_synthesize
+
+
+def _wav_synthesize(text: str, style_id: int) -> bytes:
+    """Fake synthesis returning 0.1 seconds of silence per character."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(1000)
+        wav_file.writeframes(b"\x00\x00" * 100 * len(text))
+    return buffer.getvalue()
+
+
+def wav_engine_factory():
+    """Engine factory returning the WAV synthesizer."""
+    return _wav_synthesize
+
+
+def failing_engine_factory():
+    """Engine factory that cannot initialize (e.g. VOICEVOX Core is unavailable)."""
+    raise RuntimeError("engine unavailable")
+
+
+class _FakeConnection:
+    """Connection recording the messages sent to a worker."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class TestSynthesisWorkerPool:
+    """Test class for SynthesisWorkerPool."""
+
+    def _create_pool(self, engine_factory, **kwargs) -> SynthesisWorkerPool:
+        pool = SynthesisWorkerPool(2, engine_factory=engine_factory, start_method="fork", **kwargs)
+        pool.start()
+        return pool
+
+    def test_results_match_submitted_jobs(self):
+        """Jobs finishing out of order are resolved with their own results."""
+        pool = self._create_pool(echo_engine_factory)
+        try:
+            texts = ["slow first", "second", "third", "slow fourth", "fifth"]
+            futures = [pool.submit(text, i) for i, text in enumerate(texts)]
+            results = [future.result(timeout=10) for future in futures]
+            assert results == [f"{i}:{text}".encode() for i, text in enumerate(texts)]
+        finally:
+            pool.shutdown()
+
+    def test_crashed_worker_is_restarted(self, tmp_path, monkeypatch):
+        """A job whose worker crashes is retried on a fresh worker."""
+        monkeypatch.setenv(MARKER_DIR_ENV, str(tmp_path))
+        pool = self._create_pool(flaky_engine_factory)
+        try:
+            assert pool.submit("crash once", 3).result(timeout=10) == b"3:crash once"
+            assert pool.restart_count == 1
+            assert pool.submit("after crash", 3).result(timeout=10) == b"3:after crash"
+        finally:
+            pool.shutdown()
+
+    def test_hung_worker_is_restarted(self, tmp_path, monkeypatch):
+        """A job exceeding the timeout is retried on a fresh worker."""
+        monkeypatch.setenv(MARKER_DIR_ENV, str(tmp_path))
+        pool = self._create_pool(flaky_engine_factory, job_timeout=1.0)
+        try:
+            assert pool.submit("hang once", 2).result(timeout=15) == b"2:hang once"
+            assert pool.restart_count == 1
+        finally:
+            pool.shutdown()
+
+    def test_job_gives_up_after_max_retries(self):
+        """A job that keeps crashing resolves with empty data instead of failing the pool."""
+        pool = self._create_pool(always_crash_engine_factory, max_retries=1)
+        try:
+            assert pool.submit("never works", 1).result(timeout=15) == b""
+            assert pool.restart_count == 2
+        finally:
+            pool.shutdown()
+
+    def test_workers_failing_to_initialize_are_given_up(self):
+        """Workers that cannot initialize are respawned with backoff a limited number of times, then jobs fail."""
+        pool = self._create_pool(failing_engine_factory, restart_backoff=0.05, max_worker_restarts=2)
+        try:
+            assert pool.submit("text", 1).result(timeout=15) == b""
+            assert pool.restart_count == 6
+            # Later jobs fail immediately instead of waiting for a worker
+            assert pool.submit("text", 1).result(timeout=1) == b""
+        finally:
+            pool.shutdown()
+
+    def test_cancelled_jobs_do_not_leave_worker_idle(self):
+        """Dispatch skips jobs cancelled while queued and assigns the next live job."""
+        pool = SynthesisWorkerPool(1, engine_factory=echo_engine_factory, start_method="fork")
+        conn = _FakeConnection()
+        worker = _WorkerHandle(process=None, conn=cast(Connection, conn), started_at=0.0, ready=True)
+        pool._workers.append(worker)
+        cancelled = _SynthesisJob(0, "cancelled", 1, Future())
+        cancelled.future.cancel()
+        live = _SynthesisJob(1, "live", 1, Future())
+        pool._pending.extend([cancelled, live])
+
+        pool._dispatch_pending()
+
+        assert worker.job is live
+        assert conn.sent == [(1, "live", 1)]
+
+    def test_worker_timing_feeds_throughput_model(self):
+        """Jobs synthesized in workers are recorded in the throughput model of the main process."""
+        model = ThroughputModel()
+        with patch("yomitalk.components.synthesis_pool.synthesis_throughput", model):
+            pool = self._create_pool(wav_engine_factory)
+            try:
+                assert pool.submit("こんにちは", 7).result(timeout=10)
+            finally:
+                pool.shutdown()
+
+        assert model.predict_audio_seconds(7, 10) == pytest.approx(1.0)
+
+    def test_submit_after_shutdown_fails(self):
+        """Submitting to a stopped pool raises from the future."""
+        pool = self._create_pool(echo_engine_factory)
+        pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.submit("text", 1).result(timeout=1)
+
+    def test_invalid_worker_count(self):
+        """At least one worker is required."""
+        with pytest.raises(ValueError):
+            SynthesisWorkerPool(0, engine_factory=echo_engine_factory)
+
+
+def test_worker_engine_reloads_user_dictionary_before_each_job():
+    """Dictionary edits reach worker processes: each job checks the dictionary file before synthesis."""
+    manager = MagicMock()
+    manager.text_to_speech.return_value = b"wav"
+    with patch("yomitalk.components.audio_generator.VoicevoxCoreManager", return_value=manager):
+        synthesize = create_voicevox_engine()
+
+    assert synthesize("こんにちは", 3) == b"wav"
+    assert synthesize("さようなら", 3) == b"wav"
+    assert manager.reload_user_dictionary.call_count == 2
+    manager.text_to_speech.assert_called_with("さようなら", 3)
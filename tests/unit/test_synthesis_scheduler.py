@@ -0,0 +1,138 @@
+"""Unit tests for SynthesisScheduler."""
+
+import threading
+import time
+
+import pytest
+
+from yomitalk.components.synthesis_scheduler import SynthesisScheduler
+
+
+class TestSynthesisScheduler:
+    """Test class for SynthesisScheduler."""
+
+    def setup_method(self):
+        """Create a scheduler whose single runner is blocked until released."""
+        self.scheduler = SynthesisScheduler(capacity=1)
+        self.scheduler.start()
+        self.gate = threading.Event()
+        self.order = []
+        started = threading.Event()
+
+        def block():
+            started.set()
+            self.gate.wait()
+
+        # Occupy the runner so that the following submissions are queued
+        self.scheduler.submit("blocker", block)
+        assert started.wait(timeout=5)
+
+    def teardown_method(self):
+        """Stop the scheduler."""
+        self.gate.set()
+        self.scheduler.shutdown()
+
+    def _job(self, name):
+        def run():
+            self.order.append(name)
+            return name
+
+        return run
+
+    def test_sessions_are_interleaved_round_robin(self):
+        """A long job of one session does not delay another session's utterances."""
+        futures = [self.scheduler.submit("long", self._job(f"long{i}")) for i in range(4)]
+        futures += [self.scheduler.submit("short", self._job(f"short{i}")) for i in range(2)]
+
+        self.gate.set()
+        results = [future.result(timeout=5) for future in futures]
+
+        assert results == ["long0", "long1", "long2", "long3", "short0", "short1"]
+        assert self.order == ["long0", "short0", "long1", "short1", "long2", "long3"]
+
+    def test_session_status_reports_queue_depth(self):
+        """The queue depth of a session and of all sessions is reported."""
+        self.scheduler.submit("a", self._job("a0"))
+        self.scheduler.submit("a", self._job("a1"))
+        self.scheduler.submit("b", self._job("b0"))
+
+        status = self.scheduler.get_session_status("a")
+        assert status["queue_depth"] == 2
+        assert status["total_queued"] == 3
+        assert status["active_sessions"] == 3  # blocker, a and b
+
+        self.gate.set()
+        self.scheduler.submit("a", self._job("a2")).result(timeout=5)
+        status = self.scheduler.get_session_status("a")
+        assert status["queue_depth"] == 0
+        assert status["average_wait"] > 0.0
+
+    def test_cancel_jobs_cancels_only_given_utterances(self):
+        """Cancelling the utterances of one generation keeps a newer generation of the same session queued."""
+        cancelled = self.scheduler.submit("session", self._job("old"))
+        kept = self.scheduler.submit("session", self._job("new"))
+
+        self.scheduler.cancel_jobs([cancelled])
+        assert self.scheduler.get_session_status("session")["queue_depth"] == 1
+        self.gate.set()
+
+        assert cancelled.cancelled()
+        assert kept.result(timeout=5) == "new"
+        assert self.order == ["new"]
+
+    def test_release_session_waits_for_queued_utterances(self):
+        """Releasing a session neither cancels its utterances nor drops statistics while it is active."""
+        future = self.scheduler.submit("session", self._job("queued"))
+        self.scheduler.release_session("session")
+        assert not future.cancelled()
+
+        self.gate.set()
+        assert future.result(timeout=5) == "queued"
+        deadline = time.monotonic() + 5
+        while "session" in self.scheduler._wait_times and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "session" not in self.scheduler._wait_times
+
+    def test_exception_is_propagated(self):
+        """An exception raised by a job is set on its future."""
+
+        def fail():
+            raise ValueError("synthesis failed")
+
+        future = self.scheduler.submit("a", fail)
+        self.gate.set()
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        # The runner keeps working after a failure
+        assert self.scheduler.submit("a", self._job("next")).result(timeout=5) == "next"
+
+    def test_submit_after_shutdown_fails(self):
+        """Submitting to a stopped scheduler raises from the future."""
+        self.gate.set()
+        self.scheduler.shutdown()
+        with pytest.raises(RuntimeError):
+            self.scheduler.submit("a", self._job("late")).result(timeout=1)
+
+    def test_priority_lane_is_served_first(self):
+        """The first turns of a new job are not queued behind another job's tail."""
+        for i in range(3):
+            self.scheduler.submit("old", self._job(f"old{i}"))
+        self.scheduler.submit("new", self._job("new0"), priority=True)
+        last = self.scheduler.submit("new", self._job("new1"))
+
+        self.gate.set()
+        last.result(timeout=5)
+
+        assert self.order == ["new0", "old0", "new1", "old1", "old2"]
+
+    def test_background_lane_is_not_starved(self):
+        """A background utterance waiting longer than the aging limit is served first."""
+        self.scheduler.aging_seconds = 0.0
+        self.scheduler.submit("old", self._job("old0"))
+        time.sleep(0.01)
+        last = self.scheduler.submit("new", self._job("new0"), priority=True)
+
+        self.gate.set()
+        last.result(timeout=5)
+
+        assert self.order == ["old0", "new0"]
@@ -2,7 +2,15 @@
 
 import pytest
 
-from yomitalk.utils.text_utils import is_romaji_readable
+from yomitalk.utils.text_utils import (
+    bounded_levenshtein_distance,
+    classify_romaji_readable,
+    hiragana_to_katakana,
+    is_romaji_readable,
+    levenshtein_distance,
+    normalize_text,
+    normalize_texts,
+)
 
 
 class TestTextUtils:
@@ -38,3 +46,69 @@ class TestTextUtils:
         """Test checking if text is romaji readable."""
         result = is_romaji_readable(input_text)
         assert result == expected_result, f"Expected {expected_result} for '{input_text}', but got {result}"
+
+    def test_classify_romaji_readable(self):
+        """複数の単語をまとめて判定するテスト（重複は1つにまとめられる）"""
+        assert classify_romaji_readable(["HONDA", "HELLO", "HONDA", "KITTE"]) == {"HONDA": True, "HELLO": False, "KITTE": False}
+
+    @pytest.mark.parametrize(
+        "input_text, expected_result",
+        [
+            ("四国 めたん", "四国メタン"),
+            ("ずんだ_もん", "ズンダモン"),
+            ("ｚｕｎｄａ-Mon", "zundamon"),
+            ("ゔぁ　ゖ", "ヴァヶ"),  # ひらがなの範囲の端の文字と全角空白
+            ("", ""),
+        ],
+    )
+    def test_normalize_text(self, input_text, expected_result):
+        """テキストの正規化のテスト"""
+        assert normalize_text(input_text) == expected_result
+
+    def test_normalize_texts(self):
+        """複数のテキストをまとめて正規化するテスト（入力と同じ順序で返る）"""
+        assert normalize_texts(["めたん", "ZUNDA", "めたん"]) == ["メタン", "zunda", "メタン"]
+
+    def test_hiragana_to_katakana_keeps_other_characters(self):
+        """ひらがな以外の文字は変換されないことのテスト"""
+        assert hiragana_to_katakana("ゟあア漢A") == "ゟアア漢A"
+
+    @staticmethod
+    def _reference_distance(s1: str, s2: str) -> int:
+        """Edit distance computed with the plain dynamic programming table."""
+        previous = list(range(len(s2) + 1))
+        for i, char1 in enumerate(s1, 1):
+            current = [i]
+            for j, char2 in enumerate(s2, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char1 != char2)))
+            previous = current
+        return previous[-1]
+
+    @pytest.mark.parametrize(
+        "s1, s2, expected",
+        [
+            ("", "", 0),
+            ("", "abc", 3),
+            ("kitten", "sitting", 3),
+            ("ズンダモン", "ズンダモン", 0),
+            ("シコクメタン", "シコクメタソ", 1),
+            ("abcdefghij" * 10, "abcdefghij" * 9, 10),  # 64文字を超える文字列
+        ],
+    )
+    def test_levenshtein_distance(self, s1, s2, expected):
+        """ビット並列のレーベンシュタイン距離のテスト"""
+        assert levenshtein_distance(s1, s2) == expected
+        assert levenshtein_distance(s2, s1) == expected
+
+    def test_bounded_levenshtein_distance_matches_reference(self):
+        """打ち切り付きの距離が、上限以下では正確な距離、上限超過ではmax_distance + 1になることのテスト"""
+        import random
+
+        rng = random.Random(0)
+        for _ in range(2000):
+            s1 = "".join(rng.choice("abずん") for _ in range(rng.randint(0, 10)))
+            s2 = "".join(rng.choice("abずん") for _ in range(rng.randint(0, 10)))
+            expected = self._reference_distance(s1, s2)
+            assert bounded_levenshtein_distance(s1, s2) == expected
+            max_distance = rng.randint(0, 6)
+            assert bounded_levenshtein_distance(s1, s2, max_distance) == (expected if expected <= max_distance else max_distance + 1)
@@ -0,0 +1,158 @@
+"""Unit tests for wav_utils module."""
+
+import io
+import os
+import wave
+from unittest.mock import patch
+
+from yomitalk.utils.wav_utils import StreamingWavWriter, combine_wav_data, convert_pcm, get_wav_duration, read_wav_layout
+
+
+def _make_wav(frames: bytes, framerate: int = 24000) -> bytes:
+    """Create mono 16-bit WAV data."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(frames)
+    return buffer.getvalue()
+
+
+class TestCombineWavData:
+    """Test class for combine_wav_data."""
+
+    def test_empty_and_single(self):
+        """An empty list gives empty data, and a single item is returned as is."""
+        wav_data = _make_wav(b"\x01\x00")
+        assert combine_wav_data([]) == b""
+        assert combine_wav_data([wav_data]) is wav_data
+
+    def test_frames_are_concatenated(self):
+        """Frames of all inputs are concatenated in order under one header."""
+        combined = combine_wav_data([_make_wav(b"\x01\x00\x02\x00"), _make_wav(b"\x03\x00")])
+
+        with wave.open(io.BytesIO(combined), "rb") as wav_file:
+            assert wav_file.getframerate() == 24000
+            assert wav_file.getnframes() == 3
+            assert wav_file.readframes(3) == b"\x01\x00\x02\x00\x03\x00"
+
+
+class TestGetWavDuration:
+    """Test class for get_wav_duration."""
+
+    def test_duration(self):
+        """The duration is the number of frames divided by the frame rate."""
+        assert get_wav_duration(_make_wav(b"\x00\x00" * 12000)) == 0.5
+
+    def test_invalid_data(self):
+        """Data that is not WAV has no duration."""
+        assert get_wav_duration(b"not a wav") == 0.0
+
+
+class TestStreamingWavWriter:
+    """Test class for StreamingWavWriter."""
+
+    def test_appended_frames_are_finalized_on_close(self, tmp_path):
+        """Frames of WAV data and files are appended, and the header is patched on close."""
+        existing = tmp_path / "part.wav"
+        existing.write_bytes(_make_wav(b"\x01\x00\x02\x00"))
+        writer = StreamingWavWriter(tmp_path / "audio.wav")
+
+        assert writer.append_file(existing)
+        assert writer.append(_make_wav(b"\x03\x00"))
+        # 完成するまでは出力パスにファイルは存在しない
+        assert not (tmp_path / "audio.wav").exists()
+        assert writer.close() == tmp_path / "audio.wav"
+
+        with wave.open(str(tmp_path / "audio.wav"), "rb") as wav_file:
+            assert wav_file.getnframes() == 3
+            assert wav_file.readframes(3) == b"\x01\x00\x02\x00\x03\x00"
+        assert not writer.partial_path.exists()
+
+    def test_mismatched_format_is_converted(self, tmp_path):
+        """Data with another sample rate is resampled to the format of the first part."""
+        writer = StreamingWavWriter(tmp_path / "audio.wav")
+        assert writer.append(_make_wav(b"\x01\x00"))
+        assert writer.append(_make_wav(b"\x00\x10" * 4, framerate=48000))
+        writer.close()
+
+        with wave.open(str(tmp_path / "audio.wav"), "rb") as wav_file:
+            assert wav_file.getframerate() == 24000
+            assert wav_file.getnframes() == 3
+            assert wav_file.readframes(3)[2:] == b"\x00\x10" * 2
+        assert writer.converted_parts == 1
+
+    def test_falls_back_to_plain_copy(self, tmp_path):
+        """Without kernel-side copy support the PCM data is copied with reads and writes."""
+        part = tmp_path / "part.wav"
+        part.write_bytes(_make_wav(b"\x01\x00\x02\x00"))
+        writer = StreamingWavWriter(tmp_path / "audio.wav")
+
+        with patch("os.copy_file_range", side_effect=OSError), patch("os.sendfile", side_effect=OSError):
+            assert writer.append_file(part)
+        writer.close()
+
+        with wave.open(str(tmp_path / "audio.wav"), "rb") as wav_file:
+            assert wav_file.readframes(2) == b"\x01\x00\x02\x00"
+
+    def test_fallback_continues_after_partial_copy(self, tmp_path):
+        """When a copy method fails partway, the next method continues from the copied position without duplicating data."""
+        part = tmp_path / "part.wav"
+        part.write_bytes(_make_wav(b"\x01\x00\x02\x00\x03\x00"))
+        writer = StreamingWavWriter(tmp_path / "audio.wav")
+        copy_file_range = os.copy_file_range
+
+        def copy_two_bytes_then_fail(source_fd, target_fd, count, offset):
+            if offset > 44:
+                raise OSError("copy interrupted")
+            return copy_file_range(source_fd, target_fd, 2, offset)
+
+        with patch("os.copy_file_range", side_effect=copy_two_bytes_then_fail), patch("os.sendfile", side_effect=OSError):
+            assert writer.append_file(part)
+        writer.close()
+
+        with wave.open(str(tmp_path / "audio.wav"), "rb") as wav_file:
+            assert wav_file.getnframes() == 3
+            assert wav_file.readframes(3) == b"\x01\x00\x02\x00\x03\x00"
+
+    def test_invalid_data_is_not_appended(self, tmp_path):
+        """Data that is not a PCM WAV is rejected."""
+        writer = StreamingWavWriter(tmp_path / "audio.wav")
+        assert not writer.append(b"not a wav")
+        assert writer.close() is None
+
+    def test_close_without_data_and_abort(self, tmp_path):
+        """Closing an empty writer creates nothing, and abort deletes the partial file."""
+        assert StreamingWavWriter(tmp_path / "empty.wav").close() is None
+
+        writer = StreamingWavWriter(tmp_path / "aborted.wav")
+        writer.append(_make_wav(b"\x01\x00"))
+        writer.abort()
+        assert not list(tmp_path.iterdir())
+
+
+class TestReadWavLayout:
+    """Test class for read_wav_layout."""
+
+    def test_layout_of_generated_wav(self):
+        """The format and the position of the PCM data are read from the header."""
+        layout = read_wav_layout(io.BytesIO(_make_wav(b"\x01\x00\x02\x00")))
+        assert layout.audio_format == (1, 2, 24000)
+        assert layout.data_offset == 44
+        assert layout.data_size == 4
+
+
+class TestConvertPcm:
+    """Test class for convert_pcm."""
+
+    def test_mono_to_stereo_and_resample(self):
+        """Channels are duplicated and the sample rate is changed by interpolation."""
+        pcm = b"\x00\x10" * 4
+        converted = convert_pcm(pcm, (1, 2, 24000), (2, 2, 48000))
+        assert converted == b"\x00\x10" * 16
+
+    def test_same_format_is_returned_as_is(self):
+        """Data already in the target format is not copied."""
+        pcm = b"\x01\x00"
+        assert convert_pcm(pcm, (1, 2, 24000), (1, 2, 24000)) is pcm
@@ -5,6 +5,7 @@
 Builds the Paper Podcast Generator application using Gradio.
 """
 
+import asyncio
 import math
 import os
 import time
@@ -13,27 +14,53 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import gradio as gr
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute
 
 from yomitalk.common import APIType
-from yomitalk.common.character import DISPLAY_NAMES
+from yomitalk.common.character import DISPLAY_NAMES, STYLE_ID_BY_NAME
+from yomitalk.components.audio_encoder import find_audio_files, initialize_global_audio_encoder
 from yomitalk.components.audio_generator import (
+    get_global_voicevox_manager,
     initialize_global_voicevox_manager,
 )
 from yomitalk.components.content_extractor import ContentExtractor
+from yomitalk.components.hls_segmenter import HLS_ROUTE, HLS_STREAMING, PLAYLIST_NAME, hls_playlists
+from yomitalk.components.part_manifest import PartManifest, PartRecord, script_hash
+from yomitalk.components.script_parser import get_global_script_parser
+from yomitalk.components.synthesis_pool import initialize_global_synthesis_pool
+from yomitalk.components.synthesis_scheduler import initialize_global_synthesis_scheduler
 from yomitalk.models.gemini_model import GeminiModel
 from yomitalk.models.openai_model import OpenAIModel
 from yomitalk.prompt_manager import DocumentType, PodcastMode, PromptManager
 from yomitalk.user_session import UserSession
 from yomitalk.utils.logger import logger
+from yomitalk.utils.metrics import synthesis_throughput, time_to_first_audio
 
 # Initialize global VOICEVOX Core manager once for all users
 # This is done at application startup, outside of any function
 logger.info("Initializing global VOICEVOX Core manager for all users")
 global_voicevox_manager = initialize_global_voicevox_manager()
+# Start parallel synthesis workers when YOMITALK_SYNTHESIS_WORKERS > 0
+global_synthesis_pool = initialize_global_synthesis_pool()
+# Interleave utterances of concurrent sessions on the shared synthesizer
+global_synthesis_scheduler = initialize_global_synthesis_scheduler(capacity=global_synthesis_pool.size if global_synthesis_pool else 1)
+# Compress final audio (and optionally streaming parts) off the synthesis threads
+global_audio_encoder = initialize_global_audio_encoder()
 
 # E2E test mode for faster startup
 E2E_TEST_MODE = os.environ.get("E2E_TEST_MODE", "false").lower() == "true"
 
+# Number of audio generation jobs running at the same time (the synthesis scheduler shares the engine fairly)
+AUDIO_GENERATION_CONCURRENCY = int(os.environ.get("YOMITALK_AUDIO_GENERATION_CONCURRENCY", "4")) if global_synthesis_scheduler else 1
+
+# Maximum seconds an audio generation request waits for the VOICEVOX warmup to finish
+ENGINE_WARMUP_WAIT_TIMEOUT = float(os.environ.get("YOMITALK_ENGINE_WARMUP_WAIT_TIMEOUT", "120"))
+
+# Reject new audio generation while the predicted synthesis time of running jobs exceeds this many seconds (0 disables)
+MAX_PREDICTED_BACKLOG_SECONDS = float(os.environ.get("YOMITALK_MAX_PREDICTED_BACKLOG_SECONDS", "0"))
+
 # Default port
 DEFAULT_PORT = 7860
 
@@ -128,10 +155,22 @@ class PaperPodcastApp:
 
         return result_text, result_session, updated_browser_state
 
-    def generate_podcast_audio_streaming_with_browser_state_and_resume(
-        self, text: str, user_session: UserSession, browser_state: Dict[str, Any], resume_from_part: int = 0, existing_parts: Optional[List[str]] = None, progress=None
+    async def generate_podcast_audio_streaming_with_browser_state_and_resume(
+        self,
+        text: str,
+        user_session: UserSession,
+        browser_state: Dict[str, Any],
+        resume_from_part: int = 0,
+        existing_parts: Optional[List[str]] = None,
+        progress=None,
+        previous_parts: Optional[List[PartRecord]] = None,
     ):
-        """Generate streaming audio with BrowserState synchronization and true resume capability."""
+        """Generate streaming audio with BrowserState synchronization and true resume capability.
+
+        Implemented as an async generator so that waiting for synthesis does not occupy a worker thread.
+        previous_parts are the part files of the script before it was edited; the parts of unchanged
+        turns are reused and only inserted and modified turns are synthesized.
+        """
         if not text:
             logger.warning("Streaming audio generation: Text is empty")
             browser_state["audio_generation_state"]["status"] = "failed"
@@ -149,6 +188,23 @@ class PaperPodcastApp:
             yield None, user_session, error_html, None, browser_state
             return
 
+        # ターンごとの再生時間と合成時間を予測し、混雑時は受け付けない
+        turn_estimates = self._predict_turns(text)
+        predicted_audio_seconds = sum(audio_seconds for audio_seconds, _ in turn_estimates)
+        predicted_synthesis_seconds = sum(synthesis_seconds for _, synthesis_seconds in turn_estimates[resume_from_part:])
+        backlog_seconds = synthesis_throughput.backlog_seconds()
+        if MAX_PREDICTED_BACKLOG_SECONDS > 0 and backlog_seconds > 0 and backlog_seconds + predicted_synthesis_seconds > MAX_PREDICTED_BACKLOG_SECONDS:
+            logger.warning(f"Audio generation rejected: predicted backlog {backlog_seconds:.0f}s + {predicted_synthesis_seconds:.0f}s exceeds {MAX_PREDICTED_BACKLOG_SECONDS:.0f}s")
+            browser_state["audio_generation_state"]["status"] = "failed"
+            browser_state["audio_generation_state"]["is_generating"] = False
+            error_html = self._create_error_html(f"音声生成が混雑しています。約{math.ceil(backlog_seconds / 60)}分後に再度お試しください")
+            yield None, user_session, error_html, None, browser_state
+            return
+
+        generation_id = str(uuid.uuid4())
+        synthesis_throughput.update_job(generation_id, predicted_synthesis_seconds)
+        job_started_at = time.time()
+
         try:
             # Initialize progress if not provided
             if progress is None:
@@ -156,10 +212,9 @@ class PaperPodcastApp:
 
             # スクリプトからパーツ数を推定
             estimated_total_parts = self._estimate_audio_parts_count(text)
-            logger.info(f"Estimated total audio parts: {estimated_total_parts}")
+            logger.info(f"Estimated total audio parts: {estimated_total_parts} (predicted duration: {predicted_audio_seconds:.0f}s, synthesis: {predicted_synthesis_seconds:.0f}s)")
 
             # 音声生成状態をブラウザ状態に初期化（再開の場合は一部保持）
-            generation_id = str(uuid.uuid4())
             if resume_from_part == 0:
                 # 新規生成の場合
                 browser_state["audio_generation_state"].update(
@@ -194,6 +249,8 @@ class PaperPodcastApp:
                     estimated_total_parts,
                     "音声生成を開始しています...",
                     start_time=time.time(),
+                    remaining_seconds=predicted_synthesis_seconds,
+                    total_audio_seconds=predicted_audio_seconds,
                 )
                 yield None, user_session, start_html, None, browser_state
             else:
@@ -202,9 +259,24 @@ class PaperPodcastApp:
                     estimated_total_parts,
                     f"音声生成を再開しています... (パート{resume_from_part + 1}から)",
                     start_time=browser_state["audio_generation_state"].get("start_time", time.time()),
+                    remaining_seconds=predicted_synthesis_seconds,
+                    total_audio_seconds=predicted_audio_seconds,
                 )
                 yield None, user_session, resume_html, None, browser_state
 
+            # 音声エンジンのウォームアップ中は完了を待つ（起動直後の遅い合成をユーザーに負担させない）
+            voicevox_manager = get_global_voicevox_manager()
+            if voicevox_manager is not None and not voicevox_manager.is_ready():
+                warming_html = self._create_progress_html(
+                    resume_from_part,
+                    estimated_total_parts,
+                    "音声エンジンを準備しています...",
+                    start_time=browser_state["audio_generation_state"].get("start_time") or time.time(),
+                )
+                yield None, user_session, warming_html, None, browser_state
+                if not await asyncio.to_thread(voicevox_manager.wait_until_ready, ENGINE_WARMUP_WAIT_TIMEOUT):
+                    logger.warning("VOICEVOX warmup did not finish in time; starting audio generation anyway")
+
             # gr.Progressも使用（Gradio標準の進捗バー）
             if resume_from_part == 0:
                 progress(0, desc="🎤 音声生成を開始しています...")
@@ -215,14 +287,29 @@ class PaperPodcastApp:
             parts_paths = existing_parts.copy() if existing_parts else []
             final_combined_path = None
             current_part_count = 0  # 常に0から開始
+            # チャンク単位で再生済みのパートのファイル名接頭辞（"part_000" など）
+            streamed_part_prefixes = set()
+            requested_at = browser_state["audio_generation_state"].get("requested_at") or time.time()
+            first_audio_recorded = False
 
             # 真の部分再開対応の音声生成
-            for audio_path in user_session.audio_generator.generate_character_conversation(text, resume_from_part, existing_parts):
+            async for audio_path in user_session.audio_generator.generate_character_conversation_async(text, resume_from_part, existing_parts, previous_parts):
                 if not audio_path:
                     continue
 
                 filename = os.path.basename(audio_path)
 
+                # 新しく生成された最初の音声が届くまでの時間を記録
+                if not first_audio_recorded and audio_path not in (existing_parts or []) and not filename.startswith("audio_"):
+                    time_to_first_audio.record(time.time() - requested_at)
+                    first_audio_recorded = True
+
+                # 'chunk_'から始まるものは長いパートの一部で、再生のみ行う（パート数には数えない）
+                if filename.startswith("chunk_"):
+                    streamed_part_prefixes.add("part_" + filename.split("_")[1])
+                    yield audio_path, user_session, gr.update(), None, browser_state
+                    continue
+
                 # 'part_'を含むものは部分音声ファイル、'audio_'から始まるものは最終結合ファイル
                 if "part_" in filename:
                     # 既存パートかどうかをチェック
@@ -259,12 +346,21 @@ class PaperPodcastApp:
                         status_message = f"音声パート {current_part_count} が完了、最終処理中..."
                         progress_desc = f"🎵 音声パート {current_part_count}/{estimated_total_parts} 完了、最終処理中..."
 
+                    # 残りのターンの予測合成時間を、このジョブで観測したペース（エンジン共有による遅れ）で補正
+                    remaining_seconds = self._estimate_remaining_seconds(turn_estimates, resume_from_part, current_part_count, time.time() - job_started_at)
+                    synthesis_throughput.update_job(generation_id, remaining_seconds)
+
                     progress_html = self._create_progress_html(
                         current_part_count,
                         estimated_total_parts,
                         status_message,
                         start_time=start_time,
+                        queue_status=user_session.audio_generator.get_queue_status(),
+                        playlist_url=user_session.audio_generator.hls_playlist_url,
+                        remaining_seconds=remaining_seconds,
+                        total_audio_seconds=predicted_audio_seconds,
                     )
+                    browser_state["audio_generation_state"]["hls_playlist_path"] = user_session.audio_generator.hls_playlist_path
 
                     # gr.Progressも更新
                     progress(
@@ -272,14 +368,16 @@ class PaperPodcastApp:
                         desc=progress_desc,
                     )
 
+                    # チャンク単位で再生済みのパートは重複して再生しない
+                    already_streamed = filename[: len("part_000")] in streamed_part_prefixes
                     yield (
-                        audio_path,
+                        None if already_streamed else audio_path,
                         user_session,
                         progress_html,
                         None,
                         browser_state,
                     )
-                    time.sleep(0.05)
+                    await asyncio.sleep(0.05)
                 elif filename.startswith("audio_"):
                     # 最終結合ファイルの場合
                     final_combined_path = audio_path
@@ -295,6 +393,7 @@ class PaperPodcastApp:
                         "音声生成完了！",
                         is_completed=True,
                         start_time=start_time,
+                        playlist_url=user_session.audio_generator.hls_playlist_url,
                     )
 
                     # gr.Progressも完了状態に
@@ -303,7 +402,7 @@ class PaperPodcastApp:
                     yield None, user_session, complete_html, final_combined_path, browser_state
 
             # 音声生成の完了処理
-            self._finalize_audio_generation_with_browser_state(final_combined_path, parts_paths, user_session, browser_state)
+            await asyncio.to_thread(self._finalize_audio_generation_with_browser_state, final_combined_path, parts_paths, user_session, browser_state)
 
         except Exception as e:
             logger.error(f"Streaming audio generation exception: {str(e)}")
@@ -313,6 +412,8 @@ class PaperPodcastApp:
             error_html = self._create_error_html(f"音声生成でエラーが発生しました: {str(e)}")
             progress(0, desc="❌ 音声生成エラー")
             yield None, user_session, error_html, None, browser_state
+        finally:
+            synthesis_throughput.end_job(generation_id)
 
     def _finalize_audio_generation_with_browser_state(self, final_combined_path, parts_paths, user_session: UserSession, browser_state: Dict[str, Any]):
         """
@@ -400,25 +501,20 @@ class PaperPodcastApp:
         streaming_parts = audio_state.get("streaming_parts", [])
         final_audio_path = audio_state.get("final_audio_path")
 
-        # Check if we have a session ID to look for existing part files on disk
+        # Check for completed audio files on disk if not found in browser state
+        # Only do this if script hasn't changed and current script matches saved script
+        saved_script = audio_state.get("current_script", "")
+
+        # Look up the part files of the script in the session's part manifest
         session_id = browser_state.get("app_session_id")
         existing_parts_on_disk = []
-        if session_id:
+        restored_script = current_podcast_text or saved_script
+        if session_id and restored_script:
             from yomitalk.user_session import UserSession
 
-            temp_session = UserSession(session_id)
-            temp_dir = temp_session.get_temp_dir()
-            talks_dir = temp_dir / "talks"
-            if talks_dir.exists():
-                for stream_dir in talks_dir.iterdir():
-                    if stream_dir.is_dir() and stream_dir.name.startswith("stream_"):
-                        for part_file in stream_dir.glob("part_*.wav"):
-                            if part_file.exists():
-                                existing_parts_on_disk.append(str(part_file))
+            talks_dir = UserSession(session_id).get_temp_dir() / "talks"
+            existing_parts_on_disk = [record.path for record in PartManifest(talks_dir).latest_parts(script_hash(restored_script))]
 
-        # Check for completed audio files on disk if not found in browser state
-        # Only do this if script hasn't changed and current script matches saved script
-        saved_script = audio_state.get("current_script", "")
         script_matches = saved_script == current_podcast_text and saved_script != ""
 
         if not final_audio_path and session_id and not audio_state.get("script_changed", False) and script_matches:
@@ -426,7 +522,7 @@ class PaperPodcastApp:
 
             temp_session = UserSession(session_id)
             output_dir = temp_session.get_output_dir()
-            for audio_file in output_dir.glob("audio_*.wav"):
+            for audio_file in find_audio_files(output_dir):
                 if audio_file.exists():
                     final_audio_path = str(audio_file)
                     # Update browser state with the discovered final audio path
@@ -494,7 +590,7 @@ class PaperPodcastApp:
         # Completely no audio state
         return ""
 
-    def resume_or_generate_podcast_audio_streaming_with_browser_state(self, text: str, user_session: UserSession, browser_state: Dict[str, Any], progress=None):
+    async def resume_or_generate_podcast_audio_streaming_with_browser_state(self, text: str, user_session: UserSession, browser_state: Dict[str, Any], progress=None):
         """Resume or start new audio generation with browser state synchronization."""
         logger.info("Resume or generate audio function called")
         logger.debug(f"Text length: {len(text) if text else 0}")
@@ -509,58 +605,31 @@ class PaperPodcastApp:
         logger.info(f"Has streaming parts: {has_streaming_parts}")
         logger.info(f"Has final audio: {has_final_audio}")
 
-        # Check for existing audio parts on disk FIRST (browser_state might not have them due to reload)
-        temp_dir = user_session.get_talk_temp_dir()
-        existing_part_files_on_disk = []
-
-        logger.debug(f"Checking temp directory: {temp_dir.name}")
-        logger.debug(f"Temp dir exists: {temp_dir.exists()}")
-
-        if temp_dir.exists():
-            stream_dirs = list(temp_dir.glob("stream_*"))
-            logger.debug(f"Found {len(stream_dirs)} stream directories")
-
-            # Find all part_*.wav files in temp directories
-            for temp_subdir in stream_dirs:
-                if temp_subdir.is_dir():
-                    part_files = list(temp_subdir.glob("part_*.wav"))
-                    logger.debug(f"In {temp_subdir.name}, found {len(part_files)} part files")
-                    for part_file in sorted(part_files):
-                        if part_file.exists():
-                            existing_part_files_on_disk.append(str(part_file))
-                            logger.debug(f"Valid part file: {part_file.name}")
-        else:
-            logger.debug("Temp directory does not exist")
-
-        has_existing_parts_on_disk = len(existing_part_files_on_disk) > 0
-        logger.debug(f"Has existing parts on disk: {has_existing_parts_on_disk} ({len(existing_part_files_on_disk)} files)")
+        # Read the parts of the latest generation from the part manifest FIRST (browser_state might not have them due to reload)
+        latest_parts = PartManifest(user_session.get_talk_temp_dir()).latest_parts()
+        current_script_hash = script_hash(text) if text else ""
+        existing_part_files_on_disk = [record.path for record in latest_parts if record.script_hash == current_script_hash]
+        logger.debug(f"Part manifest lists {len(latest_parts)} parts of the latest generation ({len(existing_part_files_on_disk)} of this script)")
 
         # Check if script was changed (flag set in prepare phase)
         script_changed = audio_state.get("script_changed", False)
+        previous_parts: List[PartRecord] = []
+        if script_changed or (latest_parts and not existing_part_files_on_disk):
+            # Hand the parts of the other script to the new generation instead of resuming from them:
+            # parts of unchanged turns are reused and the other part files are deleted
+            previous_parts = latest_parts
+            existing_part_files_on_disk = []
+            logger.info(f"{len(previous_parts)} existing part files will be diffed against the new script")
+
+        has_existing_parts_on_disk = len(existing_part_files_on_disk) > 0
         if script_changed:
             logger.info("Script changed detected (from prepare phase) - will start from part 1")
 
-            # CRITICAL: Clear existing part files on disk when script changes
-            if temp_dir.exists():
-                logger.info(f"Script changed - cleaning up existing part files in {temp_dir}")
-                for temp_subdir in temp_dir.glob("stream_*"):
-                    if temp_subdir.is_dir():
-                        for part_file in temp_subdir.glob("part_*.wav"):
-                            try:
-                                part_file.unlink()
-                                logger.info(f"Deleted old part file: {part_file.name}")
-                            except Exception as e:
-                                logger.warning(f"Failed to delete {part_file}: {e}")
-                # Re-scan after cleanup
-                existing_part_files_on_disk = []
-                has_existing_parts_on_disk = False
-                logger.info("Cleared all existing part files due to script change")
-
             # CRITICAL: Also clear old final audio files when script changes
             output_dir = user_session.get_output_dir()
             if output_dir.exists():
                 logger.info(f"Script changed - cleaning up existing final audio files in {output_dir}")
-                for audio_file in output_dir.glob("audio_*.wav"):
+                for audio_file in find_audio_files(output_dir):
                     try:
                         audio_file.unlink()
                         logger.info(f"Deleted old final audio file: {audio_file.name}")
@@ -606,7 +675,7 @@ class PaperPodcastApp:
             # Check if final audio exists (generation might have completed)
             output_dir = user_session.get_output_dir()
             final_audio_found = None
-            for audio_file in output_dir.glob("audio_*.wav"):
+            for audio_file in find_audio_files(output_dir):
                 if audio_file.exists():
                     final_audio_found = str(audio_file)
                     break
@@ -623,26 +692,8 @@ class PaperPodcastApp:
                 yield None, user_session, complete_html, final_audio_found, browser_state
                 return
 
-            # Combine streaming_parts from browser_state with discovered files on disk
-            streaming_parts = audio_state.get("streaming_parts", [])
-            all_potential_parts = streaming_parts + existing_part_files_on_disk
-
-            # Remove duplicates and filter valid existing parts
-            valid_existing_parts = []
-            seen_parts = set()
-            for part_path in all_potential_parts:
-                if part_path and os.path.exists(part_path) and part_path not in seen_parts:
-                    valid_existing_parts.append(part_path)
-                    seen_parts.add(part_path)
-
-            # Sort by part number to ensure correct order
-            def extract_part_number(path):
-                import re
-
-                match = re.search(r"part_(\d+)", os.path.basename(path))
-                return int(match.group(1)) if match else 0
-
-            valid_existing_parts.sort(key=extract_part_number)
+            # The part manifest lists the completed parts of this script in turn order
+            valid_existing_parts = existing_part_files_on_disk
 
             if valid_existing_parts:
                 resume_from_part = len(valid_existing_parts)
@@ -653,13 +704,15 @@ class PaperPodcastApp:
                 logger.info(f"Resume: Existing parts: {[os.path.basename(p) for p in valid_existing_parts]}")
 
                 # Use true resume functionality
-                yield from self.generate_podcast_audio_streaming_with_browser_state_and_resume(text, user_session, browser_state, resume_from_part, valid_existing_parts, progress)
+                async for outputs in self.generate_podcast_audio_streaming_with_browser_state_and_resume(text, user_session, browser_state, resume_from_part, valid_existing_parts, progress):
+                    yield outputs
                 return
 
             logger.info("Resume: No valid existing parts found, starting from beginning")
 
         # Start new generation from beginning
-        yield from self.generate_podcast_audio_streaming_with_browser_state_and_resume(text, user_session, browser_state, 0, [], progress)
+        async for outputs in self.generate_podcast_audio_streaming_with_browser_state_and_resume(text, user_session, browser_state, 0, [], progress, previous_parts):
+            yield outputs
 
     def set_openai_api_key(self, api_key: str, user_session: UserSession):
         """Set the OpenAI API key for the specific user session."""
@@ -855,14 +908,48 @@ class PaperPodcastApp:
         Returns:
             int: Estimated number of audio parts
         """
-        import re
+        # Use the same (cached) turn list as audio generation, so the progress total matches the generated parts
+        return max(1, len(get_global_script_parser().parse(text)))
 
-        # Count the number of character dialogue lines (四国めたん:, ずんだもん:, etc.)
-        character_lines = re.findall(r"^[^:]+:", text, re.MULTILINE)
-        estimated_parts = len(character_lines)
+    def _predict_turns(self, text: str) -> List[Tuple[float, float]]:
+        """
+        Predict the audio duration and synthesis time of each turn of the script.
 
-        # Minimum 1 part, and add some buffer for safety
-        return max(1, estimated_parts)
+        Args:
+            text (str): The podcast script text
+
+        Returns:
+            List[Tuple[float, float]]: Predicted (audio seconds, synthesis seconds) of each turn
+        """
+        default_style_id = STYLE_ID_BY_NAME[DISPLAY_NAMES[0]]
+        estimates = []
+        for turn in get_global_script_parser().parse(text):
+            style_id = STYLE_ID_BY_NAME.get(turn.speaker, default_style_id)
+            chars = len(turn.text)
+            estimates.append((synthesis_throughput.predict_audio_seconds(style_id, chars), synthesis_throughput.predict_synthesis_seconds(style_id, chars)))
+        return estimates
+
+    def _estimate_remaining_seconds(self, turn_estimates: List[Tuple[float, float]], resume_from_part: int, completed_parts: int, elapsed_seconds: float) -> float:
+        """
+        Estimate the remaining time of an audio generation.
+
+        The throughput model already follows the synthesis speed of this host, so the
+        pace observed in this job only slows the estimate down (waiting for other
+        sessions sharing the engine) and never speeds it up (reused parts finish instantly).
+
+        Args:
+            turn_estimates (List[Tuple[float, float]]): Predicted (audio seconds, synthesis seconds) of each turn
+            resume_from_part (int): Number of parts restored before this job started
+            completed_parts (int): Number of parts completed so far, including restored ones
+            elapsed_seconds (float): Seconds since this job started
+
+        Returns:
+            float: Estimated remaining seconds
+        """
+        done_seconds = sum(synthesis_seconds for _, synthesis_seconds in turn_estimates[resume_from_part:completed_parts])
+        remaining_seconds = sum(synthesis_seconds for _, synthesis_seconds in turn_estimates[completed_parts:])
+        pace = max(1.0, elapsed_seconds / done_seconds) if done_seconds > 0 else 1.0
+        return remaining_seconds * pace
 
     def _create_progress_html(
         self,
@@ -871,6 +958,10 @@ class PaperPodcastApp:
         status_message: str,
         is_completed: bool = False,
         start_time: Optional[float] = None,
+        queue_status: Optional[Dict[str, Any]] = None,
+        playlist_url: Optional[str] = None,
+        remaining_seconds: Optional[float] = None,
+        total_audio_seconds: Optional[float] = None,
     ) -> str:
         """
         Create comprehensive progress display with progress bar, elapsed time, and estimated remaining time.
@@ -881,6 +972,10 @@ class PaperPodcastApp:
             status_message (str): Status message to display
             is_completed (bool): Whether the generation is completed
             start_time (Optional[float]): Start time timestamp for calculating elapsed time
+            queue_status (Optional[Dict[str, Any]]): Synthesis queueing status of the session (shown while other sessions are generating)
+            playlist_url (Optional[str]): URL of the HLS playlist of the generated audio (linked when segmented streaming is enabled)
+            remaining_seconds (Optional[float]): Predicted remaining time (estimated from the part count and elapsed time if None)
+            total_audio_seconds (Optional[float]): Predicted duration of the whole audio
 
         Returns:
             str: HTML string for progress display
@@ -906,11 +1001,15 @@ class PaperPodcastApp:
 
             if is_completed:
                 time_info = f" | 完了時間: {elapsed_minutes:02d}:{elapsed_seconds:02d}"
-            elif safe_current_part > 0 and not is_completed:
-                # 推定残り時間を計算（現在のペースに基づく）
-                avg_time_per_part = elapsed_time / safe_current_part
-                remaining_parts = safe_total_parts - safe_current_part
-                estimated_remaining = avg_time_per_part * remaining_parts
+            elif remaining_seconds is not None or safe_current_part > 0:
+                if remaining_seconds is not None:
+                    # スループットモデルによる予測
+                    estimated_remaining = remaining_seconds
+                else:
+                    # 推定残り時間を計算（現在のペースに基づく）
+                    avg_time_per_part = elapsed_time / safe_current_part
+                    remaining_parts = safe_total_parts - safe_current_part
+                    estimated_remaining = avg_time_per_part * remaining_parts
                 remaining_minutes = int(estimated_remaining // 60)
                 remaining_seconds = int(estimated_remaining % 60)
 
@@ -918,6 +1017,23 @@ class PaperPodcastApp:
             else:
                 time_info = f" | 経過: {elapsed_minutes:02d}:{elapsed_seconds:02d}"
 
+        # 予測される音声全体の再生時間
+        if total_audio_seconds is not None and not is_completed:
+            time_info += f" | 総再生時間: 約{int(total_audio_seconds // 60):02d}:{int(total_audio_seconds % 60):02d}"
+
+        # 他のセッションと合成エンジンを共有している場合は待ち状況を表示
+        if queue_status and not is_completed and queue_status.get("active_sessions", 0) > 1:
+            time_info += f" | 待ち行列: {queue_status['queue_depth']}件 (全体 {queue_status['total_queued']}件) | 平均待ち: {queue_status['average_wait']:.1f}秒"
+
+        # 生成済みの範囲をシーク再生できるHLSプレイリストへのリンク
+        playlist_html = ""
+        if playlist_url:
+            playlist_html = f"""
+            <div style="font-size: 12px; margin-top: 4px;">
+                <a href="{playlist_url}" target="_blank">HLSプレイリスト (生成済みの範囲を再生)</a>
+            </div>
+            """
+
         # プログレスバーのCSS（余分な枠線なし）
         progress_bar_html = f"""
         <div style="width: 100%; background-color: var(--neutral-100, #f3f4f6);
@@ -946,6 +1062,7 @@ class PaperPodcastApp:
                 </span>
             </div>
             {progress_bar_html}
+            {playlist_html}
         </div>
         """
 
@@ -1662,7 +1779,7 @@ class PaperPodcastApp:
                     audio_output,
                     browser_state,
                 ],
-                concurrency_limit=1,  # 音声生成は1つずつ実行
+                concurrency_limit=AUDIO_GENERATION_CONCURRENCY,  # 合成エンジンはスケジューラーがセッション間で順番に割り当てる
                 concurrency_id="audio_queue",  # 音声生成用キューID
                 show_progress="hidden",  # ストリーミング表示では独自の進捗バーを表示しない
                 api_name="generate_streaming_audio",  # APIエンドポイント名（デバッグ用）
@@ -1865,7 +1982,7 @@ class PaperPodcastApp:
     def _check_disk_for_final_audio(self, user_session: UserSession, browser_state: Dict[str, Any]) -> bool:
         """Check disk for final audio files and update browser state if found."""
         output_dir = user_session.get_output_dir()
-        for audio_file in output_dir.glob("audio_*.wav"):
+        for audio_file in find_audio_files(output_dir):
             if audio_file.exists():
                 # Update browser state with the discovered final audio path
                 browser_state["audio_generation_state"]["final_audio_path"] = str(audio_file)
@@ -2021,6 +2138,8 @@ class PaperPodcastApp:
         browser_state["audio_generation_state"]["progress"] = 0.0
         browser_state["audio_generation_state"]["generation_id"] = None
         browser_state["audio_generation_state"]["start_time"] = None
+        # 「音声を生成」が押された時刻（最初の音声が届くまでの時間の計測用）
+        browser_state["audio_generation_state"]["requested_at"] = time.time()
 
         logger.debug(f"Audio generation prepared with script: {podcast_text[:50]}...")
 
@@ -2106,8 +2225,8 @@ class PaperPodcastApp:
         if not final_audio:
             output_dir = user_session.get_output_dir()
             if output_dir.exists():
-                # Look for audio_*.wav files (completed audio files)
-                audio_files = list(output_dir.glob("audio_*.wav"))
+                # Look for audio_* files of any output format (completed audio files)
+                audio_files = list(find_audio_files(output_dir))
                 if audio_files:
                     # Get the most recent audio file
                     final_audio = str(max(audio_files, key=lambda p: p.stat().st_mtime))
@@ -2213,6 +2332,29 @@ class PaperPodcastApp:
         )
 
 
+def serve_hls_file(token: str, filename: str) -> FileResponse:
+    """
+    Serve a playlist or segment of the HLS directory registered for a session token.
+
+    Args:
+        token: Token handed to the session that generated the audio
+        filename: Playlist or segment file name
+
+    Returns:
+        FileResponse: The requested file
+
+    Raises:
+        HTTPException: If the token is unknown or the file may not be served
+    """
+    path = hls_playlists.resolve(token, filename)
+    if path is None:
+        raise HTTPException(status_code=404)
+    if filename == PLAYLIST_NAME:
+        # The EVENT playlist keeps growing while synthesis progresses
+        return FileResponse(path, media_type="application/vnd.apple.mpegurl", headers={"Cache-Control": "no-cache"})
+    return FileResponse(path, media_type="video/mp2t")
+
+
 def main() -> None:
     """
     Main function to launch the Gradio app.
@@ -2258,6 +2400,9 @@ def main() -> None:
         "quiet": not args.debug,
         "favicon_path": ("assets/favicon.ico" if Path("assets/favicon.ico").exists() else None),
     }
+    if HLS_STREAMING:
+        # Serve HLS playlists and segments by session token instead of exposing the output directories
+        launch_kwargs["app_kwargs"] = {"routes": [APIRoute(f"{HLS_ROUTE}/{{token}}/{{filename}}", serve_hls_file, methods=["GET"])]}
 
     # Add authentication for production environment
     if not args.debug and not E2E_TEST_MODE:
@@ -0,0 +1,317 @@
+"""Module providing caches for synthesized audio.
+
+Provides a disk-backed, content-addressed cache of synthesized utterances that
+can be shared between sessions and worker processes, and an in-memory cache of
+text analysis results (AudioQuery) that is independent of waveform synthesis.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from yomitalk.utils.logger import logger
+
+# Directory shared by all sessions and processes for cached utterances
+UTTERANCE_CACHE_DIR = Path(os.environ.get("YOMITALK_UTTERANCE_CACHE_DIR", "data/cache/utterances"))
+# Maximum cache size in MB (0 disables the cache)
+UTTERANCE_CACHE_MAX_MB = int(os.environ.get("YOMITALK_UTTERANCE_CACHE_MAX_MB", "512"))
+# Maximum number of texts whose analysis results are kept in memory (0 disables the cache)
+AUDIO_QUERY_CACHE_SIZE = int(os.environ.get("YOMITALK_AUDIO_QUERY_CACHE_SIZE", "2048"))
+
+
+class UtteranceCache:
+    """Size-bounded LRU cache of synthesized WAV data keyed by synthesis inputs.
+
+    Entries are written atomically (temporary file + rename), so readers in
+    other processes never observe partial files. Recency is tracked with the
+    file modification time, and eviction is serialized across processes with
+    an exclusive lock on a lock file in the cache directory.
+    """
+
+    # Fraction of max_bytes to shrink to when evicting, to avoid evicting on every write
+    EVICTION_TARGET_RATIO = 0.9
+    # Re-scan the directory after this many writes to notice entries added by other processes
+    RESCAN_INTERVAL = 64
+    # Log hit/miss statistics every N lookups
+    STATS_LOG_INTERVAL = 100
+    # Temporary files older than this are leftovers of crashed writers
+    STALE_TEMP_SECONDS = 3600
+
+    def __init__(self, cache_dir: Path = UTTERANCE_CACHE_DIR, max_bytes: int = UTTERANCE_CACHE_MAX_MB * 1024 * 1024) -> None:
+        """
+        Initialize the utterance cache.
+
+        Args:
+            cache_dir: Directory holding cached WAV files
+            max_bytes: Maximum total size of cached files in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._writes_since_scan = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._approx_bytes = sum(size for _, _, size in self._scan_entries())
+
+    @staticmethod
+    def make_key(text: str, style_id: int, speed_scale: float, engine_version: str) -> str:
+        """
+        Build the content address of an utterance.
+
+        Args:
+            text: Text passed to the synthesizer (after English-to-katakana conversion)
+            style_id: VOICEVOX style ID
+            speed_scale: Speech speed scale
+            engine_version: VOICEVOX Core and user dictionary version
+
+        Returns:
+            str: Hex digest identifying the utterance
+        """
+        payload = json.dumps([text, style_id, round(speed_scale, 4), engine_version], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a cached utterance and mark it as recently used.
+
+        Args:
+            key: Key created by make_key()
+
+        Returns:
+            Optional[bytes]: Cached WAV data, or None on a miss
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            # Missing, or evicted by another process between lookup and read
+            data = b""
+        if data:
+            with contextlib.suppress(OSError):
+                os.utime(path)
+
+        with self._lock:
+            if data:
+                self.hits += 1
+            else:
+                self.misses += 1
+            lookups = self.hits + self.misses
+        if lookups % self.STATS_LOG_INTERVAL == 0:
+            self._log_stats()
+
+        return data or None
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store an utterance, evicting least recently used entries if the cache is full.
+
+        Args:
+            key: Key created by make_key()
+            data: WAV data to store
+        """
+        if not data or len(data) > self.max_bytes:
+            return
+
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write utterance cache entry: {e}")
+            return
+
+        with self._lock:
+            self._approx_bytes += len(data)
+            self._writes_since_scan += 1
+            needs_eviction = self._approx_bytes > self.max_bytes or self._writes_since_scan >= self.RESCAN_INTERVAL
+        if needs_eviction:
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for capacity planning.
+
+        Returns:
+            Dict[str, Any]: Counters of this process and the approximate cache size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "bytes": self._approx_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _log_stats(self) -> None:
+        """Log the current hit/miss counters."""
+        stats = self.stats()
+        logger.info(
+            f"Utterance cache (pid={os.getpid()}): hits={stats['hits']}, misses={stats['misses']}, "
+            f"hit_rate={stats['hit_rate']:.1%}, size={stats['bytes'] // (1024 * 1024)}/{stats['max_bytes'] // (1024 * 1024)} MB"
+        )
+
+    def _path_for(self, key: str) -> Path:
+        """Get the file path of a cache entry (sharded by key prefix)."""
+        return self.cache_dir / key[:2] / f"{key}.wav"
+
+    def _scan_entries(self) -> List[Tuple[float, Path, int]]:
+        """
+        List cache entries on disk.
+
+        Returns:
+            List[Tuple[float, Path, int]]: (last use time, path, size) per entry
+        """
+        entries = []
+        for shard in self.cache_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp") and time.time() - stat.st_mtime > self.STALE_TEMP_SECONDS:
+                    # Left behind by a writer that crashed before renaming
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+                    continue
+                if not entry.name.endswith(".wav"):
+                    continue
+                entries.append((stat.st_mtime, Path(entry.path), stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits its size budget."""
+        lock_path = self.cache_dir / ".lock"
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries = self._scan_entries()
+                total_bytes = sum(size for _, _, size in entries)
+                evicted = 0
+                if total_bytes > self.max_bytes:
+                    target_bytes = self.max_bytes * self.EVICTION_TARGET_RATIO
+                    for _, path, size in sorted(entries):
+                        if total_bytes <= target_bytes:
+                            break
+                        try:
+                            path.unlink()
+                        except OSError:
+                            continue
+                        total_bytes -= size
+                        evicted += 1
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        with self._lock:
+            self._approx_bytes = total_bytes
+            self._writes_since_scan = 0
+            self.evictions += evicted
+        if evicted:
+            logger.debug(f"Evicted {evicted} utterance cache entries")
+
+
+class AudioQueryCache:
+    """In-memory LRU cache of AudioQuery objects per text and dictionary version.
+
+    The analysis stage (OpenJTalk plus the prosody models) only depends on the
+    text, the style and the user dictionary. Caching its result lets re-renders
+    with another speed_scale skip analysis entirely, and lets a style swap reuse
+    the accent phrases of any other style through mora-data replacement.
+    Cached queries must be treated as read-only; copy them before modifying.
+    """
+
+    def __init__(self, max_entries: int = AUDIO_QUERY_CACHE_SIZE) -> None:
+        """
+        Initialize the analysis cache.
+
+        Args:
+            max_entries: Maximum number of texts to keep
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Dict[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str, style_id: int, dictionary_version: str) -> Optional[Any]:
+        """
+        Get the cached AudioQuery of a text for a style.
+
+        Args:
+            text: Analyzed text
+            style_id: VOICEVOX style ID
+            dictionary_version: Version of the user dictionary used for analysis
+
+        Returns:
+            Optional[Any]: Cached AudioQuery, or None on a miss
+        """
+        with self._lock:
+            queries = self._entries.get((dictionary_version, text))
+            query = queries.get(style_id) if queries else None
+            if query is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((dictionary_version, text))
+            self.hits += 1
+            return query
+
+    def get_any_style(self, text: str, dictionary_version: str) -> Optional[Tuple[int, Any]]:
+        """
+        Get an AudioQuery of a text analyzed for any style.
+
+        Args:
+            text: Analyzed text
+            dictionary_version: Version of the user dictionary used for analysis
+
+        Returns:
+            Optional[Tuple[int, Any]]: (style_id, AudioQuery), or None if the text was never analyzed
+        """
+        with self._lock:
+            queries = self._entries.get((dictionary_version, text))
+            if not queries:
+                return None
+            return next(iter(queries.items()))
+
+    def put(self, text: str, style_id: int, dictionary_version: str, query: Any) -> None:
+        """
+        Store an AudioQuery, evicting the least recently used text if the cache is full.
+
+        Args:
+            text: Analyzed text
+            style_id: VOICEVOX style ID
+            dictionary_version: Version of the user dictionary used for analysis
+            query: AudioQuery to store
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            key = (dictionary_version, text)
+            self._entries.setdefault(key, {})[style_id] = query
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached analysis results."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,208 @@
+"""Module providing compressed encoding of generated audio.
+
+Encodes WAV files produced by audio generation into a compressed format with the
+ffmpeg binary. Encoding runs in a dedicated worker thread (ffmpeg itself runs as a
+separate process), so synthesis threads never wait for the encoder. When ffmpeg
+is not available or encoding fails, the WAV file is delivered unchanged.
+"""
+
+import atexit
+import contextlib
+import os
+import shutil
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from yomitalk.utils.logger import logger
+
+# Format of the final audio: "mp3", "opus", "aac" or "wav" (no encoding)
+OUTPUT_AUDIO_FORMAT = os.environ.get("YOMITALK_OUTPUT_AUDIO_FORMAT", "mp3").lower()
+# Bitrate passed to the encoder (speech stays clear well below music bitrates)
+OUTPUT_AUDIO_BITRATE = os.environ.get("YOMITALK_OUTPUT_AUDIO_BITRATE", "64k")
+# Also deliver compressed copies of the streaming parts (the WAV parts are kept for resume)
+ENCODE_STREAMING_PARTS = os.environ.get("YOMITALK_ENCODE_STREAMING_PARTS", "false").lower() == "true"
+# Keep the uncompressed final WAV next to the compressed file as an archive
+KEEP_WAV_ARCHIVE = os.environ.get("YOMITALK_KEEP_WAV_ARCHIVE", "false").lower() == "true"
+# Number of files encoded at the same time
+ENCODER_WORKERS = int(os.environ.get("YOMITALK_ENCODER_WORKERS", "1"))
+# Seconds a single encode may take before it is abandoned
+ENCODE_TIMEOUT = float(os.environ.get("YOMITALK_ENCODE_TIMEOUT", "600"))
+
+# File extension, ffmpeg muxer and codec arguments per output format
+ENCODER_SETTINGS: Dict[str, Tuple[str, str, List[str]]] = {
+    "mp3": (".mp3", "mp3", ["-c:a", "libmp3lame"]),
+    "opus": (".ogg", "ogg", ["-c:a", "libopus", "-application", "voip"]),
+    "aac": (".m4a", "ipod", ["-c:a", "aac", "-movflags", "+faststart"]),
+    # AAC in MPEG-TS, used for HLS segments
+    "mpegts": (".ts", "mpegts", ["-c:a", "aac"]),
+}
+# Extensions of audio files produced by audio generation, compressed formats first
+AUDIO_FILE_EXTENSIONS = (*(extension for extension, _, _ in ENCODER_SETTINGS.values()), ".wav")
+
+
+def find_audio_files(directory: Path, prefix: str = "audio_") -> List[Path]:
+    """
+    Find generated audio files of any supported format in a directory.
+
+    Args:
+        directory: Directory to search
+        prefix: File name prefix ("audio_" for final audio, "part_" for parts)
+
+    Returns:
+        List[Path]: Matching files, files of the configured output format first
+    """
+    if not directory.exists():
+        return []
+    preferred_extension = ENCODER_SETTINGS.get(OUTPUT_AUDIO_FORMAT, (".wav",))[0]
+    files = [path for path in directory.glob(f"{prefix}*") if path.suffix in AUDIO_FILE_EXTENSIONS]
+    return sorted(files, key=lambda path: (path.suffix != preferred_extension, path.name))
+
+
+class AudioEncoder:
+    """Encoder converting WAV files into the configured compressed format in the background."""
+
+    def __init__(
+        self,
+        output_format: str = OUTPUT_AUDIO_FORMAT,
+        bitrate: str = OUTPUT_AUDIO_BITRATE,
+        max_workers: int = ENCODER_WORKERS,
+        ffmpeg_path: Optional[str] = None,
+        timeout: float = ENCODE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the encoder.
+
+        Args:
+            output_format: "mp3", "opus", "aac" or "wav" (no encoding)
+            bitrate: Target bitrate passed to ffmpeg
+            max_workers: Number of files encoded at the same time
+            ffmpeg_path: Path of the ffmpeg binary (looked up in PATH when omitted)
+            timeout: Seconds a single encode may take
+        """
+        if output_format != "wav" and output_format not in ENCODER_SETTINGS:
+            logger.warning(f"Unknown output audio format '{output_format}', keeping WAV")
+            output_format = "wav"
+
+        self.output_format = output_format
+        self.bitrate = bitrate
+        self.timeout = timeout
+        self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
+        if output_format != "wav" and self.ffmpeg_path is None:
+            logger.warning("ffmpeg not found, generated audio is delivered as WAV")
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="audio-encoder")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether files are actually encoded (False delivers WAV as is)."""
+        return self.can_encode(self.output_format)
+
+    def can_encode(self, output_format: str) -> bool:
+        """Check whether files can be encoded into a format."""
+        return output_format in ENCODER_SETTINGS and self.ffmpeg_path is not None
+
+    def submit(self, wav_path: Union[str, Path], keep_source: bool = False, output_format: Optional[str] = None) -> "Future[str]":
+        """
+        Queue a WAV file for encoding.
+
+        Args:
+            wav_path: WAV file to encode
+            keep_source: Keep the WAV file after encoding
+            output_format: Format to encode into (the configured output format when omitted)
+
+        Returns:
+            Future[str]: Future resolved with the path of the encoded file (the WAV path if not encoded)
+        """
+        if not self.can_encode(output_format or self.output_format):
+            future: Future[str] = Future()
+            future.set_result(str(wav_path))
+            return future
+        return self._executor.submit(self.encode, wav_path, keep_source, output_format)
+
+    def encode(self, wav_path: Union[str, Path], keep_source: bool = False, output_format: Optional[str] = None) -> str:
+        """
+        Encode a WAV file with ffmpeg.
+
+        The encoded file is written under a temporary name and renamed when complete,
+        so readers never observe a partial file.
+
+        Args:
+            wav_path: WAV file to encode
+            keep_source: Keep the WAV file after encoding
+            output_format: Format to encode into (the configured output format when omitted)
+
+        Returns:
+            str: Path of the encoded file, or the WAV path if encoding failed
+        """
+        output_format = output_format or self.output_format
+        if not self.can_encode(output_format) or self.ffmpeg_path is None:
+            return str(wav_path)
+
+        source = Path(wav_path)
+        extension, muxer, codec_args = ENCODER_SETTINGS[output_format]
+        target = source.with_suffix(extension)
+        temp_target = target.with_name(target.name + ".partial")
+        command = [
+            self.ffmpeg_path,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-i",
+            str(source),
+            *codec_args,
+            "-b:a",
+            self.bitrate,
+            "-f",
+            muxer,
+            str(temp_target),
+        ]
+
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=self.timeout, check=False)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.decode("utf-8", errors="replace").strip() or f"exit code {result.returncode}")
+            os.replace(temp_target, target)
+        except Exception as e:
+            logger.error(f"Audio encoding failed, delivering WAV instead ({source.name}): {e}")
+            with contextlib.suppress(OSError):
+                temp_target.unlink()
+            return str(source)
+
+        if not keep_source:
+            with contextlib.suppress(OSError):
+                source.unlink()
+        logger.debug(f"Encoded {source.name} to {output_format}: {target.stat().st_size // 1024} KB")
+        return str(target)
+
+    def shutdown(self) -> None:
+        """Stop the encoder worker after the queued files are encoded."""
+        self._executor.shutdown(wait=True)
+        logger.debug("Audio encoder shut down")
+
+
+# Global audio encoder shared by all sessions (None until initialized)
+_global_audio_encoder: Optional[AudioEncoder] = None
+
+
+def get_global_audio_encoder() -> Optional[AudioEncoder]:
+    """Get the global audio encoder, or None when it has not been initialized."""
+    return _global_audio_encoder
+
+
+def initialize_global_audio_encoder() -> AudioEncoder:
+    """
+    Initialize the global audio encoder.
+
+    Returns:
+        AudioEncoder: The global encoder
+    """
+    global _global_audio_encoder
+    if _global_audio_encoder is None:
+        logger.info(f"Initializing global audio encoder (format: {OUTPUT_AUDIO_FORMAT})")
+        _global_audio_encoder = AudioEncoder()
+        atexit.register(_global_audio_encoder.shutdown)
+    return _global_audio_encoder
@@ -3,19 +3,28 @@
 Provides functionality for generating audio from text using VOICEVOX Core.
 """
 
+import asyncio
+import contextlib
+import dataclasses
 import datetime
-import io
+import hashlib
+import importlib.metadata
 import os
+import queue
 import re
+import shutil
+import threading
+import time
 import unicodedata
 import uuid
-import wave
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple
+from typing import AbstractSet, Any, AsyncGenerator, Callable, Deque, Dict, Generator, Iterator, List, Optional, Tuple
 
-import e2k
 
+from voicevox_core import AudioQuery
 from voicevox_core.blocking import (
     Onnxruntime,
     OpenJtalk,
@@ -24,19 +33,54 @@ from voicevox_core.blocking import (
     VoiceModelFile,
 )
 from yomitalk.common.character import (
-    DISPLAY_NAMES,
-    REQUIRED_MODEL_FILES,
     STYLE_ID_BY_NAME,
     CHARACTER_BY_STYLE_ID,
     Character,
 )
+from yomitalk.components.audio_cache import UTTERANCE_CACHE_MAX_MB, AudioQueryCache, UtteranceCache
+from yomitalk.components.audio_encoder import ENCODE_STREAMING_PARTS, KEEP_WAV_ARCHIVE, get_global_audio_encoder
+from yomitalk.components.hls_segmenter import HLS_STREAMING, HlsSegmenter, hls_playlists, playlist_url
+from yomitalk.components.katakana_converter import get_global_katakana_converter
+from yomitalk.components.part_manifest import PartManifest, PartRecord, script_hash
+from yomitalk.components.part_reuse import plan_part_reuse, turn_keys
+from yomitalk.components.script_parser import get_global_script_parser
+from yomitalk.components.synthesis_pool import get_global_synthesis_pool
+from yomitalk.components.synthesis_scheduler import get_global_synthesis_scheduler
+from yomitalk.prompt_manager import PromptManager
+from yomitalk.utils.audio_postprocess import AudioPostProcessor
 from yomitalk.utils.logger import logger
+from yomitalk.utils.metrics import synthesis_throughput
+from yomitalk.utils.wav_utils import StreamingWavWriter, combine_wav_data, get_wav_duration
 from yomitalk.utils.text_utils import (
     is_romaji_readable,
-    calculate_text_similarity,
 )
 
 
+try:
+    VOICEVOX_CORE_VERSION = importlib.metadata.version("voicevox_core")
+except importlib.metadata.PackageNotFoundError:
+    VOICEVOX_CORE_VERSION = "unknown"
+
+# Run a warmup synthesis in the background after startup (false marks the engine ready immediately)
+WARMUP_ENABLED = os.environ.get("YOMITALK_WARMUP", "true").lower() == "true"
+# Text synthesized for each style during warmup
+WARMUP_TEXT = "こんにちは。音声合成の準備をしています。"
+# Maximum number of voice models kept in memory per process (0 keeps every used model loaded)
+MAX_LOADED_VOICE_MODELS = int(os.environ.get("YOMITALK_MAX_LOADED_VOICE_MODELS", "4"))
+# Render audio in frame windows as they are produced instead of synthesizing whole utterances
+STREAMING_RENDER = os.environ.get("YOMITALK_STREAMING_RENDER", "false").lower() == "true"
+# Number of audio frames per rendered window (VOICEVOX renders about 93.75 frames per second)
+RENDER_WINDOW_FRAMES = int(os.environ.get("YOMITALK_RENDER_WINDOW_FRAMES", "94"))
+# Number of leading turns of every new audio generation job synthesized in the scheduler's priority lane
+PRIORITY_TURNS = int(os.environ.get("YOMITALK_PRIORITY_TURNS", "2"))
+# Character budget of a synthesis chunk; longer turns are split at sentence boundaries (0 disables splitting)
+SYNTHESIS_CHUNK_CHARS = int(os.environ.get("YOMITALK_SYNTHESIS_CHUNK_CHARS", "120"))
+# Seconds between checks of the user dictionary file for changes (0 disables hot reloading)
+USER_DICT_RELOAD_INTERVAL = float(os.environ.get("YOMITALK_USER_DICT_RELOAD_INTERVAL", "5"))
+# Subdirectory of a stream directory holding part files reused from the previous version of the script until they are reached
+REUSABLE_PARTS_DIRNAME = "reusable"
+
+
 class VoicevoxCoreManager:
     """Global VOICEVOX Core manager shared across all users."""
 
@@ -53,6 +97,34 @@ class VoicevoxCoreManager:
         self.core_initialized = False
         self.core_synthesizer: Optional[Synthesizer] = None
         self.user_dict_words: set = set()
+        # Version of the loaded user dictionary (content hash, empty when not loaded)
+        self.dictionary_version = ""
+        self.open_jtalk: Optional[OpenJtalk] = None
+        # Modification signature (mtime, size) of the loaded dictionary file, used by the watcher
+        self._dictionary_signature: Optional[Tuple[int, int]] = None
+        self._dictionary_lock = threading.Lock()
+        self._dictionary_watcher_stop = threading.Event()
+
+        # Disk-backed cache of synthesized utterances shared across sessions and processes
+        self.utterance_cache: Optional[UtteranceCache] = UtteranceCache() if UTTERANCE_CACHE_MAX_MB > 0 else None
+        # In-memory cache of text analysis results (AudioQuery), independent of speed and waveform
+        self.audio_query_cache = AudioQueryCache()
+
+        # Voice models are loaded on first use of one of their styles
+        self.voice_model_index: Dict[int, Path] = {}
+        self.style_names: Dict[int, str] = {}
+        self._loaded_models: "OrderedDict[Path, Any]" = OrderedDict()
+        self._models_in_use: Dict[Path, int] = {}
+        self._model_lock = threading.RLock()
+
+        # Warmup state: "cold" -> "warming" -> "ready" ("unavailable" when VOICEVOX Core is not initialized)
+        self.warmup_state = "cold"
+        # Real-time factor (synthesis time / audio duration) measured per style during warmup
+        self.warmup_rtf: Dict[int, float] = {}
+        self._ready_event = threading.Event()
+
+        # Dedicated thread for the asyncio facade, so awaiting synthesis never occupies a request thread
+        self._async_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voicevox-async")
 
         # Initialize VOICEVOX Core
         self._init_voicevox_core()
@@ -84,47 +156,259 @@ class VoicevoxCoreManager:
             # 4. Initialize Synthesizer
             self.core_synthesizer = Synthesizer(ort, open_jtalk)
 
-            # 5. Load required voice models
-            loaded_count = self._load_voice_models()
+            # 5. Index voice models by style ID (models are loaded on first use)
+            self._index_voice_models()
 
-            if loaded_count > 0:
-                logger.info(f"Successfully loaded {loaded_count}/{len(REQUIRED_MODEL_FILES)} voice models")
+            if self.voice_model_index:
+                logger.info(f"Indexed {len(self.style_names)} styles in {len(set(self.voice_model_index.values()))} voice models")
                 self.core_initialized = True
+                # Load the default characters in the background to keep first-request latency low
+                self._start_preload([PromptManager.DEFAULT_CHARACTER1.style_id, PromptManager.DEFAULT_CHARACTER2.style_id])
             else:
-                logger.error("No voice models could be loaded")
+                logger.error("No voice models could be found")
 
         except Exception as e:
             logger.error(f"Failed to initialize VOICEVOX Core: {e}")
             self.core_synthesizer = None
 
-    def _load_voice_models(self) -> int:
+    def _index_voice_models(self) -> None:
+        """Build the style ID to voice model file index from the model metadata."""
+        self.voice_model_index = {}
+        self.style_names = {}
+
+        for model_path in sorted(self.VOICEVOX_MODELS_PATH.glob("*.vvm")):
+            try:
+                # Opening a model file only reads its metadata
+                with VoiceModelFile.open(str(model_path)) as model:
+                    for character_meta in model.metas:
+                        for style in character_meta.styles:
+                            self.voice_model_index[style.id] = model_path
+                            self.style_names[style.id] = f"{character_meta.name}（{style.name}）"
+            except Exception as e:
+                logger.error(f"Failed to read voice model metadata {model_path.name}: {e}")
+
+        # Fall back to the known model files of the built-in characters
+        for character in Character:
+            model_path = self.VOICEVOX_MODELS_PATH / character.model_file
+            if character.style_id not in self.voice_model_index and model_path.exists():
+                self.voice_model_index[character.style_id] = model_path
+                self.style_names[character.style_id] = character.display_name
+
+    def _start_preload(self, style_ids: List[int]) -> None:
         """
-        Load required voice models for VOICEVOX.
+        Load voice models in a background thread.
 
-        Returns:
-            int: Number of successfully loaded models
+        Args:
+            style_ids: Style IDs whose voice models should be loaded
         """
-        if self.core_synthesizer is None:
-            return 0
 
-        loaded_count = 0
+        def preload() -> None:
+            for style_id in style_ids:
+                self._ensure_voice_model(style_id)
 
-        for model_file in REQUIRED_MODEL_FILES:
-            model_path = self.VOICEVOX_MODELS_PATH / model_file
+        threading.Thread(target=preload, name="voicevox-model-preload", daemon=True).start()
 
-            if not model_path.exists():
-                logger.warning(f"Required model file not found: {model_file}")
-                continue
+    def _ensure_voice_model(self, style_id: int) -> bool:
+        """
+        Load the voice model of a style if it is not loaded yet.
+
+        Loading is serialized, so concurrent requests for the same model load it
+        only once. When more than MAX_LOADED_VOICE_MODELS models are resident,
+        the least recently used model that is not in use is unloaded.
+
+        Args:
+            style_id: VOICEVOX style ID
+
+        Returns:
+            bool: True if the model is loaded
+        """
+        model_path = self.voice_model_index.get(style_id)
+        if model_path is None or self.core_synthesizer is None:
+            logger.warning(f"No voice model found for style ID {style_id}")
+            return False
+
+        with self._model_lock:
+            if model_path in self._loaded_models:
+                self._loaded_models.move_to_end(model_path)
+                return True
 
             try:
                 with VoiceModelFile.open(str(model_path)) as model:
                     self.core_synthesizer.load_voice_model(model)
-                    loaded_count += 1
-                    logger.debug(f"Loaded voice model: {model_file}")
+                    self._loaded_models[model_path] = model.id
+                logger.info(f"Loaded voice model: {model_path.name} (style_id: {style_id})")
+            except Exception as e:
+                logger.error(f"Failed to load model {model_path.name}: {e}")
+                return False
+
+            self._unload_least_recently_used_models()
+            return True
+
+    def _unload_least_recently_used_models(self) -> None:
+        """Unload least recently used voice models until the resident model cap is met."""
+        if MAX_LOADED_VOICE_MODELS <= 0 or self.core_synthesizer is None:
+            return
+
+        for model_path in list(self._loaded_models):
+            if len(self._loaded_models) <= MAX_LOADED_VOICE_MODELS:
+                break
+            # Keep the model just loaded and models used by in-flight synthesis
+            if model_path == next(reversed(self._loaded_models)) or self._models_in_use.get(model_path, 0) > 0:
+                continue
+            try:
+                self.core_synthesizer.unload_voice_model(self._loaded_models[model_path])
+                del self._loaded_models[model_path]
+                logger.info(f"Unloaded voice model: {model_path.name}")
             except Exception as e:
-                logger.error(f"Failed to load model {model_file}: {e}")
+                logger.warning(f"Failed to unload model {model_path.name}: {e}")
+
+    @contextlib.contextmanager
+    def _use_voice_model(self, style_id: int) -> Iterator[bool]:
+        """
+        Keep the voice model of a style loaded while synthesizing with it.
+
+        Args:
+            style_id: VOICEVOX style ID
+
+        Yields:
+            bool: True if the model is loaded
+        """
+        model_path = self.voice_model_index.get(style_id)
+        if model_path is None:
+            yield False
+            return
+
+        with self._model_lock:
+            self._models_in_use[model_path] = self._models_in_use.get(model_path, 0) + 1
+        try:
+            yield self._ensure_voice_model(style_id)
+        finally:
+            with self._model_lock:
+                self._models_in_use[model_path] -= 1
+
+    def start_warmup(self) -> None:
+        """Start warming up VOICEVOX Core and e2k in a background thread."""
+        if not self.core_initialized:
+            self.warmup_state = "unavailable"
+            return
+        if not WARMUP_ENABLED:
+            self.warmup_state = "ready"
+            self._ready_event.set()
+            return
+
+        self.warmup_state = "warming"
+        threading.Thread(target=self._warmup, name="voicevox-warmup", daemon=True).start()
+
+    def _warmup(self) -> None:
+        """
+        Run a warmup synthesis for each loaded style and a warm e2k conversion.
+
+        This pays the one-time costs (ONNX session warm-up, OpenJTalk dictionary
+        page-in and e2k model load) before the first user request, and records the
+        real-time factor of each style.
+        """
+        warmup_start = time.monotonic()
+        try:
+            e2k_start = time.monotonic()
+            get_global_katakana_converter().convert("warmup")
+            logger.info(f"e2k warmup finished in {time.monotonic() - e2k_start:.2f}s")
+
+            # Make sure the default characters are loaded, then warm every built-in style of the loaded models
+            for character in (PromptManager.DEFAULT_CHARACTER1, PromptManager.DEFAULT_CHARACTER2):
+                self._ensure_voice_model(character.style_id)
+            with self._model_lock:
+                loaded_models = set(self._loaded_models)
+            style_ids = [character.style_id for character in Character if self.voice_model_index.get(character.style_id) in loaded_models]
+
+            for style_id in style_ids:
+                try:
+                    self._warmup_style(style_id)
+                except Exception as e:
+                    logger.warning(f"Warmup synthesis for style {style_id} failed: {e}")
+        except Exception as e:
+            logger.warning(f"VOICEVOX warmup failed: {e}")
+        finally:
+            self.warmup_state = "ready"
+            self._ready_event.set()
+            logger.info(f"VOICEVOX engine ready (warmup took {time.monotonic() - warmup_start:.2f}s)")
+
+    def _warmup_style(self, style_id: int) -> None:
+        """
+        Synthesize the warmup text with a style and record its real-time factor.
+
+        The result bypasses the utterance cache so that the synthesizer itself is exercised.
+
+        Args:
+            style_id: VOICEVOX style ID
+        """
+        synthesizer = self.core_synthesizer
+        if synthesizer is None:
+            return
+
+        with self._use_voice_model(style_id) as model_loaded:
+            if not model_loaded:
+                return
+            synthesis_start = time.monotonic()
+            audio_query = self._get_audio_query(synthesizer, WARMUP_TEXT, style_id)
+            wav_data = synthesizer.synthesis(audio_query, style_id)
+            elapsed = time.monotonic() - synthesis_start
+
+        duration = get_wav_duration(wav_data)
+        if duration > 0:
+            self.warmup_rtf[style_id] = elapsed / duration
+            logger.info(f"Warmup synthesis for style {style_id}: {elapsed:.2f}s for {duration:.2f}s of audio (RTF {elapsed / duration:.2f})")
+
+    def is_ready(self) -> bool:
+        """Check if VOICEVOX Core is initialized and warmed up."""
+        return self.core_initialized and self._ready_event.is_set()
 
-        return loaded_count
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the warmup has finished.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if the engine is ready
+        """
+        if not self.core_initialized:
+            return False
+        return self._ready_event.wait(timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the engine status for the UI and health probes.
+
+        Returns:
+            Dict[str, Any]: Warmup state ("cold", "warming", "ready" or "unavailable"),
+            readiness, measured real-time factors and resident voice models
+        """
+        return {
+            "state": self.warmup_state,
+            "ready": self.is_ready(),
+            "real_time_factors": dict(self.warmup_rtf),
+            "loaded_models": self.get_loaded_model_files(),
+        }
+
+    def get_available_styles(self) -> Dict[int, str]:
+        """
+        Get all styles of the installed voice models, whether loaded or not.
+
+        Returns:
+            Dict[int, str]: Display names ("character（style）") by style ID
+        """
+        return dict(self.style_names)
+
+    def get_loaded_model_files(self) -> List[str]:
+        """
+        Get the voice model files currently resident in memory.
+
+        Returns:
+            List[str]: Model file names, least recently used first
+        """
+        with self._model_lock:
+            return [model_path.name for model_path in self._loaded_models]
 
     def _initialize_openjtalk(self) -> "OpenJtalk":
         """
@@ -135,26 +419,13 @@ class VoicevoxCoreManager:
         """
         # Initialize OpenJtalk with system dictionary
         open_jtalk = OpenJtalk(str(self.VOICEVOX_DICT_PATH))
+        self.open_jtalk = open_jtalk
 
         # Load user dictionary if it exists
         if self.USER_DICT_PATH.exists():
             try:
-                user_dict = UserDict()
-                user_dict.load(str(self.USER_DICT_PATH))
-
-                # Use the user dictionary with OpenJtalk
-                open_jtalk.use_user_dict(user_dict)
+                self._apply_user_dictionary(open_jtalk)
                 logger.info(f"Loaded user dictionary: {self.USER_DICT_PATH}")
-
-                # Log dictionary contents for debugging
-                words = user_dict.to_dict()
-                logger.info(f"User dictionary contains {len(words)} words")
-                for word in words.values():
-                    logger.debug(f"  {word.surface} -> {word.pronunciation}")
-
-                # Load user dictionary words for conversion checking
-                self._load_user_dict_words_from_dict(user_dict)
-
             except Exception as e:
                 logger.warning(f"Failed to load user dictionary: {e}")
                 logger.info("Continuing with system dictionary only")
@@ -164,6 +435,101 @@ class VoicevoxCoreManager:
 
         return open_jtalk
 
+    def _get_dictionary_signature(self) -> Optional[Tuple[int, int]]:
+        """Get the (mtime, size) of the user dictionary file, or None if it does not exist."""
+        try:
+            stat = self.USER_DICT_PATH.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _apply_user_dictionary(self, open_jtalk: OpenJtalk) -> None:
+        """
+        Build a user dictionary from USER_DICT_PATH and swap it into OpenJtalk.
+
+        The new dictionary, its surface forms and its version are prepared completely
+        before being published, so concurrent synthesis sees either the old or the new
+        dictionary. Waveform synthesis never touches the dictionary and is not paused.
+
+        Args:
+            open_jtalk: OpenJtalk instance used by the synthesizer
+        """
+        signature = self._get_dictionary_signature()
+        content = self.USER_DICT_PATH.read_bytes()
+        user_dict = UserDict()
+        user_dict.load(str(self.USER_DICT_PATH))
+
+        # Log dictionary contents for debugging
+        words = user_dict.to_dict()
+        logger.info(f"User dictionary contains {len(words)} words")
+        for word in words.values():
+            logger.debug(f"  {word.surface} -> {word.pronunciation}")
+
+        # Load user dictionary words for conversion checking
+        user_dict_words = self._load_user_dict_words_from_dict(user_dict)
+        # Version cached synthesis results by dictionary content
+        dictionary_version = hashlib.sha256(content).hexdigest()[:16]
+
+        with self._dictionary_lock:
+            open_jtalk.use_user_dict(user_dict)
+            # Publish the version only after the dictionary is in use, so analysis
+            # results tagged with the new version never come from the old dictionary
+            self.user_dict_words = user_dict_words
+            self.dictionary_version = dictionary_version
+            self._dictionary_signature = signature
+
+    def reload_user_dictionary(self) -> bool:
+        """
+        Reload the user dictionary if its file has changed since it was loaded.
+
+        Cached analysis results of the previous dictionary are dropped. Cached utterances
+        are keyed by engine_version, which includes the dictionary version, so they are
+        not reused after the swap.
+
+        Returns:
+            bool: True if a new dictionary was loaded
+        """
+        if self.open_jtalk is None:
+            return False
+        signature = self._get_dictionary_signature()
+        if signature is None or signature == self._dictionary_signature:
+            return False
+
+        previous_version = self.dictionary_version
+        try:
+            self._apply_user_dictionary(self.open_jtalk)
+        except Exception as e:
+            # Keep the current dictionary; the file is probably still being written
+            logger.warning(f"Failed to reload user dictionary: {e}")
+            return False
+
+        if self.dictionary_version != previous_version:
+            self.audio_query_cache.clear()
+            logger.info(f"Reloaded user dictionary (version {previous_version or 'none'} -> {self.dictionary_version})")
+        return True
+
+    def start_dictionary_watcher(self, interval: float = USER_DICT_RELOAD_INTERVAL) -> None:
+        """
+        Start watching the user dictionary file for changes in a background thread.
+
+        Args:
+            interval: Seconds between checks of the dictionary file (0 disables watching)
+        """
+        if not self.core_initialized or interval <= 0:
+            return
+
+        def watch() -> None:
+            while not self._dictionary_watcher_stop.wait(interval):
+                self.reload_user_dictionary()
+
+        self._dictionary_watcher_stop.clear()
+        threading.Thread(target=watch, name="user-dict-watcher", daemon=True).start()
+        logger.info(f"Watching user dictionary for changes every {interval:g}s: {self.USER_DICT_PATH}")
+
+    def stop_dictionary_watcher(self) -> None:
+        """Stop the user dictionary watcher thread."""
+        self._dictionary_watcher_stop.set()
+
     def text_to_speech(self, text: str, style_id: int) -> bytes:
         """
         Generate audio data from text using VOICEVOX Core with character-specific pitch adjustment.
@@ -178,59 +544,223 @@ class VoicevoxCoreManager:
         if not text.strip() or not self.core_synthesizer:
             return b""
 
+        # Get character-specific speed scale
+        character = CHARACTER_BY_STYLE_ID.get(style_id)
+        speed_scale = character.speed_scale if character else 1.0
+
+        # Return a previously synthesized utterance without calling the synthesizer
+        cache_key = None
+        if self.utterance_cache is not None:
+            cache_key = self.utterance_cache.make_key(text, style_id, speed_scale, self.engine_version)
+            cached_wav_data = self.utterance_cache.get(cache_key)
+            if cached_wav_data:
+                logger.debug(f"Utterance cache hit: {len(cached_wav_data) // 1024} KB (style_id: {style_id})")
+                return cached_wav_data
+
         try:
-            # Get character-specific speed scale
-            character = CHARACTER_BY_STYLE_ID.get(style_id)
-            speed_scale = character.speed_scale if character else 1.0
-
-            wav_data: bytes
-            if speed_scale != 1.0:
-                # Use create_audio_query + synthesis for speed adjustment
-                audio_query = self.core_synthesizer.create_audio_query(text, style_id)
-                audio_query.speed_scale = speed_scale
-                wav_data = self.core_synthesizer.synthesis(audio_query, style_id)
-            else:
-                # Use standard tts method for no speed adjustment
-                wav_data = self.core_synthesizer.tts(text, style_id)
+            with self._use_voice_model(style_id) as model_loaded:
+                if not model_loaded:
+                    return b""
+                started_at = time.monotonic()
+                # Reuse cached analysis results; the cached query itself is never modified
+                audio_query = dataclasses.replace(self._get_audio_query(self.core_synthesizer, text, style_id), speed_scale=speed_scale)
+                wav_data: bytes = self.core_synthesizer.synthesis(audio_query, style_id)
+                self._record_throughput(text, style_id, audio_query, wav_data, time.monotonic() - started_at)
 
             logger.debug(f"Audio generation completed: {len(wav_data) // 1024} KB (speed_scale: {speed_scale})")
-            return wav_data
         except Exception as e:
             logger.error(f"Audio generation error: {e}")
             return b""
 
+        if cache_key is not None and self.utterance_cache is not None:
+            self.utterance_cache.put(cache_key, wav_data)
+        return wav_data
+
+    async def text_to_speech_async(self, text: str, style_id: int) -> bytes:
+        """
+        Awaitable version of text_to_speech.
+
+        Synthesis runs on a dedicated executor thread of this manager, so the event
+        loop stays free to serve other connections while audio is generated.
+
+        Args:
+            text: Text to convert to speech
+            style_id: VOICEVOX style ID
+
+        Returns:
+            bytes: Generated WAV data
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._async_executor, self.text_to_speech, text, style_id)
+
+    def text_to_speech_stream(self, text: str, style_id: int, window_frames: int = RENDER_WINDOW_FRAMES) -> Generator[Tuple[bytes, bool], None, None]:
+        """
+        Generate audio data incrementally in fixed-size frame windows.
+
+        Acoustic features are computed once with precompute_render, and the waveform
+        is rendered window by window so the first audio is available long before the
+        whole utterance is finished. Falls back to whole-utterance synthesis when the
+        installed VOICEVOX Core does not support incremental rendering.
+
+        Args:
+            text: Text to convert to speech
+            style_id: VOICEVOX style ID
+            window_frames: Number of audio frames rendered per window
+
+        Yields:
+            Tuple[bytes, bool]: (WAV data of the window, whether it is the last window)
+        """
+        if not text.strip() or not self.core_synthesizer:
+            yield b"", True
+            return
+
+        synthesizer = self.core_synthesizer
+        character = CHARACTER_BY_STYLE_ID.get(style_id)
+        speed_scale = character.speed_scale if character else 1.0
+
+        cache_key = None
+        if self.utterance_cache is not None:
+            cache_key = self.utterance_cache.make_key(text, style_id, speed_scale, self.engine_version)
+            cached_wav_data = self.utterance_cache.get(cache_key)
+            if cached_wav_data:
+                yield cached_wav_data, True
+                return
+
+        if not hasattr(synthesizer, "precompute_render"):
+            yield self.text_to_speech(text, style_id), True
+            return
+
+        window_wav_data_list: List[bytes] = []
+        with self._use_voice_model(style_id) as model_loaded:
+            if not model_loaded:
+                yield b"", True
+                return
+            started_at = time.monotonic()
+            try:
+                audio_query = dataclasses.replace(self._get_audio_query(synthesizer, text, style_id), speed_scale=speed_scale)
+                audio_feature = synthesizer.precompute_render(audio_query, style_id)
+                frame_length = audio_feature.frame_length
+            except Exception as e:
+                logger.error(f"Audio generation error: {e}")
+                yield b"", True
+                return
+            # Time spent waiting for the consumer between windows is not synthesis time
+            synthesis_seconds = time.monotonic() - started_at
+
+            for start in range(0, frame_length, max(window_frames, 1)):
+                stop = min(start + window_frames, frame_length)
+                render_started_at = time.monotonic()
+                try:
+                    window_wav_data: bytes = synthesizer.render(audio_feature, start, stop)
+                except Exception as e:
+                    logger.error(f"Audio rendering error (frames {start}-{stop}): {e}")
+                    yield b"", True
+                    return
+                synthesis_seconds += time.monotonic() - render_started_at
+                window_wav_data_list.append(window_wav_data)
+                yield window_wav_data, stop >= frame_length
+
+        wav_data = combine_wav_data(window_wav_data_list)
+        self._record_throughput(text, style_id, audio_query, wav_data, synthesis_seconds)
+        if cache_key is not None and self.utterance_cache is not None:
+            self.utterance_cache.put(cache_key, wav_data)
+
+    def _record_throughput(self, text: str, style_id: int, audio_query: AudioQuery, wav_data: bytes, wall_seconds: float) -> None:
+        """
+        Feed a synthesized utterance into the throughput model of this host.
+
+        Args:
+            text: Synthesized text
+            style_id: VOICEVOX style ID
+            audio_query: AudioQuery the audio was synthesized from
+            wav_data: Synthesized WAV data
+            wall_seconds: Wall-clock time the synthesis took
+        """
+        try:
+            moras = sum(len(accent_phrase.moras) for accent_phrase in audio_query.accent_phrases)
+            synthesis_throughput.record(style_id, len(text), get_wav_duration(wav_data), wall_seconds, moras)
+        except Exception as e:
+            logger.debug(f"Failed to record synthesis throughput: {e}")
+
+    def _get_audio_query(self, synthesizer: Synthesizer, text: str, style_id: int) -> AudioQuery:
+        """
+        Get the AudioQuery of a text, running text analysis only when necessary.
+
+        If the text was already analyzed for another style, its accent phrases are
+        reused and only the mora data (pitch and length) is re-predicted for the
+        requested style, skipping OpenJTalk analysis.
+
+        Args:
+            synthesizer: Synthesizer used for analysis
+            text: Text to analyze
+            style_id: VOICEVOX style ID
+
+        Returns:
+            AudioQuery: Analysis result (shared with the cache, must not be modified)
+        """
+        # Tag the result with the version in use when analysis starts (the dictionary may be swapped meanwhile)
+        dictionary_version = self.dictionary_version
+        audio_query = self.audio_query_cache.get(text, style_id, dictionary_version)
+        if audio_query is not None:
+            return audio_query
+
+        analyzed = self.audio_query_cache.get_any_style(text, dictionary_version)
+        if analyzed is not None:
+            source_style_id, source_query = analyzed
+            accent_phrases = synthesizer.replace_mora_data(source_query.accent_phrases, style_id)
+            audio_query = dataclasses.replace(source_query, accent_phrases=accent_phrases)
+            logger.debug(f"Reused text analysis of style {source_style_id} for style {style_id}")
+        else:
+            audio_query = synthesizer.create_audio_query(text, style_id)
+
+        self.audio_query_cache.put(text, style_id, dictionary_version, audio_query)
+        return audio_query
+
+    @property
+    def engine_version(self) -> str:
+        """
+        Get the version of everything that affects synthesized audio besides the request itself.
+
+        Returns:
+            str: VOICEVOX Core version combined with the user dictionary version
+        """
+        return f"{VOICEVOX_CORE_VERSION}+dict.{self.dictionary_version or 'none'}"
+
     def is_available(self) -> bool:
         """Check if VOICEVOX Core is available and initialized."""
         return self.core_initialized
 
-    def _load_user_dict_words_from_dict(self, user_dict: UserDict) -> None:
+    def _load_user_dict_words_from_dict(self, user_dict: UserDict) -> set:
         """
         Load user dictionary words from UserDict for conversion checking.
 
         Args:
             user_dict: UserDict instance to load words from
+
+        Returns:
+            set: Surface forms of the dictionary words (full-width and NFKC-normalized)
         """
-        self.user_dict_words = set()
+        user_dict_words = set()
 
         try:
             # Get all words from dictionary
             dict_words = user_dict.to_dict()
             for word in dict_words.values():
                 # Add both the full-width surface form and potential original form
-                self.user_dict_words.add(word.surface)
+                user_dict_words.add(word.surface)
 
                 # Convert full-width to half-width characters
                 original_surface = unicodedata.normalize("NFKC", word.surface)
 
                 if original_surface != word.surface:
-                    self.user_dict_words.add(original_surface)
+                    user_dict_words.add(original_surface)
 
                 logger.debug(f"Loaded user dict word: {word.surface} (original: {original_surface})")
 
         except Exception as e:
             logger.warning(f"Failed to load user dictionary words: {e}")
 
-        logger.info(f"Loaded {len(self.user_dict_words)} user dictionary surface forms for conversion checking")
+        logger.info(f"Loaded {len(user_dict_words)} user dictionary surface forms for conversion checking")
+        return user_dict_words
 
     def is_word_in_user_dict(self, word: str) -> bool:
         """
@@ -261,9 +791,51 @@ def initialize_global_voicevox_manager() -> VoicevoxCoreManager:
     if _global_voicevox_manager is None:
         logger.info("Initializing global VOICEVOX Core manager")
         _global_voicevox_manager = VoicevoxCoreManager()
+        _global_voicevox_manager.start_warmup()
+        _global_voicevox_manager.start_dictionary_watcher()
     return _global_voicevox_manager
 
 
+@dataclasses.dataclass
+class _AudioAssembly:
+    """生成中の音声の組み立て状態（パートとチャンクのWAVデータ・ファイル）"""
+
+    temp_dir: Path
+    # 完成したパートを逐次追記する最終的な音声ファイル（パートのWAVデータはメモリに保持しない）
+    final_writer: StreamingWavWriter
+    temp_files: List[str] = dataclasses.field(default_factory=list)
+    # 完成したパートをHLSのセグメントとプレイリストに追記する（無効な場合はNone）
+    segmenter: Optional[HlsSegmenter] = None
+    # パートの無音除去・間の挿入・音量の正規化（話者ごとの音量はジョブ内で蓄積）
+    postprocessor: AudioPostProcessor = dataclasses.field(default_factory=AudioPostProcessor)
+    previous_speaker: Optional[str] = None
+    # 生成中のパートのセグメント
+    chunk_wav_data_list: List[bytes] = dataclasses.field(default_factory=list)
+    chunk_files: List[Path] = dataclasses.field(default_factory=list)
+    # パートファイルを記録するマニフェスト（Noneの場合は記録しない）と、台本・各パートのセリフのキー
+    manifest: Optional[PartManifest] = None
+    script_hash: str = ""
+    turn_keys: List[str] = dataclasses.field(default_factory=list)
+    # 編集前の台本から再利用するパート（パートのインデックス → (退避したパートファイル, 元のパートの記録)）
+    reused_parts: Dict[int, Tuple[Path, PartRecord]] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Token:
+    """カタカナ変換用にテキストを分割したトークン"""
+
+    text: str
+    # 英字のみからなる単語か
+    is_english: bool = False
+    # 大文字のみからなる単語か
+    is_all_uppercase: bool = False
+
+    @property
+    def lower(self) -> str:
+        """小文字に変換したテキスト"""
+        return self.text.lower()
+
+
 # 単語タイプを表すEnum
 class WordType(Enum):
     """単語タイプを表す列挙型"""
@@ -278,70 +850,74 @@ class AudioGenerator:
     """Class for generating audio from text using global VOICEVOX Core manager."""
 
     # 単語タイプのリスト
-    BE_VERBS = ["am", "is", "are", "was", "were", "be", "been", "being"]
-    PREPOSITIONS = [
-        "about",
-        "above",
-        "across",
-        "after",
-        "against",
-        "along",
-        "among",
-        "around",
-        "at",
-        "before",
-        "behind",
-        "below",
-        "beneath",
-        "beside",
-        "between",
-        "beyond",
-        "by",
-        "down",
-        "during",
-        "except",
-        "for",
-        "from",
-        "in",
-        "inside",
-        "into",
-        "like",
-        "near",
-        "of",
-        "off",
-        "on",
-        "onto",
-        "out",
-        "outside",
-        "over",
-        "through",
-        "to",
-        "toward",
-        "towards",
-        "under",
-        "underneath",
-        "until",
-        "up",
-        "upon",
-        "with",
-        "within",
-        "without",
-    ]
-    CONJUNCTIONS = [
-        "and",
-        "but",
-        "or",
-        "nor",
-        "for",
-        "yet",
-        "so",
-        "because",
-        "if",
-        "when",
-        "although",
-        "since",
-        "while",
-    ]
+    BE_VERBS = frozenset(["am", "is", "are", "was", "were", "be", "been", "being"])
+    PREPOSITIONS = frozenset(
+        [
+            "about",
+            "above",
+            "across",
+            "after",
+            "against",
+            "along",
+            "among",
+            "around",
+            "at",
+            "before",
+            "behind",
+            "below",
+            "beneath",
+            "beside",
+            "between",
+            "beyond",
+            "by",
+            "down",
+            "during",
+            "except",
+            "for",
+            "from",
+            "in",
+            "inside",
+            "into",
+            "like",
+            "near",
+            "of",
+            "off",
+            "on",
+            "onto",
+            "out",
+            "outside",
+            "over",
+            "through",
+            "to",
+            "toward",
+            "towards",
+            "under",
+            "underneath",
+            "until",
+            "up",
+            "upon",
+            "with",
+            "within",
+            "without",
+        ]
+    )
+    CONJUNCTIONS = frozenset(
+        [
+            "and",
+            "but",
+            "or",
+            "nor",
+            "for",
+            "yet",
+            "so",
+            "because",
+            "if",
+            "when",
+            "although",
+            "since",
+            "while",
+        ]
+    )
 
     CONVERSION_OVERRIDE = {
         "python": "パイソン",
@@ -362,10 +938,27 @@ class AudioGenerator:
         "lovot": "ラボット",
     }
 
+    # カタカナ変換用のトークン（1回の走査で英単語をキャメルケース・略語・複数形の略語に分割する）
+    # 数字・空白・記号は英字以外の連続ごとに1トークンとする
+    KATAKANA_TOKEN_PATTERN = re.compile(
+        r"(?<![A-Za-z])(?P<plural>[A-Z]{2,})s(?![A-Za-z])"
+        r"|(?P<word>[A-Z]{2,}(?=[A-Z][a-z]|(?![A-Za-z]))|[A-Z][a-z]*|[a-z]+)"
+        r"|\d+|\s+|[^A-Za-z0-9\s]+"
+    )
+    UPPERCASE_PATTERN = re.compile(r"[A-Z]+")
+    # 息継ぎとみなす文字
+    BREATH_CHARS = frozenset({".", "。", ",", "、", " "})
+
+    # 文の区切り（句点・感嘆符・疑問符・改行の直後）
+    SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[。！？!?\n])")
+    # 長すぎる文の区切り（読点の直後）
+    CLAUSE_BOUNDARY_PATTERN = re.compile(r"(?<=[、，,])")
+
     def __init__(
         self,
         session_output_dir: Optional[Path] = None,
         session_temp_dir: Optional[Path] = None,
+        session_id: Optional[str] = None,
     ) -> None:
         """
         Initialize AudioGenerator.
@@ -375,7 +968,11 @@ class AudioGenerator:
                 If not provided, defaults to "data/output"
             session_temp_dir (Optional[Path]): Session-specific temporary directory.
                 If not provided, defaults to "data/temp/talks"
+            session_id (Optional[str]): Session ID used to share the synthesizer fairly between sessions.
+                If not provided, a random ID is used
         """
+        self.session_id = session_id or uuid.uuid4().hex
+
         # Use session-specific directories if provided
         self.output_dir = session_output_dir if session_output_dir else Path("data/output")
         self.temp_dir = session_temp_dir if session_temp_dir else Path("data/temp/talks")
@@ -387,6 +984,11 @@ class AudioGenerator:
         # Audio generation progress variables
         self.audio_generation_progress = 0.0
         self.final_audio_path: Optional[str] = None
+        # HLSプレイリストのパスと、このセッションだけに渡す配信用トークン（HLS出力が有効な場合のみ）
+        self.hls_playlist_path: Optional[str] = None
+        self.hls_token: Optional[str] = None
+        # 生成中の台本のハッシュ（パートのマニフェストに記録する）
+        self.script_hash = ""
 
     @property
     def core_initialized(self) -> bool:
@@ -411,11 +1013,66 @@ class AudioGenerator:
         Returns:
             str: 英単語がカタカナに変換され、自然な息継ぎを考慮して空白が制御されたテキスト
         """
-        # 大文字で始まる部分を分割する
-        split_parts = self._split_capitalized_parts(text)
+        # 英単語・数字・空白・記号のトークンに分割する
+        tokens = self._tokenize(text)
+
+        # 変換が必要な英単語をまとめて一度に変換する（繰り返し出現する単語も変換は一度だけ）
+        words = [word for token in tokens if (word := self._katakana_conversion_source(token)) is not None]
+        converted_words = get_global_katakana_converter().convert_batch(words)
 
         # 英単語をカタカナに変換し、自然な息継ぎのための空白を制御
-        return self._convert_parts_to_katakana(parts=split_parts, converter=e2k.C2K())
+        return self._convert_parts_to_katakana(tokens=tokens, converter=converted_words.__getitem__)
+
+    def _tokenize(self, text: str) -> List[_Token]:
+        """
+        テキストを1回の走査でカタカナ変換用のトークンに分割する
+
+        Args:
+            text (str): 分割するテキスト
+
+        Returns:
+            List[_Token]: トークンのリスト
+        """
+        tokens = []
+        for match in self.KATAKANA_TOKEN_PATTERN.finditer(text):
+            plural = match.group("plural")
+            if plural is not None:
+                # 大文字が続いて最後が小文字の"s"1文字の場合（複数形）は、sを「ズ」に変換する
+                tokens.append(_Token(plural, is_english=True, is_all_uppercase=True))
+                tokens.append(_Token("ズ"))
+            elif match.group("word") is not None:
+                word = match.group()
+                tokens.append(_Token(word, is_english=True, is_all_uppercase=self.UPPERCASE_PATTERN.fullmatch(word) is not None))
+            else:
+                tokens.append(_Token(match.group()))
+        return tokens
+
+    def _katakana_conversion_source(self, token: _Token) -> Optional[str]:
+        """
+        トークンのうち、カタカナ変換器で変換する英単語を取得する
+
+        Args:
+            token: トークン
+
+        Returns:
+            Optional[str]: 変換器に渡す英単語（変換器を使わないトークンの場合はNone）
+        """
+        if not token.is_english:
+            # 英単語でない場合はそのまま
+            return None
+        lower = token.lower
+        if lower == "a" or lower in self.CONVERSION_OVERRIDE:
+            # "A"は文脈に応じて、特定の単語は事前定義した変換を使用
+            return None
+        if self._is_in_user_dict(token.text):
+            # ユーザー辞書に登録済みの単語はそのまま使用（VOICEVOXが変換する）
+            return None
+        part = token.text
+        if token.is_all_uppercase and (len(part) <= 3 or (len(part) <= 6 and not is_romaji_readable(part))):
+            # 大文字のみで構成され、字数が少なくてローマ字読みできない場合はアルファベット読みして欲しいためそのまま
+            # （字数が3文字以下なら基本的にアルファベット読みで良く, 駄目であればCONVERSION_OVERRIDEなどで変換する）
+            return None
+        return part.capitalize() if token.is_all_uppercase else part
 
     def _split_capitalized_parts(self, text: str) -> List[str]:
         """
@@ -428,36 +1085,18 @@ class AudioGenerator:
         Returns:
             List[str]: 分割された部分のリスト
         """
-        # アルファベット、数字、空白、その他に分割
-        word_parts = re.findall(r"([A-Za-z]+|\d+|\s+|[^A-Za-z0-9\s]+)", text)
-        result = []
-
-        for part in word_parts:
-            if re.match(r"^[A-Za-z]+$", part):
-                # 大文字が続いて最後が小文字の"s"1文字の場合（複数形）を特別処理
-                if re.match(r"^[A-Z]{2,}s$", part):
-                    # 大文字部分とsを分離し、sは「ズ」に変換
-                    uppercase_part = part[:-1]
-                    result.extend([uppercase_part, "ズ"])
-                else:
-                    # 英単語のパターンに基づいて分割（キャメルケース対応）
-                    segments = re.findall(r"([A-Z]{2,}(?=[A-Z][a-z]|$)|[A-Z][a-z]*|[a-z]+)", part)
-                    result.extend(segments)
-            else:
-                # 英単語以外はそのまま追加
-                result.append(part)
-        return result
+        return [token.text for token in self._tokenize(text)]
 
     def _convert_parts_to_katakana(
         self,
-        parts: List[str],
-        converter: e2k.C2K,
+        tokens: List[_Token],
+        converter: Callable[[str], str],
     ) -> str:
         """
-        分割された部分をカタカナに変換し、適切な空白を制御する
+        トークンをカタカナに変換し、適切な空白を制御する
 
         Args:
-            parts: 分割されたテキスト部分のリスト
+            tokens: テキストを分割したトークンのリスト
             converter: 英語からカタカナへの変換器
 
         Returns:
@@ -469,7 +1108,8 @@ class AudioGenerator:
         is_english_word = False  # 英語かどうか
         is_last_part_english = False  # 最後の部分が英語かどうか
 
-        for i, part in enumerate(parts):
+        for i, token in enumerate(tokens):
+            part = token.text
             is_last_part_english = is_english_word
 
             # 空文字やハイフンはスキップ
@@ -477,7 +1117,7 @@ class AudioGenerator:
                 continue
 
             # 息継ぎを意味する句読点があればカウントリセット
-            if set(last_part) & {".", "。", ",", "、", " "}:
+            if not self.BREATH_CHARS.isdisjoint(last_part):
                 word_count = 0
 
             # 今回が空白1文字で前回が英単語であれば無視
@@ -485,8 +1125,7 @@ class AudioGenerator:
                 continue
 
             word_count += 1
-            is_english_word = bool(re.match(r"^[A-Za-z]+$", part))
-            is_all_uppercase = bool(re.match(r"^[A-Z]+$", part))
+            is_english_word = token.is_english
 
             # 空白挿入条件の判定
             if is_last_part_english and is_english_word:
@@ -494,7 +1133,7 @@ class AudioGenerator:
                 needs_space = word_count >= 6  # 6単語以上続く
 
                 # 特定の品詞の前後で息継ぎ
-                if (last_part.lower() in self.BE_VERBS or part.lower() in self.PREPOSITIONS or part.lower() in self.CONJUNCTIONS) and word_count >= 4:
+                if word_count >= 4 and (last_part.lower() in self.BE_VERBS or token.lower in self.PREPOSITIONS or token.lower in self.CONJUNCTIONS):
                     needs_space = True
 
                 if needs_space:
@@ -502,59 +1141,51 @@ class AudioGenerator:
                     word_count = 0  # カウントリセット
 
             # 変換処理
-            # "A"の特別な処理: 文脈に応じて変換を決定
-            if part.lower() == "a":
-                part_to_add = self._convert_a_contextually(part, parts, i)
-            elif converted_part := self.CONVERSION_OVERRIDE.get(part.lower()):
-                # 特定の単語は事前定義した変換を使用（ただし"a"は上で処理済み）
-                part_to_add = converted_part
-            elif self._is_in_user_dict(part):
-                # ユーザー辞書に登録済みの単語はそのまま使用（VOICEVOXが変換する）
-                part_to_add = part
-            elif not is_english_word:
+            if not is_english_word:
                 # 英単語でない場合はそのまま
                 part_to_add = part
-            elif is_all_uppercase and (len(part) <= 3 or (len(part) <= 6 and not is_romaji_readable(part))):
-                # 大文字のみで構成され、字数が少なくてローマ字読みできない場合はアルファベット読みして欲しいためそのまま
-                # （字数が3文字以下なら基本的にアルファベット読みで良く, 駄目であればCONVERSION_OVERRIDEなどで変換する）
-                part_to_add = part
-            else:
-                part_to_add = part.capitalize() if is_all_uppercase else part
+            elif token.lower == "a":
+                # "A"の特別な処理: 文脈に応じて変換を決定
+                part_to_add = self._convert_a_contextually(part, tokens, i)
+            elif converted_part := self.CONVERSION_OVERRIDE.get(token.lower):
+                # 特定の単語は事前定義した変換を使用（ただし"a"は上で処理済み）
+                part_to_add = converted_part
+            elif (source_word := self._katakana_conversion_source(token)) is not None:
                 # 英単語をカタカナに変換
-                part_to_add = converter(part_to_add)
+                part_to_add = converter(source_word)
+            else:
+                # ユーザー辞書の単語・アルファベット読みする略語はそのまま
+                part_to_add = part
 
             result.append(part_to_add)
             last_part = part_to_add
 
         return "".join(result)
 
-    def _convert_a_contextually(self, part: str, parts: List[str], current_index: int) -> str:
+    def _convert_a_contextually(self, part: str, tokens: List[_Token], current_index: int) -> str:
         """
         "A"/"a"を文脈に応じて変換する
 
         Args:
             part: 現在の部分 ("A" または "a")
-            parts: 全体の分割された部分のリスト
-            current_index: 現在の部分のインデックス
+            tokens: 全体のトークンのリスト
+            current_index: 現在のトークンのインデックス
 
         Returns:
             str: 変換された文字列
         """
         # 冠詞として使われている場合のみ"ア"に変換
         # 次に空白があり、その後に英単語がある場合（例: "a pen" -> ['a', ' ', 'pen']）
-        if current_index + 1 < len(parts) and parts[current_index + 1] == " ":
-            # 空白の後に英単語を探す
-            next_word_index = current_index + 2
-            if next_word_index < len(parts):
-                next_word = parts[next_word_index]
-                # 次が英単語の場合は冠詞として"ア"
-                if re.match(r"^[A-Za-z]+$", next_word):
-                    return "ア"
+        next_word_index = current_index + 2
+        if next_word_index < len(tokens) and tokens[current_index + 1].text == " " and tokens[next_word_index].is_english:
+            return "ア"
 
         # それ以外の場合は技術用語として"A"のまま
         return part
 
-    def generate_character_conversation(self, podcast_text: str, resume_from_part: int = 0, existing_parts: Optional[List[str]] = None) -> Generator[Optional[str], None, None]:
+    def generate_character_conversation(
+        self, podcast_text: str, resume_from_part: int = 0, existing_parts: Optional[List[str]] = None, previous_parts: Optional[List[PartRecord]] = None
+    ) -> Generator[Optional[str], None, None]:
         """
         Generate audio for a character conversation from podcast text with streaming support and resume capability.
 
@@ -562,6 +1193,8 @@ class AudioGenerator:
             podcast_text (str): Podcast text with character dialogue lines
             resume_from_part (int): Part number to resume from (0 = start from beginning)
             existing_parts (List[str], optional): List of existing audio part file paths
+            previous_parts (List[PartRecord], optional): Part files of a previous version of the script; parts of unchanged
+                turns are reused instead of synthesized again and the other files are deleted
 
         Yields:
             Optional[str]: Path to temporary audio files for streaming playback, or None if failed
@@ -569,313 +1202,971 @@ class AudioGenerator:
         Returns:
             None: This generator has no return value
         """
-        logger.info("Audio generation started")
-        logger.debug(f"Resume from part: {resume_from_part}")
-        logger.debug(f"Existing parts: {len(existing_parts) if existing_parts else 0}")
-        if existing_parts:
-            logger.debug(f"Existing part files: {[os.path.basename(p) for p in existing_parts]}")
-
-        if resume_from_part == 0 and not existing_parts:
-            logger.debug("Resetting audio generation state (new generation)")
-            self.reset_audio_generation_state()
-        else:
-            logger.debug("NOT resetting state (resume mode)")
-
-        # 前提条件チェック
-        if not self.core_initialized:
-            logger.error("VOICEVOX Core is not properly initialized.")
-            yield None
-            return
-
-        if not podcast_text or podcast_text.strip() == "":
-            logger.error("Podcast text is empty")
-            yield None
-            return
-
         try:
-            # 英語をカタカナに変換
-            podcast_text = self._convert_english_to_katakana(podcast_text)
-            logger.info("Converted English words in podcast text to katakana")
-
-            # 会話部分の抽出
-            conversation_parts = self._extract_conversation_parts(podcast_text)
-
-            logger.debug(f"Extracted {len(conversation_parts)} conversation parts")
-            for i, (speaker, text) in enumerate(conversation_parts):
-                logger.debug(f"Part {i}: {speaker} - {len(text)} chars")
-
-            if not conversation_parts:
-                logger.error("No valid conversation parts found")
+            prepared = self._prepare_conversation(podcast_text, resume_from_part, existing_parts)
+            if prepared is None:
                 yield None
                 return
-
-            # 一時ディレクトリの作成（再開時は既存ディレクトリを利用）
-            if resume_from_part > 0 and existing_parts:
-                # 再開時：既存ファイルのディレクトリを使用
-                existing_dir = Path(existing_parts[0]).parent
-                temp_dir = existing_dir
-                logger.debug(f"Reusing existing directory for resume: {temp_dir.name}")
-            else:
-                # 新規生成：新しいディレクトリを作成
-                temp_dir = self.temp_dir / f"stream_{uuid.uuid4().hex[:8]}"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Created new directory for fresh generation: {temp_dir.name}")
+            conversation_parts, temp_dir = prepared
 
             # 音声生成と結合処理（部分再開対応）
-            yield from self._generate_and_combine_audio_with_resume(conversation_parts, temp_dir, resume_from_part, existing_parts or [])
+            yield from self._generate_and_combine_audio_with_resume(conversation_parts, temp_dir, resume_from_part, existing_parts or [], previous_parts)
 
         except Exception as e:
             logger.error(f"Character conversation audio generation error: {e}")
             yield None
             return
 
-    def _find_best_character_match(self, input_name: str) -> str:
+    async def generate_character_conversation_async(
+        self, podcast_text: str, resume_from_part: int = 0, existing_parts: Optional[List[str]] = None, previous_parts: Optional[List[PartRecord]] = None
+    ) -> AsyncGenerator[Optional[str], None]:
         """
-        入力された名前に最も近いキャラクター名を見つける（ファジーマッチング）
+        Asynchronous version of generate_character_conversation.
+
+        Synthesis is awaited instead of blocking the calling thread, so many streaming
+        connections can be held open on one event loop while audio is generated.
 
         Args:
-            input_name (str): 入力された名前（表記ゆれの可能性あり）
+            podcast_text (str): Podcast text with character dialogue lines
+            resume_from_part (int): Part number to resume from (0 = start from beginning)
+            existing_parts (List[str], optional): List of existing audio part file paths
+            previous_parts (List[PartRecord], optional): Part files of a previous version of the script; parts of unchanged
+                turns are reused instead of synthesized again and the other files are deleted
+
+        Yields:
+            Optional[str]: Path to temporary audio files for streaming playback, or None if failed
+        """
+        try:
+            # 英語のカタカナ変換はCPU負荷が高いためイベントループの外で実行
+            prepared = await asyncio.get_running_loop().run_in_executor(None, self._prepare_conversation, podcast_text, resume_from_part, existing_parts)
+            if prepared is None:
+                yield None
+                return
+            conversation_parts, temp_dir = prepared
+
+            async for audio_path in self._generate_and_combine_audio_with_resume_async(conversation_parts, temp_dir, resume_from_part, existing_parts or [], previous_parts):
+                yield audio_path
+
+        except Exception as e:
+            logger.error(f"Character conversation audio generation error: {e}")
+            yield None
+            return
+
+    def _prepare_conversation(self, podcast_text: str, resume_from_part: int, existing_parts: Optional[List[str]]) -> Optional[Tuple[List[Tuple[str, str]], Path]]:
+        """
+        音声生成の前処理（状態の初期化、カタカナ変換、会話の抽出、一時ディレクトリの準備）を行う
+
+        Args:
+            podcast_text (str): 会話テキスト
+            resume_from_part (int): 再開する部分のインデックス
+            existing_parts (List[str], optional): 既存の音声パートファイルのリスト
 
         Returns:
-            str: 最も近いキャラクター名（正式名称）
+            Optional[Tuple[List[Tuple[str, str]], Path]]: (会話部分のリスト, 一時ディレクトリ)。生成できない場合はNone
         """
-        if not input_name:
-            return Character.ZUNDAMON.display_name
+        logger.info("Audio generation started")
+        logger.debug(f"Resume from part: {resume_from_part}")
+        logger.debug(f"Existing parts: {len(existing_parts) if existing_parts else 0}")
+        if existing_parts:
+            logger.debug(f"Existing part files: {[os.path.basename(p) for p in existing_parts]}")
+
+        if resume_from_part == 0 and not existing_parts:
+            logger.debug("Resetting audio generation state (new generation)")
+            self.reset_audio_generation_state()
+        else:
+            logger.debug("NOT resetting state (resume mode)")
 
-        # まず完全一致をチェック
-        for character_name in DISPLAY_NAMES:
-            if input_name == character_name:
-                return character_name
+        # 前提条件チェック
+        if not self.core_initialized:
+            logger.error("VOICEVOX Core is not properly initialized.")
+            return None
 
-        # 類似度計算
-        best_match = Character.ZUNDAMON.display_name
-        best_similarity = 0.0
+        if not podcast_text or podcast_text.strip() == "":
+            logger.error("Podcast text is empty")
+            return None
 
-        for character_name in DISPLAY_NAMES:
-            similarity = calculate_text_similarity(input_name, character_name)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = character_name
+        self.script_hash = script_hash(podcast_text)
 
-        # 最低閾値をチェック（類似度が低すぎる場合はデフォルト）
-        similarity_threshold = 0.3
-        if best_similarity < similarity_threshold:
-            logger.debug(f"Character name '{input_name}' similarity too low ({best_similarity:.2f}), using default")
-            return Character.ZUNDAMON.display_name
+        # 英語をカタカナに変換（ローマ字表記の話者名も変換後の名前で解決されるよう、抽出より先にテキスト全体を変換する）
+        podcast_text = self._convert_english_to_katakana(podcast_text)
+        logger.info("Converted English words in podcast text to katakana")
 
-        logger.debug(f"Character name '{input_name}' matched to '{best_match}' (similarity: {best_similarity:.2f})")
-        return best_match
+        # 会話部分の抽出（解析結果はスクリプトごとにキャッシュされる）
+        conversation_parts = self._extract_conversation_parts(podcast_text)
 
-    def _extract_conversation_parts(self, podcast_text: str) -> List[Tuple[str, str]]:
+        logger.debug(f"Extracted {len(conversation_parts)} conversation parts")
+        for i, (speaker, text) in enumerate(conversation_parts):
+            logger.debug(f"Part {i}: {speaker} - {len(text)} chars")
+
+        if not conversation_parts:
+            logger.error("No valid conversation parts found")
+            return None
+
+        # 一時ディレクトリの作成（再開時は既存ディレクトリを利用）
+        if resume_from_part > 0 and existing_parts:
+            # 再開時：既存ファイルのディレクトリを使用
+            existing_dir = Path(existing_parts[0]).parent
+            temp_dir = existing_dir
+            logger.debug(f"Reusing existing directory for resume: {temp_dir.name}")
+        else:
+            # 新規生成：新しいディレクトリを作成
+            temp_dir = self.temp_dir / f"stream_{uuid.uuid4().hex[:8]}"
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            logger.debug(f"Created new directory for fresh generation: {temp_dir.name}")
+
+        return conversation_parts, temp_dir
+
+    def _find_best_character_match(self, input_name: str) -> str:
         """
-        Podcast textから会話部分を抽出する
+        入力された名前に最も近いキャラクター名を見つける（ファジーマッチング）
 
         Args:
-            podcast_text (str): 会話テキスト
+            input_name (str): 入力された名前（表記ゆれの可能性あり）
 
         Returns:
-            List[Tuple[str, str]]: (話者名, セリフ)のタプルリスト
+            str: 最も近いキャラクター名（正式名称）
         """
-        # Split the podcast text into lines
-        lines = podcast_text.strip().split("\n")
-        conversation_parts = []
-
-        # キャラクターパターンを取得
-        character_patterns = {char.display_name: [f"{char.display_name}:", f"{char.display_name}："] for char in Character}
-
-        # 複数行のセリフを処理するために現在の話者と発言を記録
-        current_speaker = None
-        current_speech = ""
-
-        # Process each line of the text
-        for line in lines:
-            line = line.strip()
-
-            # 新しい話者の行かチェック（曖昧マッチング対応）
-            found_new_speaker = False
-            matched_speaker = None
-            matched_speech = ""
-
-            # まず完全一致をチェック
-            for character, patterns in character_patterns.items():
-                for pattern in patterns:
-                    if line.startswith(pattern):
-                        matched_speaker = character
-                        matched_speech = line.replace(pattern, "", 1).strip()
-                        found_new_speaker = True
-                        break
-                if found_new_speaker:
-                    break
-
-            # 完全一致しない場合、曖昧マッチングを試行
-            if not found_new_speaker:
-                # 行が "話者名:" または "話者名：" のパターンかチェック
-                speaker_pattern = re.match(r"^([^:：]+)[：:]\s*(.*)", line)
-                if speaker_pattern:
-                    potential_speaker, speech = speaker_pattern.groups()
-                    potential_speaker = potential_speaker.strip()
-
-                    # 曖昧マッチングで最適なキャラクターを探す
-                    best_character = self._find_best_character_match(potential_speaker)
-
-                    # マッチした場合
-                    if best_character:
-                        matched_speaker = best_character
-                        matched_speech = speech.strip()
-                        found_new_speaker = True
-                        logger.debug(f"Fuzzy matched '{potential_speaker}' to '{best_character}'")
-
-            # 新しい話者が見つかった場合
-            if found_new_speaker and matched_speaker:
-                # 前の話者の発言があれば追加
-                if current_speaker and current_speech:
-                    conversation_parts.append((current_speaker, current_speech))
-
-                # 新しい話者と発言を設定
-                current_speaker = matched_speaker
-                current_speech = matched_speech
-            # 話者の切り替えがなく、現在の話者が存在する場合、行を現在の発言に追加
-            elif not found_new_speaker and current_speaker:
-                if line:  # 行に内容がある場合
-                    # すでに発言内容があれば改行を追加
-                    if current_speech:
-                        current_speech += "\n" + line
-                    else:
-                        current_speech = line
-                else:  # 空行の場合
-                    # 空行も保持（改行として追加）
-                    if current_speech:
-                        current_speech += "\n"
+        return get_global_script_parser().find_best_character_match(input_name)
 
-        # 最後の話者の発言があれば追加
-        if current_speaker and current_speech:
-            conversation_parts.append((current_speaker, current_speech))
+    def _extract_conversation_parts(self, podcast_text: str) -> List[Tuple[str, str]]:
+        """
+        Podcast textから会話部分を抽出する（解析結果はスクリプトごとにキャッシュされる）
 
-        # 会話部分が見つからない場合はフォーマット修正を試みる
-        if not conversation_parts:
-            logger.warning("No valid conversation parts found. Attempting to fix format...")
-            fixed_text = self._fix_conversation_format(podcast_text)
-            if fixed_text != podcast_text:
-                return self._extract_conversation_parts(fixed_text)
+        Args:
+            podcast_text (str): 会話テキスト
 
-        logger.info(f"Extracted {len(conversation_parts)} conversation parts")
-        return conversation_parts
+        Returns:
+            List[Tuple[str, str]]: (話者名, セリフ)のタプルリスト
+        """
+        return list(get_global_script_parser().parse(podcast_text))
 
     def _generate_and_combine_audio_with_resume(
-        self, conversation_parts: List[Tuple[str, str]], temp_dir: Path, resume_from_part: int = 0, existing_parts: Optional[List[str]] = None
+        self,
+        conversation_parts: List[Tuple[str, str]],
+        temp_dir: Path,
+        resume_from_part: int = 0,
+        existing_parts: Optional[List[str]] = None,
+        previous_parts: Optional[List[PartRecord]] = None,
     ) -> Generator[str, None, None]:
         """
-        会話部分から音声生成と結合を行う（部分再開対応）
+        会話部分から音声生成と結合を行う（部分再開・編集前のパートの再利用対応）
+
+        Args:
+            conversation_parts: (話者, セリフ)のリスト
+            temp_dir: 一時ファイル保存ディレクトリ
+            resume_from_part: 再開する部分のインデックス
+            existing_parts: 既存の音声パートファイルのリスト
+            previous_parts: 編集前の台本の音声パートの記録のリスト（変更のないセリフのパートを再利用する）
+
+        Yields:
+            str: 生成された音声ファイルパス
+        """
+        assembly = self._create_assembly(conversation_parts, temp_dir, resume_from_part)
+        # エンコード中のファイル（合成はエンコードの完了を待たず、完了したものから順に提供する）
+        encoding: Deque["Future[str]"] = deque()
+        try:
+            yield from self._restore_existing_parts(assembly, conversation_parts, resume_from_part, existing_parts)
+            self._stash_reusable_parts(assembly, resume_from_part, previous_parts)
+
+            for segment in self._synthesize_conversation_chunks(conversation_parts, resume_from_part, skip_parts=assembly.reused_parts.keys()):
+                # 合成したパートより前の再利用するパートを先に結合する
+                encoding.extend(self._encode_output(audio_path) for audio_path in self._assemble_with_reused_parts(assembly, conversation_parts, segment))
+                yield from self._take_encoded(encoding)
+            encoding.extend(self._encode_output(audio_path) for audio_path in self._restore_reused_parts(assembly, conversation_parts, len(conversation_parts)))
+            while encoding:
+                yield encoding.popleft().result()
+
+            output_file = self._finish_assembly(assembly)
+            if output_file:
+                # 圧縮はエンコーダーのワーカーで行い、合成スレッドを止めない
+                self.final_audio_path = self._encode_output(output_file).result()
+                yield self.final_audio_path
+        finally:
+            # 中断された場合は書きかけの最終ファイルを削除し、HLSのエンコーダーを止める
+            assembly.final_writer.abort()
+            if assembly.segmenter is not None:
+                assembly.segmenter.abort()
+
+    async def _generate_and_combine_audio_with_resume_async(
+        self,
+        conversation_parts: List[Tuple[str, str]],
+        temp_dir: Path,
+        resume_from_part: int = 0,
+        existing_parts: Optional[List[str]] = None,
+        previous_parts: Optional[List[PartRecord]] = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        会話部分から音声生成と結合を行う（部分再開・編集前のパートの再利用対応、非同期版）
 
         Args:
             conversation_parts: (話者, セリフ)のリスト
             temp_dir: 一時ファイル保存ディレクトリ
             resume_from_part: 再開する部分のインデックス
             existing_parts: 既存の音声パートファイルのリスト
+            previous_parts: 編集前の台本の音声パートの記録のリスト（変更のないセリフのパートを再利用する）
 
         Yields:
             str: 生成された音声ファイルパス
         """
+        # 後処理（numpy）とファイルの読み書きはイベントループを止めないようスレッドで実行する
+        assembly = await asyncio.to_thread(self._create_assembly, conversation_parts, temp_dir, resume_from_part)
+        encoding: Deque["Future[str]"] = deque()
+        try:
+            for audio_path in await asyncio.to_thread(self._restore_existing_parts, assembly, conversation_parts, resume_from_part, existing_parts):
+                yield audio_path
+            await asyncio.to_thread(self._stash_reusable_parts, assembly, resume_from_part, previous_parts)
+
+            async for segment in self._synthesize_conversation_chunks_async(conversation_parts, resume_from_part, skip_parts=assembly.reused_parts.keys()):
+                # 合成したパートより前の再利用するパートを先に結合する
+                encoding.extend(self._encode_output(audio_path) for audio_path in await asyncio.to_thread(self._assemble_with_reused_parts, assembly, conversation_parts, segment))
+                for audio_path in self._take_encoded(encoding):
+                    yield audio_path
+            encoding.extend(self._encode_output(audio_path) for audio_path in await asyncio.to_thread(self._restore_reused_parts, assembly, conversation_parts, len(conversation_parts)))
+            while encoding:
+                yield await asyncio.wrap_future(encoding.popleft())
+
+            output_file = await asyncio.to_thread(self._finish_assembly, assembly)
+            if output_file:
+                self.final_audio_path = await asyncio.wrap_future(self._encode_output(output_file))
+                yield self.final_audio_path
+        finally:
+            # 中断された場合は書きかけの最終ファイルを削除し、HLSのエンコーダーを止める
+            assembly.final_writer.abort()
+            if assembly.segmenter is not None:
+                assembly.segmenter.abort()
+
+    def _assemble_with_reused_parts(self, assembly: "_AudioAssembly", conversation_parts: List[Tuple[str, str]], segment: Tuple[int, str, int, bool, bytes]) -> List[str]:
+        """
+        合成したパートより前の再利用するパートを結合してから、合成したセグメントを結合する
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            conversation_parts: (話者, セリフ)のリスト
+            segment: 合成されたセグメント（_synthesize_conversation_chunksの出力）
+
+        Returns:
+            List[str]: ストリーミング再生用に提供するファイルのパス
+        """
+        return self._restore_reused_parts(assembly, conversation_parts, segment[0]) + self._assemble_segment(assembly, *segment)
+
+    @staticmethod
+    def _take_encoded(encoding: Deque["Future[str]"]) -> List[str]:
+        """
+        エンコードが完了したファイルを投入順に取り出す（完了していない先頭のファイル以降は待たずに残す）
+
+        Args:
+            encoding: エンコード中のファイルのFuture（投入順）
+
+        Returns:
+            List[str]: 提供するファイルのパス
+        """
+        ready_paths = []
+        while encoding and encoding[0].done():
+            ready_paths.append(encoding.popleft().result())
+        return ready_paths
+
+    def _finish_assembly(self, assembly: "_AudioAssembly") -> Optional[str]:
+        """
+        HLSプレイリストを完了させ、最終的な音声ファイルを確定する
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+
+        Returns:
+            Optional[str]: 最終的な音声ファイルのパス。作成できなかった場合はNone
+        """
+        if assembly.segmenter is not None:
+            assembly.segmenter.finish()
+        return self._write_final_audio(assembly)
+
+    def _encode_output(self, audio_path: str) -> "Future[str]":
+        """
+        生成した音声ファイルを設定された圧縮形式へのエンコードに投入する
+
+        最終ファイルは圧縮形式で提供する（KEEP_WAV_ARCHIVEが有効な場合はWAVも保存）。
+        パートファイルは再開・結合に使うWAVを残し、ENCODE_STREAMING_PARTSが有効な場合のみ
+        ストリーミング再生用に圧縮したコピーを提供する。チャンクファイルはエンコードしない。
+
+        Args:
+            audio_path: 生成した音声ファイルのパス
+
+        Returns:
+            Future[str]: 提供するファイルのパスで解決されるFuture
+        """
+        encoder = get_global_audio_encoder()
+        filename = os.path.basename(audio_path)
+        if encoder is not None and filename.startswith("audio_"):
+            return encoder.submit(audio_path, keep_source=KEEP_WAV_ARCHIVE)
+        if encoder is not None and filename.startswith("part_") and ENCODE_STREAMING_PARTS:
+            return encoder.submit(audio_path, keep_source=True)
+
+        future: Future[str] = Future()
+        future.set_result(audio_path)
+        return future
+
+    def _create_segmenter(self, temp_dir: Path) -> Optional[HlsSegmenter]:
+        """
+        HLS出力が有効な場合、ストリームごとのセグメントディレクトリのセグメンターを作成する
+
+        Args:
+            temp_dir: ストリームの一時ディレクトリ（ディレクトリ名をセグメントディレクトリ名に使う）
+
+        Returns:
+            Optional[HlsSegmenter]: セグメンター。HLS出力が無効な場合はNone
+        """
+        if not HLS_STREAMING:
+            return None
+        encoder = get_global_audio_encoder()
+        ffmpeg_path = encoder.ffmpeg_path if encoder is not None else None
+        if ffmpeg_path is None:
+            logger.warning("ffmpeg not found, HLS output is disabled")
+            return None
+        segmenter = HlsSegmenter(self.output_dir / "hls" / temp_dir.name, ffmpeg_path)
+        self._release_hls_token()
+        self.hls_playlist_path = str(segmenter.playlist_path)
+        self.hls_token = hls_playlists.register(segmenter.output_dir)
+        return segmenter
+
+    @property
+    def hls_playlist_url(self) -> Optional[str]:
+        """
+        HLSプレイリストの配信URLを取得する（トークンで配信するため、他のセッションのディレクトリは読めない）
+
+        Returns:
+            Optional[str]: プレイリストのURL。HLS出力が無効な場合はNone
+        """
+        return playlist_url(self.hls_token) if self.hls_token is not None else None
+
+    def _release_hls_token(self) -> None:
+        """前回のHLSプレイリストの配信を停止する"""
+        if self.hls_token is not None:
+            hls_playlists.release(self.hls_token)
+            self.hls_token = None
+
+    def _create_final_writer(self) -> StreamingWavWriter:
+        """
+        日付付きのファイル名で最終的な音声ファイルのライターを作成する
+
+        Returns:
+            StreamingWavWriter: 最終的な音声ファイルのライター
+        """
+        date_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_id = uuid.uuid4().hex[:8]
+        return StreamingWavWriter(self.output_dir / f"audio_{date_str}_{file_id}.wav")
+
+    def _create_assembly(self, conversation_parts: List[Tuple[str, str]], temp_dir: Path, resume_from_part: int = 0) -> "_AudioAssembly":
+        """
+        音声の組み立て状態を作成し、新規生成の場合はマニフェストに生成の開始を記録する
+
+        Args:
+            conversation_parts: (話者, セリフ)のリスト
+            temp_dir: 一時ファイル保存ディレクトリ（ディレクトリ名を生成の識別に使う）
+            resume_from_part: 再開する部分のインデックス（再開の場合は同じ生成にパートを追記する）
+
+        Returns:
+            _AudioAssembly: 音声の組み立て状態
+        """
+        manifest = PartManifest(self.temp_dir)
+        if resume_from_part == 0:
+            manifest.start_generation(temp_dir.name, self.script_hash, len(conversation_parts))
+        self._remove_stale_reusable_parts()
+
+        # パートの音声はエンジン（辞書）のバージョンと出力形式にも依存するため、ターンのキーに含める
+        postprocessor = AudioPostProcessor()
+        manager = get_global_voicevox_manager()
+        audio_version = f"{manager.engine_version if manager is not None else ''}|{postprocessor.output_version}"
+        return _AudioAssembly(
+            temp_dir,
+            self._create_final_writer(),
+            segmenter=self._create_segmenter(temp_dir),
+            manifest=manifest,
+            script_hash=self.script_hash,
+            turn_keys=turn_keys(conversation_parts, audio_version),
+            postprocessor=postprocessor,
+        )
+
+    def _remove_stale_reusable_parts(self) -> None:
+        """
+        中断された生成が再利用のために退避したまま残ったパートを削除する
+
+        退避したパートはマニフェストの記録と場所が異なり再利用できないため、生成の開始・再開時に削除する。
+        """
+        for stash_dir in self.temp_dir.glob(f"*/{REUSABLE_PARTS_DIRNAME}"):
+            logger.info(f"Removing reusable parts left by an interrupted generation: {stash_dir}")
+            shutil.rmtree(stash_dir, ignore_errors=True)
+
+    def _stash_reusable_parts(self, assembly: "_AudioAssembly", start_part: int, previous_parts: Optional[List[PartRecord]]) -> None:
+        """
+        編集前の台本のパートと差分を取り、変更のないセリフのパートを再利用のために退避する
+
+        再利用するパートはストリームディレクトリのサブディレクトリに移動し、結合する順番が来たら
+        パートファイルとして配置する（中断しても再開時にパート数を誤らないため）。再利用しないパートは削除する。
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            start_part: 合成を開始するパートのインデックス（それより前のパートは再利用しない）
+            previous_parts: 編集前の台本の音声パートの記録のリスト
+        """
+        if not previous_parts:
+            return
+
+        reuse = plan_part_reuse(previous_parts, assembly.turn_keys)
+        stash_dir = assembly.temp_dir / REUSABLE_PARTS_DIRNAME
+        moved = set()
+        for index, record in sorted(reuse.items()):
+            if index < start_part:
+                continue
+            try:
+                stash_dir.mkdir(exist_ok=True)
+                stashed = stash_dir / f"{index:03d}.wav"
+                os.replace(record.path, stashed)
+            except OSError as e:
+                logger.warning(f"Failed to reuse part {os.path.basename(record.path)}: {e}")
+                continue
+            assembly.reused_parts[index] = (stashed, record)
+            moved.add(record.path)
+
+        for record in previous_parts:
+            if record.path not in moved:
+                with contextlib.suppress(OSError):
+                    os.unlink(record.path)
+        logger.info(f"Reusing {len(assembly.reused_parts)} of {len(previous_parts)} parts from the previous script; synthesizing {len(assembly.turn_keys) - start_part - len(assembly.reused_parts)}")
+
+    def _restore_reused_parts(self, assembly: "_AudioAssembly", conversation_parts: List[Tuple[str, str]], up_to: int) -> List[str]:
+        """
+        指定したパートより前の再利用するパートを、パートファイルとして配置して結合する
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            conversation_parts: (話者, セリフ)のリスト
+            up_to: このインデックスより前の再利用するパートを結合する
+
+        Returns:
+            List[str]: ストリーミング再生用に提供するパートファイルのパス
+        """
+        ready_paths: List[str] = []
+        for index in sorted(index for index in assembly.reused_parts if index < up_to):
+            stashed, record = assembly.reused_parts.pop(index)
+            speaker = conversation_parts[index][0]
+            part_path = assembly.temp_dir / f"part_{index:03d}_{speaker}.wav"
+            try:
+                os.replace(stashed, part_path)
+            except OSError as e:
+                logger.error(f"Failed to restore reused part {index}: {e}")
+                continue
+            if not assembly.final_writer.append_file(part_path):
+                logger.error(f"Failed to load reused part {part_path.name}")
+                continue
+            if assembly.segmenter is not None:
+                assembly.segmenter.append_file(part_path)
+            assembly.temp_files.append(str(part_path))
+            assembly.previous_speaker = speaker
+            # 再利用したパートの音量も話者ごとの音量の履歴に加え、以降の新しいパートの正規化をそろえる
+            assembly.postprocessor.observe_loudness(speaker, record.loudness)
+            self._record_part(assembly, index, part_path, record.size, record.duration, record.loudness)
+            logger.debug(f"Reusing part {index} from the previous script: {part_path.name}")
+            ready_paths.append(str(part_path))
+
+        if ready_paths and not assembly.reused_parts:
+            with contextlib.suppress(OSError):
+                (assembly.temp_dir / REUSABLE_PARTS_DIRNAME).rmdir()
+        return ready_paths
+
+    def _record_part(self, assembly: "_AudioAssembly", index: int, part_path: Path, size: int, duration: float, loudness: float = 0.0) -> None:
+        """
+        完成したパートファイルをマニフェストに記録する（再開・復元・編集後の再利用のため）
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            index: パートのインデックス
+            part_path: パートファイルのパス
+            size: パートファイルのバイト数
+            duration: パートの再生時間（秒）
+            loudness: 正規化前のパートの音量（RMS、測定していない場合は0.0）
+        """
+        if assembly.manifest is None or index >= len(assembly.turn_keys):
+            return
+        assembly.manifest.add_part(PartRecord(assembly.temp_dir.name, assembly.script_hash, index, assembly.turn_keys[index], str(part_path), size, duration, loudness))
+
+    def _restore_existing_parts(self, assembly: "_AudioAssembly", conversation_parts: List[Tuple[str, str]], resume_from_part: int, existing_parts: Optional[List[str]]) -> List[str]:
+        """
+        再開時に既存のパートを読み込み、結合対象に追加する
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            conversation_parts: (話者, セリフ)のリスト
+            resume_from_part: 再開する部分のインデックス
+            existing_parts: 既存の音声パートファイルのリスト
+
+        Returns:
+            List[str]: ストリーミング再生用に提供する既存パートのパス
+        """
         logger.info("Starting audio generation and combination")
         logger.debug(f"Conversation parts count: {len(conversation_parts)}")
         logger.debug(f"Resume from part: {resume_from_part}")
         logger.debug(f"Existing parts count: {len(existing_parts or [])}")
 
-        wav_data_list = []  # メモリ上に直接音声データを保持するリスト
-        temp_files = []  # 一時ファイルのパスを保持するリスト
         total_parts = len(conversation_parts)
-
         logger.info(f"Starting audio generation: total_parts={total_parts}, resume_from_part={resume_from_part}, existing_parts={len(existing_parts or [])}")
 
-        # 既存のパートがある場合、それらをまず yield し、wav_data_list に追加
+        restored_paths = []
+        # 既存のパートがある場合、それらをまず yield し、最終ファイルに追記
         if existing_parts and resume_from_part > 0:
             logger.info(f"PROCESSING {len(existing_parts)} existing parts...")
             for i, existing_part_path in enumerate(existing_parts):
-                if existing_part_path and os.path.exists(existing_part_path):
+                # 圧縮したストリーミング用のコピーの場合は、同じパートのWAVを結合に使う
+                wav_part_path = str(Path(existing_part_path).with_suffix(".wav")) if existing_part_path else existing_part_path
+                if wav_part_path and os.path.exists(wav_part_path):
                     logger.debug(f"Restoring existing part {i}: {os.path.basename(existing_part_path)}")
-                    # 既存パートの音声データを読み込んで wav_data_list に追加
-                    try:
-                        with open(existing_part_path, "rb") as f:
-                            existing_wav_data = f.read()
-                        wav_data_list.append(existing_wav_data)
-                        temp_files.append(existing_part_path)
+                    # 既存パートはPythonに読み込まず、PCMデータをカーネル内コピーで最終ファイルに追記
+                    if assembly.final_writer.append_file(wav_part_path):
+                        assembly.temp_files.append(wav_part_path)
+                        if assembly.segmenter is not None:
+                            assembly.segmenter.append_file(wav_part_path)
 
                         # 既存パートを yield（ストリーミング再生用）
                         logger.debug(f"Yielding existing part {i} for streaming")
-                        yield existing_part_path
-                    except Exception as e:
-                        logger.error(f"Failed to load existing part {existing_part_path}: {e}")
+                        restored_paths.append(existing_part_path)
+                    else:
+                        logger.error(f"Failed to load existing part {existing_part_path}")
                 else:
                     logger.warning(f"Existing part {i} does not exist: {os.path.basename(existing_part_path) if existing_part_path else 'None'}")
 
+        # 再開したパートの前の間は、既存の最後のパートの話者を基準にする
+        if assembly.temp_files and 0 < resume_from_part <= len(conversation_parts):
+            assembly.previous_speaker = conversation_parts[resume_from_part - 1][0]
+
         # resume_from_part から新しい音声生成を開始
         logger.info(f"Starting NEW generation from part {resume_from_part} to {total_parts - 1}")
-        for i in range(resume_from_part, total_parts):
-            speaker, text = conversation_parts[i]
+        return restored_paths
 
-            # 進捗状況の更新
-            self.audio_generation_progress = (i + 1) / total_parts * 0.8
+    def _assemble_segment(self, assembly: "_AudioAssembly", i: int, speaker: str, segment_index: int, is_last: bool, chunk_wav_data: bytes) -> List[str]:
+        """
+        合成された音声セグメントを保存し、パートが揃ったらパートファイルに結合する
 
-            if not text.strip():
-                logger.debug(f"Skipping empty text for part {i}")
-                continue
+        Args:
+            assembly: 生成中の音声の組み立て状態
+            i: パートのインデックス
+            speaker: 話者
+            segment_index: パート内のセグメント番号
+            is_last: パートの最後のセグメントか
+            chunk_wav_data: セグメントのWAVデータ
+
+        Returns:
+            List[str]: ストリーミング再生用に提供するファイルのパス
+        """
+        ready_paths = []
+        temp_dir = assembly.temp_dir
+        if chunk_wav_data:
+            assembly.chunk_wav_data_list.append(chunk_wav_data)
+            if segment_index > 0 or not is_last:
+                # 複数のセグメントからなるパートはセグメントごとにストリーミング再生用に提供
+                chunk_file_path = temp_dir / f"chunk_{i:03d}_{segment_index:03d}_{speaker}.wav"
+                with open(chunk_file_path, "wb") as f:
+                    f.write(chunk_wav_data)
+                assembly.chunk_files.append(chunk_file_path)
+                logger.debug(f"Yielding segment {segment_index} of part {i}")
+                ready_paths.append(str(chunk_file_path))
+        else:
+            logger.error(f"Failed to generate audio for segment {segment_index} of part {i}")
+
+        if not is_last:
+            return ready_paths
+
+        # パートの全チャンクが揃ったら1つのパートファイルに結合する（再開・パート番号の管理用）
+        part_wav_data = self._combine_wav_data_in_memory(assembly.chunk_wav_data_list)
+        assembly.chunk_wav_data_list = []
+        if part_wav_data:
+            # 前後の無音を除去し、話者ごとの音量をそろえ、前のパートとの間を挿入する
+            part_wav_data = assembly.postprocessor.process_turn(part_wav_data, speaker, assembly.previous_speaker)
+            assembly.previous_speaker = speaker
+        for chunk_file in assembly.chunk_files:
+            with contextlib.suppress(OSError):
+                chunk_file.unlink()
+        assembly.chunk_files = []
+
+        if part_wav_data:
+            # 一時ファイルに書き込み、ストリーミング再生用に提供
+            temp_file_path = temp_dir / f"part_{i:03d}_{speaker}.wav"
+            with open(temp_file_path, "wb") as f:
+                f.write(part_wav_data)
+
+            # パートファイルのPCMデータをカーネル内コピーで最終ファイルに追記
+            assembly.final_writer.append_file(temp_file_path)
+            if assembly.segmenter is not None:
+                assembly.segmenter.append_file(temp_file_path)
+
+            assembly.temp_files.append(str(temp_file_path))
+            self._record_part(assembly, i, temp_file_path, len(part_wav_data), get_wav_duration(part_wav_data), assembly.postprocessor.last_turn_loudness)
+
+            # ストリーミング再生用に現在のパートをyield
+            logger.debug(f"Generated and yielding NEW part {i}: {temp_file_path.name}")
+            ready_paths.append(str(temp_file_path))
+        else:
+            logger.error(f"Failed to generate audio for part {i}")
+
+        return ready_paths
+
+    def _write_final_audio(self, assembly: "_AudioAssembly") -> Optional[str]:
+        """
+        逐次追記した最終的な音声ファイルのヘッダーを確定し、出力ファイルとして配置する
+
+        Args:
+            assembly: 生成中の音声の組み立て状態
+
+        Returns:
+            Optional[str]: 最終的な音声ファイルのパス。作成できなかった場合はNone
+        """
+        logger.info(f"Finalizing combined audio of {len(assembly.temp_files)} parts ({assembly.final_writer.nframes} frames)")
+        try:
+            final_path = assembly.final_writer.close()
+        except Exception as e:
+            logger.error(f"音声ファイルの書き込みエラー: {str(e)}")
+            return None
 
-            logger.debug(f"Generating NEW part {i}: {speaker} - {len(text)} chars")
+        if final_path is None:
+            return None
+        output_file = str(final_path)
 
-            # 音声生成
-            style_id = STYLE_ID_BY_NAME[speaker]
-            part_wav_data = self._text_to_speech(text, style_id)
+        # クラス変数に最終的なファイルパスを保存
+        self.final_audio_path = output_file
+        self.audio_generation_progress = 1.0
 
-            if part_wav_data:
-                wav_data_list.append(part_wav_data)
+        logger.info(f"Final combined audio created: {output_file}")
+        return output_file
 
-                # 一時ファイルに書き込み、ストリーミング再生用に提供
-                temp_file_path = temp_dir / f"part_{i:03d}_{speaker}.wav"
-                with open(temp_file_path, "wb") as f:
-                    f.write(part_wav_data)
+    def _split_into_sentence_chunks(self, text: str, max_chars: Optional[int] = None) -> List[str]:
+        """
+        長いセリフを文の区切り（。！？と改行）で合成用のチャンクに分割する
 
-                temp_files.append(str(temp_file_path))
+        文字数の上限に収まる範囲で連続する文をまとめる。1文が上限を超える場合は
+        読点で分割し、それでも超える場合はそのまま1チャンクとする。
+
+        Args:
+            text: セリフ
+            max_chars: 1チャンクの文字数の上限（省略時はSYNTHESIS_CHUNK_CHARS、0以下の場合は分割しない）
 
-                # ストリーミング再生用に現在のパートをyield
-                logger.debug(f"Generated and yielding NEW part {i}: {temp_file_path.name}")
-                yield str(temp_file_path)
+        Returns:
+            List[str]: チャンクのリスト
+        """
+        if max_chars is None:
+            max_chars = SYNTHESIS_CHUNK_CHARS
+        if max_chars <= 0 or len(text) <= max_chars:
+            return [text]
+
+        sentences: List[str] = []
+        for sentence in self.SENTENCE_BOUNDARY_PATTERN.split(text):
+            if len(sentence) > max_chars:
+                sentences.extend(self.CLAUSE_BOUNDARY_PATTERN.split(sentence))
             else:
-                logger.error(f"Failed to generate audio for part {i}")
+                sentences.append(sentence)
+
+        chunks = []
+        current = ""
+        for sentence in sentences:
+            if current.strip() and len(current) + len(sentence) > max_chars:
+                chunks.append(current.strip())
+                current = ""
+            current += sentence
+        if current.strip():
+            chunks.append(current.strip())
+
+        return chunks or [text]
+
+    def _synthesize_conversation_chunks(
+        self, conversation_parts: List[Tuple[str, str]], start_part: int = 0, skip_parts: AbstractSet[int] = frozenset()
+    ) -> Generator[Tuple[int, str, int, bool, bytes], None, None]:
+        """
+        会話パートを文単位のチャンクに分割し、台本順に音声合成する
+
+        スケジューラーまたはワーカープールが有効な場合は先読みしたチャンクをキューに投入し、
+        結果は常に台本の順番でyieldする。ワーカープールを使用せず
+        STREAMING_RENDERが有効な場合は、チャンクをさらにフレーム単位で逐次生成する。
 
-        # メモリ上で音声データを結合して最終的な音声ファイルを作成
-        if wav_data_list:
-            logger.info(f"Combining {len(wav_data_list)} audio parts into final file")
-            combined_wav_data = self._combine_wav_data_in_memory(wav_data_list)
+        Args:
+            conversation_parts: (話者, セリフ)のリスト
+            start_part: 合成を開始するパートのインデックス
+            skip_parts: 合成しないパートのインデックス（再利用するパート）
 
-            if combined_wav_data:
-                # 日付付きの最終的な出力ファイル名を生成
-                now = datetime.datetime.now()
-                date_str = now.strftime("%Y%m%d_%H%M%S")
-                file_id = uuid.uuid4().hex[:8]
+        Yields:
+            Tuple[int, str, int, bool, bytes]: (パートのインデックス, 話者, パート内のセグメント番号, パートの最後のセグメントか, WAVデータ)
+        """
+        total_parts = len(conversation_parts)
+        pool = get_global_synthesis_pool()
+        scheduler = get_global_synthesis_scheduler()
+        sequential = pool is None and (scheduler is None or STREAMING_RENDER)
+        # 先行投入するチャンク数（メモリ使用量と他セッションへの公平性のため上限を設ける）
+        capacity = scheduler.capacity if scheduler else pool.size if pool else 1
+        lookahead = capacity * 2
+        in_flight: Deque[Tuple[int, str, int, int, "Future[bytes]"]] = deque()
+
+        def take_completed() -> Tuple[int, str, int, bool, bytes]:
+            index, speaker, chunk_index, num_chunks, future = in_flight.popleft()
+            self.audio_generation_progress = (index + (chunk_index + 1) / num_chunks) / total_parts * 0.8
+            return index, speaker, chunk_index, chunk_index == num_chunks - 1, future.result()
 
-                self.output_dir.mkdir(parents=True, exist_ok=True)
-                output_file = str(self.output_dir / f"audio_{date_str}_{file_id}.wav")
+        try:
+            for i in range(start_part, total_parts):
+                speaker, text = conversation_parts[i]
+
+                if not text.strip():
+                    logger.debug(f"Skipping empty text for part {i}")
+                    continue
+                if i in skip_parts:
+                    continue
+
+                style_id = STYLE_ID_BY_NAME[speaker]
+                chunks = self._split_into_sentence_chunks(text)
+                # このジョブの最初のパートは優先レーンで合成し、最初の音声を早く届ける
+                priority = i - start_part < PRIORITY_TURNS
+                logger.debug(f"Generating NEW part {i}: {speaker} - {len(text)} chars in {len(chunks)} chunks")
+
+                if sequential:
+                    segment_index = 0
+                    for j, chunk in enumerate(chunks):
+                        is_last_chunk = j == len(chunks) - 1
+                        for wav_data, is_last_segment in self._text_to_speech_segments(chunk, style_id, priority):
+                            yield i, speaker, segment_index, is_last_chunk and is_last_segment, wav_data
+                            segment_index += 1
+                        # 進捗状況の更新
+                        self.audio_generation_progress = (i + (j + 1) / len(chunks)) / total_parts * 0.8
+                    continue
+
+                for j, chunk in enumerate(chunks):
+                    in_flight.append((i, speaker, j, len(chunks), self._submit_chunk(chunk, style_id, priority)))
+                    if len(in_flight) >= lookahead:
+                        yield take_completed()
+
+            while in_flight:
+                yield take_completed()
+        finally:
+            # 生成が中断された場合は、この生成が投入した未着手のチャンクのみ取り消す（同じセッションの新しい生成は残す）
+            if scheduler is not None:
+                scheduler.cancel_jobs(future for *_, future in in_flight)
+                scheduler.release_session(self.session_id)
+            for *_, future in in_flight:
+                future.cancel()
+
+    async def _synthesize_conversation_chunks_async(
+        self, conversation_parts: List[Tuple[str, str]], start_part: int = 0, skip_parts: AbstractSet[int] = frozenset()
+    ) -> AsyncGenerator[Tuple[int, str, int, bool, bytes], None]:
+        """
+        会話パートを文単位のチャンクに分割し、台本順に音声合成する（非同期版）
 
-                try:
-                    with open(output_file, "wb") as f:
-                        f.write(combined_wav_data)
+        スケジューラーまたはワーカープールのFutureをawaitするため、合成中もスレッドを占有しない。
+        どちらも無効な場合はVOICEVOX Coreマネージャーの非同期APIで1チャンクずつ合成する。
+        ワーカープールを使用せずSTREAMING_RENDERが有効な場合は、チャンクをさらにフレーム単位で逐次生成する。
 
-                    # クラス変数に最終的なファイルパスを保存
-                    self.final_audio_path = output_file
-                    self.audio_generation_progress = 1.0
+        Args:
+            conversation_parts: (話者, セリフ)のリスト
+            start_part: 合成を開始するパートのインデックス
+            skip_parts: 合成しないパートのインデックス（再利用するパート）
 
-                    logger.info(f"Final combined audio created: {output_file}")
-                    yield output_file
+        Yields:
+            Tuple[int, str, int, bool, bytes]: (パートのインデックス, 話者, パート内のセグメント番号, パートの最後のセグメントか, WAVデータ)
+        """
+        total_parts = len(conversation_parts)
+        pool = get_global_synthesis_pool()
+        scheduler = get_global_synthesis_scheduler()
+        streaming = pool is None and STREAMING_RENDER
+        capacity = scheduler.capacity if scheduler else pool.size if pool else 1
+        lookahead = capacity * 2
+        in_flight: Deque[Tuple[int, str, int, int, "asyncio.Future[bytes]"]] = deque()
+        # この生成がスケジューラーまたはワーカープールに投入したチャンク
+        submitted: List["Future[bytes]"] = []
+
+        async def take_completed() -> Tuple[int, str, int, bool, bytes]:
+            index, speaker, chunk_index, num_chunks, future = in_flight.popleft()
+            wav_data = await future
+            self.audio_generation_progress = (index + (chunk_index + 1) / num_chunks) / total_parts * 0.8
+            return index, speaker, chunk_index, chunk_index == num_chunks - 1, wav_data
 
-                except Exception as e:
-                    logger.error(f"音声ファイルの書き込みエラー: {str(e)}")
-            else:
-                logger.error("音声データの結合に失敗しました")
+        try:
+            for i in range(start_part, total_parts):
+                speaker, text = conversation_parts[i]
+
+                if not text.strip():
+                    logger.debug(f"Skipping empty text for part {i}")
+                    continue
+                if i in skip_parts:
+                    continue
+
+                style_id = STYLE_ID_BY_NAME[speaker]
+                chunks = self._split_into_sentence_chunks(text)
+                # このジョブの最初のパートは優先レーンで合成し、最初の音声を早く届ける
+                priority = i - start_part < PRIORITY_TURNS
+                logger.debug(f"Generating NEW part {i}: {speaker} - {len(text)} chars in {len(chunks)} chunks")
+
+                if streaming:
+                    segment_index = 0
+                    for j, chunk in enumerate(chunks):
+                        is_last_chunk = j == len(chunks) - 1
+                        async for wav_data, is_last_segment in self._text_to_speech_segments_async(chunk, style_id, priority):
+                            yield i, speaker, segment_index, is_last_chunk and is_last_segment, wav_data
+                            segment_index += 1
+                        self.audio_generation_progress = (i + (j + 1) / len(chunks)) / total_parts * 0.8
+                    continue
+
+                for j, chunk in enumerate(chunks):
+                    if scheduler is None and pool is None:
+                        future: asyncio.Future[bytes] = asyncio.ensure_future(self._text_to_speech_async(chunk, style_id))
+                    else:
+                        submitted.append(self._submit_chunk(chunk, style_id, priority))
+                        future = asyncio.wrap_future(submitted[-1])
+                    in_flight.append((i, speaker, j, len(chunks), future))
+                    if len(in_flight) >= lookahead:
+                        yield await take_completed()
+
+            while in_flight:
+                yield await take_completed()
+        finally:
+            # 生成が中断された場合は、この生成が投入した未着手のチャンクのみ取り消す（同じセッションの新しい生成は残す）
+            if scheduler is not None:
+                scheduler.cancel_jobs(future for future in submitted if not future.done())
+                scheduler.release_session(self.session_id)
+            for *_, future in in_flight:
+                future.cancel()
+
+    def _submit_chunk(self, text: str, style_id: int, priority: bool = False) -> "Future[bytes]":
+        """
+        チャンクの音声合成をスケジューラーまたはワーカープールに投入する
+
+        Args:
+            text: 音声に変換するテキスト
+            style_id: VOICEVOXのスタイルID
+            priority: スケジューラーの優先レーンに投入するか
+
+        Returns:
+            Future[bytes]: WAVデータで解決されるFuture
+        """
+        pool = get_global_synthesis_pool()
+        scheduler = get_global_synthesis_scheduler()
+        if scheduler is None:
+            if pool is None:
+                raise RuntimeError("Neither the synthesis scheduler nor the worker pool is running")
+            return pool.submit(text, style_id)
+
+        def synthesize() -> bytes:
+            if pool is not None:
+                return pool.submit(text, style_id).result()
+            return self._text_to_speech(text, style_id)
+
+        return scheduler.submit(self.session_id, synthesize, priority=priority)
+
+    def _text_to_speech_segments(self, text: str, style_id: int, priority: bool = False) -> Generator[Tuple[bytes, bool], None, None]:
+        """
+        テキストを音声合成し、生成された順に音声セグメントを返す
+
+        スケジューラーが有効な場合は、他のセッションと順番に合成エンジンを使用する。
+
+        Args:
+            text: 音声に変換するテキスト
+            style_id: VOICEVOXのスタイルID
+            priority: スケジューラーの優先レーンに投入するか
+
+        Yields:
+            Tuple[bytes, bool]: (WAVデータ, 最後のセグメントか)
+        """
+        scheduler = get_global_synthesis_scheduler()
+        if scheduler is None:
+            yield from self._render_segments(text, style_id)
+            return
+
+        segments: "queue.Queue[Optional[Tuple[bytes, bool]]]" = queue.Queue()
+
+        def render() -> None:
+            try:
+                for segment in self._render_segments(text, style_id):
+                    segments.put(segment)
+            except Exception as e:
+                logger.error(f"Audio generation error: {e}")
+                segments.put((b"", True))
+
+        future = scheduler.submit(self.session_id, render, priority=priority)
+        # 合成が取り消されるなどして最後のセグメントが届かない場合も待ち続けないよう、完了時に番兵を入れる
+        future.add_done_callback(lambda _: segments.put(None))
+        try:
+            while True:
+                segment = segments.get()
+                if segment is None:
+                    yield b"", True
+                    return
+                wav_data, is_last = segment
+                yield wav_data, is_last
+                if is_last:
+                    return
+        finally:
+            scheduler.cancel_jobs([future])
+
+    async def _text_to_speech_segments_async(self, text: str, style_id: int, priority: bool = False) -> AsyncGenerator[Tuple[bytes, bool], None]:
+        """
+        テキストを音声合成し、生成された順に音声セグメントを返す（非同期版）
+
+        セグメントの生成を待つ間はスレッドで実行し、イベントループを止めない。
+
+        Args:
+            text: 音声に変換するテキスト
+            style_id: VOICEVOXのスタイルID
+            priority: スケジューラーの優先レーンに投入するか
+
+        Yields:
+            Tuple[bytes, bool]: (WAVデータ, 最後のセグメントか)
+        """
+        segments = self._text_to_speech_segments(text, style_id, priority)
+        try:
+            while True:
+                segment = await asyncio.to_thread(next, segments, None)
+                if segment is None:
+                    return
+                yield segment
+                if segment[1]:
+                    return
+        finally:
+            # 待機中に取り消された場合、スレッドで実行中の生成器は閉じられない（後でガベージコレクションされる）
+            with contextlib.suppress(ValueError):
+                segments.close()
+
+    def _render_segments(self, text: str, style_id: int) -> Generator[Tuple[bytes, bool], None, None]:
+        """
+        テキストを音声合成し、STREAMING_RENDERが有効な場合はフレーム単位で逐次返す
+
+        Args:
+            text: 音声に変換するテキスト
+            style_id: VOICEVOXのスタイルID
+
+        Yields:
+            Tuple[bytes, bool]: (WAVデータ, 最後のセグメントか)
+        """
+        if not STREAMING_RENDER:
+            yield self._text_to_speech(text, style_id), True
+            return
+
+        manager = get_global_voicevox_manager()
+        if manager is None:
+            logger.error("Global VOICEVOX manager is not available")
+            yield b"", True
+            return
+
+        yield from manager.text_to_speech_stream(text, style_id)
+
+    def get_queue_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the synthesis queueing status of this session.
+
+        Returns:
+            Optional[Dict[str, Any]]: Status from the global scheduler, or None when fair scheduling is disabled
+        """
+        scheduler = get_global_synthesis_scheduler()
+        if scheduler is None:
+            return None
+        return scheduler.get_session_status(self.session_id)
 
     def reset_audio_generation_state(self) -> None:
         """音声生成に関連する状態をリセットする"""
         self.audio_generation_progress = 0.0
         self.final_audio_path = None
+        self.hls_playlist_path = None
+        self._release_hls_token()
 
     def _fix_conversation_format(self, text: str) -> str:
         """
@@ -887,70 +2178,7 @@ class AudioGenerator:
         Returns:
             str: 修正された会話テキスト
         """
-        import re
-
-        # 話者名の後にコロンがない場合修正
-        for name in DISPLAY_NAMES:
-            text = re.sub(f"({name})(\\s+)(?=[^\\s:])", f"{name}:\\2", text)
-
-        # カスタム名のキャラクターを検出し、標準名にマッピング
-        lines = text.split("\n")
-        fixed_lines = []
-        speaker_pattern = re.compile(r"^([^:：]+)[：:]\s*(.*)")
-
-        current_speaker = None
-        current_speech = []
-
-        for line in lines:
-            line_stripped = line.strip()
-            match = speaker_pattern.match(line_stripped) if line_stripped else None
-
-            if match:
-                # 新しい話者が検出された場合、前の話者のセリフを追加
-                if current_speaker and current_speech:
-                    fixed_lines.append(f"{current_speaker}: {' '.join(current_speech)}")
-                    current_speech = []
-
-                speaker, speech = match.groups()
-
-                # 曖昧マッチングで最適なキャラクター名を探す
-                best_match = self._find_best_character_match(speaker)
-
-                # 曖昧マッチングの結果を使用
-                current_speaker = best_match
-
-                if speech.strip():
-                    current_speech.append(speech.strip())
-            elif current_speaker:
-                # 現在の話者の発言として処理
-                if line_stripped:
-                    current_speech.append(line_stripped)
-                elif current_speech and not current_speech[-1].endswith("\n"):
-                    # 段落区切りの空行
-                    current_speech[-1] += "\n"
-            elif line_stripped:
-                # 話者が一度も検出されていない場合はデフォルト設定
-                current_speaker = Character.ZUNDAMON.display_name
-                current_speech.append(line_stripped)
-
-        # 最後の話者の発言を追加
-        if current_speaker and current_speech:
-            fixed_lines.append(f"{current_speaker}: {' '.join(current_speech)}")
-
-        # 複数の話者が一行に存在する場合を分割
-        result = []
-        for line in fixed_lines:
-            modified_line = line
-            for name in DISPLAY_NAMES:
-                if f"。{name}" in modified_line:
-                    parts = modified_line.split(f"。{name}")
-                    if len(parts) > 1:
-                        if parts[0].strip():
-                            result.append(f"{parts[0].strip()}。")
-                        modified_line = f"{name}{parts[1]}"
-            result.append(modified_line)
-
-        return "\n".join(result)
+        return get_global_script_parser().fix_format(text)
 
     def _combine_wav_data_in_memory(self, wav_data_list: List[bytes]) -> bytes:
         """
@@ -962,41 +2190,29 @@ class AudioGenerator:
         Returns:
             bytes: 結合されたWAVデータ
         """
-        if not wav_data_list:
-            return b""
-
-        if len(wav_data_list) == 1:
-            return wav_data_list[0]
-
-        total_files = len(wav_data_list)
-        logger.debug(f"音声ファイル結合: {total_files}ファイル")
-
-        # 全てのWAVファイルのパラメータとデータを読み込む
-        wav_params_and_data: List[Tuple[wave._wave_params, bytes]] = []
-
-        for wav_bytes in wav_data_list:
-            with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
-                params = wav_file.getparams()
-                frames = wav_file.readframes(wav_file.getnframes())
-                wav_params_and_data.append((params, frames))
+        return combine_wav_data(wav_data_list)
 
-        # 結果を書き込むためのメモリバッファを作成
-        output_buffer = io.BytesIO()
+    def _text_to_speech(self, text: str, style_id: int) -> bytes:
+        """
+        Generate audio data from text using global VOICEVOX Core manager.
 
-        with wave.open(output_buffer, "wb") as output_wav:
-            # WAVパラメータを設定（最初のファイルと同じ）
-            output_wav.setparams(wav_params_and_data[0][0])
+        Args:
+            text: Text to convert to speech
+            style_id: VOICEVOX style ID
 
-            # 全てのフレームデータを書き込む
-            for _, frames in wav_params_and_data:
-                output_wav.writeframes(frames)
+        Returns:
+            bytes: Generated WAV data
+        """
+        manager = get_global_voicevox_manager()
+        if manager is None:
+            logger.error("Global VOICEVOX manager is not available")
+            return b""
 
-        # 結合されたWAVデータを返す
-        return output_buffer.getvalue()
+        return manager.text_to_speech(text, style_id)
 
-    def _text_to_speech(self, text: str, style_id: int) -> bytes:
+    async def _text_to_speech_async(self, text: str, style_id: int) -> bytes:
         """
-        Generate audio data from text using global VOICEVOX Core manager.
+        Generate audio data from text using global VOICEVOX Core manager without blocking the event loop.
 
         Args:
             text: Text to convert to speech
@@ -1010,7 +2226,7 @@ class AudioGenerator:
             logger.error("Global VOICEVOX manager is not available")
             return b""
 
-        return manager.text_to_speech(text, style_id)
+        return await manager.text_to_speech_async(text, style_id)
 
     def _is_in_user_dict(self, word: str) -> bool:
         """
@@ -0,0 +1,282 @@
+"""Module providing HLS-style segmented output of generated audio.
+
+Streams the audio of completed parts into a single ffmpeg process running the
+HLS muxer, which cuts fixed-duration AAC segments in MPEG-TS and keeps an EVENT
+playlist up to date while synthesis progresses. Players can seek within
+everything generated so far and segments can be cached by standard players and
+CDNs. A single encoder and muxer keep the timestamps continuous across segments
+and avoid an AAC priming gap at every segment boundary. HLS output requires
+ffmpeg and is disabled without it.
+
+Playlists and segments are served by an unguessable token registered for the
+segment directory of a session, not by file path, so a client can only read
+the directories whose tokens were handed to its own session.
+"""
+
+import contextlib
+import os
+import re
+import secrets
+import subprocess
+import threading
+import wave
+from pathlib import Path
+from typing import IO, Dict, Optional, Union
+
+from yomitalk.components.audio_encoder import OUTPUT_AUDIO_BITRATE
+from yomitalk.utils.logger import logger
+from yomitalk.utils.wav_utils import AudioFormat, convert_pcm, read_wav_layout
+
+# Write segmented HLS output (playlist.m3u8 plus segments) next to the streamed parts
+HLS_STREAMING = os.environ.get("YOMITALK_HLS_STREAMING", "false").lower() == "true"
+# Target duration of a segment in seconds
+HLS_SEGMENT_SECONDS = float(os.environ.get("YOMITALK_HLS_SEGMENT_SECONDS", "6"))
+# Name of the playlist file in the segment directory
+PLAYLIST_NAME = "playlist.m3u8"
+# Seconds ffmpeg may take to write the last segment after the input is closed
+FINISH_TIMEOUT = 60.0
+# URL path under which playlists and segments are served by token
+HLS_ROUTE = "/hls"
+# Files a registered segment directory may serve (the playlist and the segments written by ffmpeg)
+SERVED_FILE_PATTERN = re.compile(r"playlist\.m3u8|segment_\d{5}\.ts")
+
+# ffmpeg raw PCM input format per sample width in bytes
+_PCM_FORMATS = {1: "u8", 2: "s16le", 4: "s32le"}
+
+
+class HlsSegmenter:
+    """Segmenter feeding part audio to one ffmpeg HLS muxer that writes segments and an EVENT playlist."""
+
+    def __init__(self, output_dir: Union[str, Path], ffmpeg_path: str, segment_seconds: float = HLS_SEGMENT_SECONDS, bitrate: str = OUTPUT_AUDIO_BITRATE) -> None:
+        """
+        Initialize the segmenter (ffmpeg is started on the first part).
+
+        Args:
+            output_dir: Directory holding the playlist and the segments
+            ffmpeg_path: Path of the ffmpeg binary
+            segment_seconds: Target duration of a segment in seconds
+            bitrate: AAC bitrate of the segments
+        """
+        self.output_dir = Path(output_dir)
+        self.playlist_path = self.output_dir / PLAYLIST_NAME
+        self.ffmpeg_path = ffmpeg_path
+        self.segment_seconds = segment_seconds
+        self.bitrate = bitrate
+        self.finished = False
+
+        self._format: Optional[AudioFormat] = None
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def append_file(self, wav_path: Union[str, Path]) -> bool:
+        """
+        Append the audio of a WAV file to the stream (ffmpeg writes every segment that becomes complete).
+
+        Args:
+            wav_path: WAV file of a completed part
+
+        Returns:
+            bool: True if the audio was passed to ffmpeg
+        """
+        try:
+            with open(wav_path, "rb") as f:
+                layout = read_wav_layout(f)
+                f.seek(layout.data_offset)
+                pcm_data = f.read(layout.data_size)
+        except (OSError, wave.Error) as e:
+            logger.error(f"HLSセグメントへの追加に失敗しました: {wav_path}: {e}")
+            return False
+
+        with self._lock:
+            if self.finished or self._failed:
+                return False
+            if self._format is None:
+                self._format = layout.audio_format
+            elif layout.audio_format != self._format:
+                pcm_data = convert_pcm(pcm_data, layout.audio_format, self._format)
+
+            stdin = self._stdin()
+            if stdin is None:
+                return False
+            try:
+                stdin.write(pcm_data)
+                stdin.flush()
+            except OSError as e:
+                logger.error(f"HLSセグメントのエンコードに失敗しました: {e}")
+                self._failed = True
+                self._stop()
+                return False
+        return True
+
+    def finish(self) -> None:
+        """Close the input so ffmpeg writes the remaining audio as the last segment and ends the playlist."""
+        with self._lock:
+            if self.finished:
+                return
+            self.finished = True
+            process = self._process
+            if process is None or process.stdin is None:
+                return
+            with contextlib.suppress(OSError):
+                process.stdin.close()
+            try:
+                returncode = process.wait(timeout=FINISH_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                logger.error("HLSセグメントの書き込みが時間内に終わりませんでした")
+                self._stop()
+                return
+            if returncode != 0:
+                logger.error(f"HLSセグメントのエンコードに失敗しました (exit code {returncode})")
+
+    def abort(self) -> None:
+        """Stop ffmpeg without finishing the playlist (generation was interrupted)."""
+        with self._lock:
+            self.finished = True
+            self._stop()
+
+    def _stdin(self) -> Optional[IO[bytes]]:
+        """Get the input of the ffmpeg process, starting it on first use (caller must hold the lock)."""
+        if self._process is None:
+            self._process = self._start()
+            if self._process is None:
+                self._failed = True
+                return None
+        return self._process.stdin
+
+    def _start(self) -> Optional["subprocess.Popen[bytes]"]:
+        """
+        Start ffmpeg reading raw PCM of the current format from stdin.
+
+        Returns:
+            Optional[subprocess.Popen[bytes]]: The running process, or None if it could not be started
+        """
+        if self._format is None:
+            return None
+        nchannels, sampwidth, framerate = self._format
+        pcm_format = _PCM_FORMATS.get(sampwidth)
+        if pcm_format is None:
+            logger.error(f"HLSセグメントに未対応のサンプル幅です: {sampwidth}")
+            return None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        command = [
+            self.ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            pcm_format,
+            "-ar",
+            str(framerate),
+            "-ac",
+            str(nchannels),
+            "-i",
+            "pipe:0",
+            "-c:a",
+            "aac",
+            "-b:a",
+            self.bitrate,
+            "-f",
+            "hls",
+            "-hls_time",
+            f"{self.segment_seconds:g}",
+            # EVENT playlists only grow, so players can seek within everything generated so far
+            "-hls_playlist_type",
+            "event",
+            "-hls_flags",
+            "temp_file",
+            "-hls_segment_filename",
+            str(self.output_dir / "segment_%05d.ts"),
+            str(self.playlist_path),
+        ]
+        try:
+            return subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            logger.error(f"HLSセグメントのエンコーダーを起動できませんでした: {e}")
+            return None
+
+    def _stop(self) -> None:
+        """Kill the ffmpeg process if it is running (caller must hold the lock)."""
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        with contextlib.suppress(OSError):
+            process.kill()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(timeout=5)
+        if process.stdin is not None:
+            with contextlib.suppress(OSError):
+                process.stdin.close()
+
+
+class HlsPlaylistRegistry:
+    """Registry mapping unguessable tokens to the segment directories of sessions."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._directories: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def register(self, directory: Union[str, Path]) -> str:
+        """
+        Register a segment directory.
+
+        Args:
+            directory: Directory holding the playlist and the segments
+
+        Returns:
+            str: Token that grants access to the directory
+        """
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._directories[token] = Path(directory)
+        return token
+
+    def release(self, token: str) -> None:
+        """
+        Stop serving the directory of a token.
+
+        Args:
+            token: Token returned by register()
+        """
+        with self._lock:
+            self._directories.pop(token, None)
+
+    def resolve(self, token: str, filename: str) -> Optional[Path]:
+        """
+        Get the file a request for a token may read.
+
+        Args:
+            token: Token returned by register()
+            filename: Requested file name (the playlist or a segment)
+
+        Returns:
+            Optional[Path]: Existing file inside the registered directory, or None if it may not be served
+        """
+        if SERVED_FILE_PATTERN.fullmatch(filename) is None:
+            return None
+        with self._lock:
+            directory = self._directories.get(token)
+        if directory is None:
+            return None
+        path = directory / filename
+        return path if path.is_file() else None
+
+
+def playlist_url(token: str) -> str:
+    """
+    Get the URL of the playlist registered with a token.
+
+    Args:
+        token: Token returned by HlsPlaylistRegistry.register()
+
+    Returns:
+        str: URL path of the playlist (segments are referenced relative to it)
+    """
+    return f"{HLS_ROUTE}/{token}/{PLAYLIST_NAME}"
+
+
+# Segment directories of all sessions that may currently be served
+hls_playlists = HlsPlaylistRegistry()
@@ -0,0 +1,148 @@
+"""Module providing memoized English-to-katakana conversion.
+
+Wraps a single process-wide e2k converter (its model is loaded once instead of
+on every audio generation) with a bounded word-to-katakana memo table. Scripts
+are converted in batches of unique words, so a word repeated throughout a
+technical paper is converted only once. The memo table can be persisted to disk
+so it survives restarts.
+"""
+
+import importlib.metadata
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import e2k
+
+from yomitalk.utils.logger import logger
+
+# Maximum number of converted words kept in memory (0 disables the memo table)
+KATAKANA_MEMO_SIZE = int(os.environ.get("YOMITALK_KATAKANA_MEMO_SIZE", "10000"))
+# File the memo table is persisted to across restarts (empty disables persistence)
+KATAKANA_MEMO_PATH = os.environ.get("YOMITALK_KATAKANA_MEMO_PATH", "")
+
+try:
+    E2K_VERSION = importlib.metadata.version("e2k")
+except importlib.metadata.PackageNotFoundError:
+    E2K_VERSION = "unknown"
+
+
+class KatakanaConverter:
+    """Process-wide English-to-katakana converter with an LRU memo table.
+
+    The e2k model is created on first use and shared by all sessions; calls into
+    it are serialized with a lock. A persisted memo table is only reused when it
+    was written by the same e2k version.
+    """
+
+    def __init__(self, max_entries: int = KATAKANA_MEMO_SIZE, memo_path: str = KATAKANA_MEMO_PATH) -> None:
+        """
+        Initialize the converter and load the persisted memo table.
+
+        Args:
+            max_entries: Maximum number of converted words kept in memory (0 disables the memo table)
+            memo_path: File the memo table is persisted to (empty disables persistence)
+        """
+        self.max_entries = max_entries
+        self.memo_path = Path(memo_path) if memo_path else None
+        self._converter: Optional[e2k.C2K] = None
+        self._memo: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def convert(self, word: str) -> str:
+        """
+        Convert a single English word to katakana.
+
+        Args:
+            word: English word
+
+        Returns:
+            str: Katakana reading
+        """
+        return self.convert_batch([word])[word]
+
+    def convert_batch(self, words: Iterable[str]) -> Dict[str, str]:
+        """
+        Convert English words to katakana, converting each unique word at most once.
+
+        Args:
+            words: English words (duplicates are converted once)
+
+        Returns:
+            Dict[str, str]: Katakana reading of every word
+        """
+        results: Dict[str, str] = {}
+        memoized = 0
+        with self._lock:
+            for word in dict.fromkeys(words):
+                katakana = self._memo.get(word)
+                if katakana is not None:
+                    self._memo.move_to_end(word)
+                    self.hits += 1
+                else:
+                    if self._converter is None:
+                        self._converter = e2k.C2K()
+                    katakana = self._converter(word)
+                    self.misses += 1
+                    if self.max_entries > 0:
+                        self._memo[word] = katakana
+                        memoized += 1
+                        if len(self._memo) > self.max_entries:
+                            self._memo.popitem(last=False)
+                results[word] = katakana
+
+        if memoized:
+            self._save()
+        return results
+
+    def _load(self) -> None:
+        """Load the persisted memo table, ignoring missing, corrupt or outdated files."""
+        if self.memo_path is None or self.max_entries <= 0 or not self.memo_path.exists():
+            return
+        try:
+            data = json.loads(self.memo_path.read_text(encoding="utf-8"))
+            if data.get("e2k_version") != E2K_VERSION:
+                logger.info("Ignoring katakana memo written by another e2k version")
+                return
+            for word, katakana in list(data.get("words", {}).items())[-self.max_entries :]:
+                self._memo[word] = katakana
+            logger.info(f"Loaded {len(self._memo)} katakana conversions from {self.memo_path}")
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load katakana memo {self.memo_path}: {e}")
+
+    def _save(self) -> None:
+        """Persist the memo table atomically (temporary file + rename)."""
+        if self.memo_path is None:
+            return
+        with self._lock:
+            data = {"e2k_version": E2K_VERSION, "words": dict(self._memo)}
+        try:
+            self.memo_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.memo_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.memo_path)
+        except OSError as e:
+            logger.warning(f"Failed to save katakana memo {self.memo_path}: {e}")
+
+
+# Global katakana converter shared by all sessions (None until initialized)
+_global_katakana_converter: Optional[KatakanaConverter] = None
+_global_katakana_converter_lock = threading.Lock()
+
+
+def get_global_katakana_converter() -> KatakanaConverter:
+    """Get the global katakana converter, creating it on first use."""
+    global _global_katakana_converter
+    with _global_katakana_converter_lock:
+        if _global_katakana_converter is None:
+            logger.info("Initializing global katakana converter")
+            _global_katakana_converter = KatakanaConverter()
+        return _global_katakana_converter
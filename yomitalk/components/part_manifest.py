@@ -0,0 +1,191 @@
+"""Module providing the index of generated audio parts.
+
+Every audio generation appends a start record to a JSON Lines manifest in the
+session's talks directory, followed by one record per completed part file.
+Resume and page-load restore read the parts of the latest generation from the
+manifest instead of scanning the stream directories, so they do not depend on
+the number of files on disk and never mix in parts of stale generations or of
+another version of the script. When a generation starts and the manifest has
+grown past MANIFEST_COMPACT_BYTES, the records before the new start record are
+dropped. Appends and compaction hold an exclusive lock on a separate lock file,
+so a part appended while another process compacts is never written to the
+replaced file.
+"""
+
+import contextlib
+import dataclasses
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from yomitalk.utils.logger import logger
+
+# Manifest file in the session's talks directory
+MANIFEST_FILENAME = "manifest.jsonl"
+# Lock file serializing appends and compaction across processes (never replaced itself)
+LOCK_FILENAME = MANIFEST_FILENAME + ".lock"
+# Size above which earlier generations are dropped when a generation starts
+MANIFEST_COMPACT_BYTES = int(os.environ.get("YOMITALK_MANIFEST_COMPACT_BYTES", str(256 * 1024)))
+
+# Serializes appends to manifests within the process
+_manifest_lock = threading.Lock()
+
+
+def script_hash(script: str) -> str:
+    """
+    Get the hash identifying a script.
+
+    Args:
+        script: Podcast script
+
+    Returns:
+        str: Hex digest of the script
+    """
+    return hashlib.sha256(script.encode("utf-8")).hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class PartRecord:
+    """A part file written by an audio generation."""
+
+    # Name of the stream directory of the generation
+    generation: str
+    script_hash: str
+    turn_index: int
+    # Key of the turn the part was synthesized from (see part_reuse.turn_key)
+    turn_key: str
+    path: str
+    size: int
+    duration: float
+    # Voiced RMS of the turn before loudness normalization (0.0 if not measured)
+    loudness: float = 0.0
+
+
+class PartManifest:
+    """Manifest of the audio parts of the latest generation of a session (appended to while it runs)."""
+
+    def __init__(self, directory: Path, compact_bytes: int = MANIFEST_COMPACT_BYTES) -> None:
+        """
+        Initialize the manifest.
+
+        Args:
+            directory: Talks directory of the session (the manifest is created on the first append)
+            compact_bytes: Size above which earlier generations are dropped when a generation starts
+        """
+        self.path = directory / MANIFEST_FILENAME
+        self.lock_path = directory / LOCK_FILENAME
+        self.compact_bytes = compact_bytes
+
+    def start_generation(self, generation: str, script_hash: str, total_turns: int) -> None:
+        """
+        Record the start of a generation, compacting the manifest if it has grown too large.
+
+        Args:
+            generation: Name of the stream directory of the generation
+            script_hash: Hash of the script being synthesized
+            total_turns: Number of turns of the script
+        """
+        self._append({"event": "start", "generation": generation, "script_hash": script_hash, "total_turns": total_turns}, compact=True)
+
+    def add_part(self, record: PartRecord) -> None:
+        """
+        Record a completed part file.
+
+        Args:
+            record: Part file record
+        """
+        self._append({"event": "part", **dataclasses.asdict(record)})
+
+    def latest_parts(self, script_hash: Optional[str] = None) -> List[PartRecord]:
+        """
+        Get the parts of the latest generation.
+
+        Args:
+            script_hash: If given, parts are only returned when the latest generation synthesized this script
+
+        Returns:
+            List[PartRecord]: Parts in turn order (a later record of a turn replaces an earlier one)
+        """
+        generation, parts = self._read_latest()
+        if generation is None or (script_hash is not None and generation.get("script_hash") != script_hash):
+            return []
+        return [parts[index] for index in sorted(parts)]
+
+    def _read_latest(self) -> Tuple[Optional[Dict], Dict[int, PartRecord]]:
+        """
+        Read the start record and the parts of the latest generation.
+
+        Returns:
+            Tuple[Optional[Dict], Dict[int, PartRecord]]: Start record (None if no generation is recorded) and parts by turn index
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None, {}
+        except OSError as e:
+            logger.warning(f"Failed to read part manifest {self.path}: {e}")
+            return None, {}
+
+        generation: Optional[Dict] = None
+        parts: Dict[int, PartRecord] = {}
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if entry.get("event") == "start":
+                    generation, parts = entry, {}
+                elif entry.get("event") == "part" and generation is not None and entry.get("generation") == generation.get("generation"):
+                    record = PartRecord(**{field.name: entry[field.name] for field in dataclasses.fields(PartRecord) if field.name in entry})
+                    parts[record.turn_index] = record
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # A line cut off by a crash while appending is skipped
+                continue
+        return generation, parts
+
+    def _append(self, entry: Dict, compact: bool = False) -> None:
+        """
+        Append an entry as one line.
+
+        Args:
+            entry: Entry to append
+            compact: Drop the records before this entry if the manifest exceeds compact_bytes
+        """
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        try:
+            with _manifest_lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.lock_path, "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        # Opened under the lock, so the append never goes to a file replaced by compaction
+                        with open(self.path, "a", encoding="utf-8") as f:
+                            f.write(line)
+                            size = f.tell()
+                        if compact and size > self.compact_bytes:
+                            self._compact(line)
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning(f"Failed to append to part manifest {self.path}: {e}")
+
+    def _compact(self, line: str) -> None:
+        """
+        Replace the manifest with its last line (the start record just appended), caller must hold the lock.
+
+        Args:
+            line: Last line of the manifest
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(line)
+            os.replace(temp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+        logger.debug(f"Compacted part manifest {self.path}")
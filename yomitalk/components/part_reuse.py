@@ -0,0 +1,73 @@
+"""Module providing reuse of audio parts across script edits.
+
+The part manifest records the turn each part file was synthesized from. When an
+edited script is synthesized again, its turn list is diffed against the turns
+behind the existing part files, so unchanged turns reuse their part files and
+only inserted and modified turns are synthesized.
+"""
+
+import difflib
+import hashlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from yomitalk.components.part_manifest import PartRecord
+
+
+def turn_key(previous_speaker: Optional[str], speaker: str, text: str, audio_version: str = "") -> str:
+    """
+    Get the key identifying the audio of a turn.
+
+    The previous speaker is part of the key because the pause before a turn
+    depends on whether the speaker changes. The audio version covers everything
+    else the part audio depends on, so parts made before a dictionary reload or
+    an output format change are not reused.
+
+    Args:
+        previous_speaker: Speaker of the previous turn (None for the first turn)
+        speaker: Speaker of the turn
+        text: Text synthesized for the turn
+        audio_version: Engine version and output format the part is synthesized with
+
+    Returns:
+        str: Hex digest identifying the turn
+    """
+    return hashlib.sha256(f"{audio_version}\0{previous_speaker or ''}\0{speaker}\0{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def turn_keys(conversation_parts: Sequence[Tuple[str, str]], audio_version: str = "") -> List[str]:
+    """
+    Get the keys of every turn of a script.
+
+    Args:
+        conversation_parts: (speaker, text) turns
+        audio_version: Engine version and output format the parts are synthesized with
+
+    Returns:
+        List[str]: Key of each turn
+    """
+    previous_speakers = [None] + [speaker for speaker, _ in conversation_parts[:-1]]
+    return [turn_key(previous, speaker, text, audio_version) for previous, (speaker, text) in zip(previous_speakers, conversation_parts, strict=True)]
+
+
+def plan_part_reuse(previous_parts: Sequence[PartRecord], keys: Sequence[str]) -> Dict[int, PartRecord]:
+    """
+    Match the turns of a script with existing part files synthesized from the same turns.
+
+    The existing parts are ordered by turn index and their turn keys are diffed
+    against the new keys, so turns surrounded by insertions, deletions and edits
+    are still matched.
+
+    Args:
+        previous_parts: Records of the existing part files
+        keys: Turn keys of the new script
+
+    Returns:
+        Dict[int, PartRecord]: Existing part to reuse for each matched turn index
+    """
+    candidates = sorted(previous_parts, key=lambda record: record.turn_index)
+    matcher = difflib.SequenceMatcher(None, [record.turn_key for record in candidates], list(keys), autojunk=False)
+    reuse = {}
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            reuse[block.b + offset] = candidates[block.a + offset]
+    return reuse
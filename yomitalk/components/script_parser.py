@@ -0,0 +1,348 @@
+"""Module providing the podcast script parser.
+
+Parses a script into a typed list of speaker turns with a single compiled
+speaker-prefix pattern. Results are memoized by the hash of the script, so the
+progress estimate, synthesis and resume all consume the same turn list without
+parsing the script again. Speaker names that are not character names are
+resolved with a prebuilt n-gram index of the character names.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from yomitalk.common.character import DISPLAY_NAMES, Character
+from yomitalk.utils.logger import logger
+from yomitalk.utils.text_utils import bounded_levenshtein_distance, normalize_text, normalize_texts
+
+# Number of parsed scripts kept in memory
+SCRIPT_CACHE_SIZE = 32
+# Number of fuzzy speaker name matches kept in memory
+SPEAKER_MATCH_CACHE_SIZE = 1024
+# Minimum similarity for a speaker name to be matched to a character instead of the default
+SPEAKER_SIMILARITY_THRESHOLD = 0.3
+
+
+class Turn(NamedTuple):
+    """A single turn of the script (compatible with a (speaker, text) tuple)."""
+
+    speaker: str
+    text: str
+
+
+def _ngrams(text: str, size: int) -> "Counter[str]":
+    """Count the character n-grams of a text."""
+    return Counter(text[i : i + size] for i in range(len(text) - size + 1))
+
+
+class SpeakerIndex:
+    """Index of character names for fuzzy speaker resolution.
+
+    Holds the normalized names and their character bigrams. A candidate is only
+    compared with the edit distance when the bigrams it shares with the input
+    (q-gram lemma) and the length difference still allow it to beat the best
+    match so far, and the edit distance stops as soon as it cannot. The result
+    is the same as comparing every name with calculate_text_similarity.
+    """
+
+    NGRAM_SIZE = 2
+
+    def __init__(self, names: Sequence[str], threshold: float = 0.3) -> None:
+        """
+        Build the index.
+
+        Args:
+            names: Character names in priority order (earlier names win ties)
+            threshold: Minimum similarity of a match
+        """
+        self.names = list(names)
+        self.threshold = threshold
+        self._normalized = normalize_texts(self.names)
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        for index, normalized in enumerate(self._normalized):
+            for gram, count in _ngrams(normalized, self.NGRAM_SIZE).items():
+                self._postings.setdefault(gram, []).append((index, count))
+
+    def best_match(self, name: str) -> Tuple[Optional[str], float]:
+        """
+        Find the most similar character name.
+
+        Args:
+            name: Speaker name as written in the script (not empty)
+
+        Returns:
+            Tuple[Optional[str], float]: Most similar name and its similarity (None if no name reaches the threshold)
+        """
+        normalized = normalize_text(name)
+        shared = [0] * len(self.names)
+        for gram, count in _ngrams(normalized, self.NGRAM_SIZE).items():
+            for index, candidate_count in self._postings.get(gram, ()):
+                shared[index] += min(count, candidate_count)
+
+        best_name: Optional[str] = None
+        best_similarity = 0.0
+        for index, candidate in enumerate(self._normalized):
+            similarity = self._similarity(normalized, candidate, shared[index], max(best_similarity, self.threshold))
+            if similarity > best_similarity:
+                best_name, best_similarity = self.names[index], similarity
+
+        if best_similarity < self.threshold:
+            return None, best_similarity
+        return best_name, best_similarity
+
+    def _similarity(self, normalized: str, candidate: str, shared_ngrams: int, floor: float) -> float:
+        """
+        Get the similarity of two normalized names, exactly when it can reach floor.
+
+        Args:
+            normalized: Normalized speaker name
+            candidate: Normalized character name
+            shared_ngrams: Number of n-grams the names share
+            floor: Similarity below which the exact value is not needed
+
+        Returns:
+            float: Similarity as calculate_text_similarity (a lower value if it is below floor)
+        """
+        if normalized == candidate:
+            return 1.0
+        longer = max(len(normalized), len(candidate))
+        if not normalized or not candidate:
+            return 0.0
+
+        # Substring matching (the shorter name is contained in the longer one)
+        substring_similarity = 0.0
+        if normalized in candidate or candidate in normalized:
+            substring_similarity = min(len(normalized), len(candidate)) / longer
+        floor = max(floor, substring_similarity)
+
+        # Lower bounds of the edit distance: length difference and the q-gram lemma
+        lower_bound = max(abs(len(normalized) - len(candidate)), math.ceil((longer - self.NGRAM_SIZE + 1 - shared_ngrams) / self.NGRAM_SIZE))
+        if 1.0 - lower_bound / longer < floor:
+            return substring_similarity
+
+        max_distance = math.floor((1.0 - floor) * longer + 1e-9)
+        distance = bounded_levenshtein_distance(normalized, candidate, max_distance)
+        if distance > max_distance:
+            return substring_similarity
+        return max(1.0 - distance / longer, substring_similarity)
+
+
+class ScriptParser:
+    """Parser of podcast scripts into speaker turns, memoized by script hash."""
+
+    # Character names followed by a colon, tried in character order before any other speaker name
+    KNOWN_SPEAKER_PATTERN = re.compile("^(?:" + "|".join(f"(?P<s{index}>{re.escape(name)})" for index, name in enumerate(DISPLAY_NAMES)) + ")[:：]")
+    # Any speaker name followed by a colon (matched to a character by similarity)
+    ANY_SPEAKER_PATTERN = re.compile(r"^([^:：]+)[：:]\s*(.*)")
+
+    def __init__(self, cache_size: int = SCRIPT_CACHE_SIZE) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            cache_size: Number of parsed scripts kept in memory
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[Turn, ...]]" = OrderedDict()
+        self._speaker_matches: Dict[str, str] = {}
+        self._speaker_index = SpeakerIndex(DISPLAY_NAMES, SPEAKER_SIMILARITY_THRESHOLD)
+        self._lock = threading.Lock()
+
+    def parse(self, script: str) -> List[Turn]:
+        """
+        Get the turns of a script, parsing it only on the first request.
+
+        Args:
+            script: Podcast script
+
+        Returns:
+            List[Turn]: Turns of the script (a new list, so callers may modify it)
+        """
+        key = hashlib.sha256(script.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return list(cached)
+
+        turns = self._parse_lines(script)
+        if not turns:
+            # No turns found: retry once with the format fixed
+            logger.warning("No valid conversation parts found. Attempting to fix format...")
+            fixed_script = self.fix_format(script)
+            if fixed_script != script:
+                turns = self._parse_lines(fixed_script)
+        logger.info(f"Extracted {len(turns)} conversation parts")
+
+        with self._lock:
+            self._cache[key] = tuple(turns)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return turns
+
+    def _parse_lines(self, script: str) -> List[Turn]:
+        """
+        Parse the lines of a script into turns.
+
+        Args:
+            script: Podcast script
+
+        Returns:
+            List[Turn]: Turns of the script (lines before the first speaker are ignored)
+        """
+        turns = []
+        # Speaker and speech of the turn being read (turns can span several lines)
+        current_speaker: Optional[str] = None
+        current_speech = ""
+
+        for line in script.strip().split("\n"):
+            line = line.strip()
+
+            matched_speaker: Optional[str] = None
+            matched_speech = ""
+            known = self.KNOWN_SPEAKER_PATTERN.match(line)
+            if known is not None:
+                matched_speaker = known.group(known.lastgroup or "")
+                matched_speech = line[known.end() :].strip()
+            else:
+                # "name:" lines with another name are matched to the closest character
+                any_speaker = self.ANY_SPEAKER_PATTERN.match(line)
+                if any_speaker is not None:
+                    potential_speaker, speech = any_speaker.groups()
+                    matched_speaker = self.find_best_character_match(potential_speaker.strip())
+                    matched_speech = speech.strip()
+
+            if matched_speaker:
+                # A new speaker closes the current turn
+                if current_speaker and current_speech:
+                    turns.append(Turn(current_speaker, current_speech))
+                current_speaker = matched_speaker
+                current_speech = matched_speech
+            elif current_speaker:
+                # Other lines continue the current turn (blank lines are kept as line breaks)
+                if line:
+                    current_speech = f"{current_speech}\n{line}" if current_speech else line
+                elif current_speech:
+                    current_speech += "\n"
+
+        if current_speaker and current_speech:
+            turns.append(Turn(current_speaker, current_speech))
+        return turns
+
+    def find_best_character_match(self, input_name: str) -> str:
+        """
+        Find the character whose name is closest to a speaker name (fuzzy matching).
+
+        Results are memoized, so each distinct speaker name (alias) is resolved only once.
+
+        Args:
+            input_name: Speaker name as written in the script
+
+        Returns:
+            str: Display name of the closest character (the default character if none is close)
+        """
+        if not input_name:
+            return Character.ZUNDAMON.display_name
+        if input_name in DISPLAY_NAMES:
+            return input_name
+
+        with self._lock:
+            cached = self._speaker_matches.get(input_name)
+        if cached is not None:
+            return cached
+
+        matched_name, similarity = self._speaker_index.best_match(input_name)
+        if matched_name is None:
+            # Names too far from every character fall back to the default character
+            logger.debug(f"Character name '{input_name}' similarity too low ({similarity:.2f}), using default")
+            best_match = Character.ZUNDAMON.display_name
+        else:
+            logger.debug(f"Character name '{input_name}' matched to '{matched_name}' (similarity: {similarity:.2f})")
+            best_match = matched_name
+
+        with self._lock:
+            if len(self._speaker_matches) >= SPEAKER_MATCH_CACHE_SIZE:
+                self._speaker_matches.clear()
+            self._speaker_matches[input_name] = best_match
+        return best_match
+
+    def fix_format(self, text: str) -> str:
+        """
+        Fix common format problems of a script.
+
+        Adds missing colons after character names, maps custom speaker names to
+        characters and splits lines containing several speakers.
+
+        Args:
+            text: Original script
+
+        Returns:
+            str: Fixed script
+        """
+        # Add missing colons after character names
+        for name in DISPLAY_NAMES:
+            text = re.sub(f"({name})(\\s+)(?=[^\\s:])", f"{name}:\\2", text)
+
+        # Map custom speaker names to characters and join the lines of each turn
+        fixed_lines = []
+        current_speaker: Optional[str] = None
+        current_speech: List[str] = []
+
+        for line in text.split("\n"):
+            line_stripped = line.strip()
+            match = self.ANY_SPEAKER_PATTERN.match(line_stripped) if line_stripped else None
+
+            if match:
+                if current_speaker and current_speech:
+                    fixed_lines.append(f"{current_speaker}: {' '.join(current_speech)}")
+                    current_speech = []
+
+                speaker, speech = match.groups()
+                current_speaker = self.find_best_character_match(speaker)
+                if speech.strip():
+                    current_speech.append(speech.strip())
+            elif current_speaker:
+                if line_stripped:
+                    current_speech.append(line_stripped)
+                elif current_speech and not current_speech[-1].endswith("\n"):
+                    # Blank line between paragraphs
+                    current_speech[-1] += "\n"
+            elif line_stripped:
+                # Text before any speaker is given to the default character
+                current_speaker = Character.ZUNDAMON.display_name
+                current_speech.append(line_stripped)
+
+        if current_speaker and current_speech:
+            fixed_lines.append(f"{current_speaker}: {' '.join(current_speech)}")
+
+        # Split lines where a sentence is followed by another speaker
+        result = []
+        for line in fixed_lines:
+            modified_line = line
+            for name in DISPLAY_NAMES:
+                if f"。{name}" in modified_line:
+                    parts = modified_line.split(f"。{name}")
+                    if len(parts) > 1:
+                        if parts[0].strip():
+                            result.append(f"{parts[0].strip()}。")
+                        modified_line = f"{name}{parts[1]}"
+            result.append(modified_line)
+
+        return "\n".join(result)
+
+
+# Global script parser shared by all sessions (None until first used)
+_global_script_parser: Optional[ScriptParser] = None
+_global_script_parser_lock = threading.Lock()
+
+
+def get_global_script_parser() -> ScriptParser:
+    """Get the global script parser, creating it on first use."""
+    global _global_script_parser
+    with _global_script_parser_lock:
+        if _global_script_parser is None:
+            _global_script_parser = ScriptParser()
+        return _global_script_parser
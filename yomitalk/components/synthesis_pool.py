@@ -0,0 +1,446 @@
+"""Module providing a multi-process VOICEVOX synthesis worker pool.
+
+Synthesizes conversation turns in parallel worker processes, each of which owns
+its own VOICEVOX Core synthesizer. Workers report the time each job took, so the
+throughput model of the main process learns from pooled synthesis as well.
+"""
+
+import atexit
+import contextlib
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, List, Optional
+
+from yomitalk.utils.logger import logger
+from yomitalk.utils.metrics import synthesis_throughput
+from yomitalk.utils.wav_utils import get_wav_duration
+
+# Number of synthesis worker processes (0 disables the pool and keeps in-process synthesis)
+SYNTHESIS_WORKERS = int(os.environ.get("YOMITALK_SYNTHESIS_WORKERS", "0"))
+# Seconds a single utterance may take before its worker is considered hung
+SYNTHESIS_JOB_TIMEOUT = float(os.environ.get("YOMITALK_SYNTHESIS_JOB_TIMEOUT", "300"))
+# Seconds a worker may take to initialize VOICEVOX Core before it is restarted
+SYNTHESIS_WORKER_STARTUP_TIMEOUT = float(os.environ.get("YOMITALK_SYNTHESIS_WORKER_STARTUP_TIMEOUT", "600"))
+# multiprocessing start method for workers. "forkserver" forks every worker from a
+# clean server process that has already imported VOICEVOX Core and e2k, so the
+# imported modules and native libraries are shared copy-on-write between workers.
+SYNTHESIS_START_METHOD = os.environ.get("YOMITALK_SYNTHESIS_START_METHOD", "forkserver")
+
+SynthesizeFunc = Callable[[str, int], bytes]
+EngineFactory = Callable[[], SynthesizeFunc]
+
+
+def create_voicevox_engine() -> SynthesizeFunc:
+    """
+    Create a VOICEVOX Core synthesizer inside a worker process.
+
+    The user dictionary watcher of the main process does not reach the workers, so
+    each job first reloads the dictionary if its file has changed (a stat call
+    when it has not).
+
+    Returns:
+        SynthesizeFunc: Function converting (text, style_id) into WAV bytes
+    """
+    from yomitalk.components.audio_generator import VoicevoxCoreManager
+
+    manager = VoicevoxCoreManager()
+
+    def synthesize(text: str, style_id: int) -> bytes:
+        manager.reload_user_dictionary()
+        return manager.text_to_speech(text, style_id)
+
+    return synthesize
+
+
+def _worker_main(conn: Connection, engine_factory: EngineFactory) -> None:
+    """
+    Entry point of a synthesis worker process.
+
+    Args:
+        conn: Pipe connection to the supervising process
+        engine_factory: Factory creating the synthesize function once per worker
+    """
+    try:
+        synthesize = engine_factory()
+    except Exception as e:
+        logger.error(f"Synthesis worker {os.getpid()} failed to initialize: {e}")
+        return
+
+    conn.send(("ready", None, None, 0.0))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        job_id, text, style_id = message
+        started_at = time.monotonic()
+        try:
+            wav_data = synthesize(text, style_id)
+            conn.send((job_id, wav_data, None, time.monotonic() - started_at))
+        except Exception as e:
+            conn.send((job_id, b"", str(e), time.monotonic() - started_at))
+
+
+@dataclass
+class _SynthesisJob:
+    """A single utterance waiting for (or being processed by) a worker."""
+
+    job_id: int
+    text: str
+    style_id: int
+    future: "Future[bytes]"
+    attempts: int = 0
+
+
+def _resolve_job(job: _SynthesisJob, wav_data: bytes) -> None:
+    """Resolve a job's future unless the caller has already cancelled it."""
+    if not job.future.cancelled():
+        job.future.set_result(wav_data)
+
+
+@dataclass
+class _WorkerHandle:
+    """Supervisor-side bookkeeping for one worker process."""
+
+    process: Any
+    conn: Connection
+    started_at: float
+    ready: bool = False
+    job: Optional[_SynthesisJob] = None
+    job_started_at: float = 0.0
+    # Consecutive restarts of this slot without the worker becoming ready
+    failures: int = 0
+    # Time the stopped worker is respawned at (0 while the worker is running)
+    respawn_at: float = 0.0
+    # The slot was given up after too many consecutive failures
+    abandoned: bool = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process of this slot is running."""
+        return not self.respawn_at and not self.abandoned
+
+
+class SynthesisWorkerPool:
+    """Pool of worker processes that synthesize utterances in parallel."""
+
+    def __init__(
+        self,
+        num_workers: int,
+        engine_factory: EngineFactory = create_voicevox_engine,
+        job_timeout: float = SYNTHESIS_JOB_TIMEOUT,
+        startup_timeout: float = SYNTHESIS_WORKER_STARTUP_TIMEOUT,
+        max_retries: int = 2,
+        start_method: str = SYNTHESIS_START_METHOD,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 60.0,
+        max_worker_restarts: int = 5,
+    ) -> None:
+        """
+        Initialize the worker pool (workers are started by start()).
+
+        Args:
+            num_workers: Number of worker processes
+            engine_factory: Factory creating the synthesize function in each worker
+            job_timeout: Seconds before a busy worker is treated as hung and restarted
+            startup_timeout: Seconds a worker may spend initializing before it is restarted
+            max_retries: Number of times a job is retried after its worker crashed or hung
+            start_method: multiprocessing start method used for the workers
+            restart_backoff: Seconds before the first respawn of a failed worker (doubled on each consecutive failure)
+            max_restart_backoff: Upper limit of the respawn delay
+            max_worker_restarts: Consecutive failures after which a worker slot is given up
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        self.num_workers = num_workers
+        self.engine_factory = engine_factory
+        self.job_timeout = job_timeout
+        self.startup_timeout = startup_timeout
+        self.max_retries = max_retries
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.max_worker_restarts = max_worker_restarts
+        self.restart_count = 0
+
+        self._context: Any = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self._context.set_forkserver_preload(["yomitalk.components.audio_generator"])
+
+        self._workers: List[_WorkerHandle] = []
+        self._pending: Deque[_SynthesisJob] = deque()
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+        self._supervisor: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def size(self) -> int:
+        """Number of worker processes in the pool."""
+        return self.num_workers
+
+    def start(self) -> None:
+        """Start the worker processes and the supervisor thread."""
+        if self._running:
+            return
+
+        self._running = True
+        for _ in range(self.num_workers):
+            self._workers.append(self._spawn_worker())
+
+        self._supervisor = threading.Thread(target=self._supervise, name="synthesis-pool-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info(f"Started synthesis worker pool with {self.num_workers} workers")
+
+    def submit(self, text: str, style_id: int) -> "Future[bytes]":
+        """
+        Queue an utterance for synthesis.
+
+        Args:
+            text: Text to convert to speech
+            style_id: VOICEVOX style ID
+
+        Returns:
+            Future[bytes]: Future resolved with the WAV data (b"" if synthesis failed)
+        """
+        future: Future[bytes] = Future()
+        if not self._running:
+            future.set_exception(RuntimeError("Synthesis worker pool is not running"))
+            return future
+
+        job = _SynthesisJob(job_id=next(self._job_ids), text=text, style_id=style_id, future=future)
+        with self._lock:
+            if self._workers and all(worker.abandoned for worker in self._workers):
+                # No worker can initialize: fail immediately instead of queueing forever
+                _resolve_job(job, b"")
+                return future
+            self._pending.append(job)
+        self._wakeup()
+        return future
+
+    def shutdown(self) -> None:
+        """Stop the supervisor and terminate all worker processes."""
+        if not self._running:
+            return
+
+        self._running = False
+        self._wakeup()
+        if self._supervisor is not None:
+            self._supervisor.join(timeout=5)
+
+        with self._lock:
+            for worker in self._workers:
+                if worker.running:
+                    self._stop_worker(worker)
+                if worker.job is not None:
+                    _resolve_job(worker.job, b"")
+            while self._pending:
+                _resolve_job(self._pending.popleft(), b"")
+            self._workers = []
+
+        logger.info("Synthesis worker pool shut down")
+
+    def _wakeup(self) -> None:
+        """Wake the supervisor thread so it dispatches newly queued jobs."""
+        with contextlib.suppress(OSError):
+            self._wakeup_writer.send_bytes(b"\0")
+
+    def _spawn_worker(self) -> _WorkerHandle:
+        """Start a new worker process."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.engine_factory),
+            name="synthesis-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerHandle(process=process, conn=parent_conn, started_at=time.monotonic())
+
+    def _stop_worker(self, worker: _WorkerHandle) -> None:
+        """Terminate a worker process and release its pipe."""
+        try:
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.process.join(timeout=5)
+        finally:
+            worker.conn.close()
+
+    def _restart_worker(self, index: int, reason: str) -> None:
+        """
+        Stop a crashed or hung worker, requeueing its in-flight job, and schedule its respawn.
+
+        The respawn is delayed with exponential backoff over consecutive failures,
+        and the slot is given up after max_worker_restarts failures, so a worker
+        that cannot initialize VOICEVOX Core does not fork and fail endlessly.
+
+        Args:
+            index: Index of the worker in the pool
+            reason: Reason for the restart (for logging)
+        """
+        worker = self._workers[index]
+        self._stop_worker(worker)
+        self.restart_count += 1
+
+        job = worker.job
+        worker.job = None
+        if job is not None:
+            job.attempts += 1
+            if job.attempts > self.max_retries:
+                logger.error(f"Giving up on synthesis job {job.job_id} after {job.attempts} attempts")
+                _resolve_job(job, b"")
+            else:
+                self._pending.appendleft(job)
+
+        worker.ready = False
+        worker.failures += 1
+        if worker.failures > self.max_worker_restarts:
+            logger.error(f"Giving up on synthesis worker (pid={worker.process.pid}) after {worker.failures} consecutive failures: {reason}")
+            worker.abandoned = True
+            if all(other.abandoned for other in self._workers):
+                logger.error("All synthesis workers failed; failing queued synthesis jobs")
+                while self._pending:
+                    _resolve_job(self._pending.popleft(), b"")
+            return
+
+        delay = min(self.restart_backoff * 2 ** (worker.failures - 1), self.max_restart_backoff)
+        logger.warning(f"Restarting synthesis worker (pid={worker.process.pid}) in {delay:.1f}s: {reason}")
+        worker.respawn_at = time.monotonic() + delay
+
+    def _respawn_workers(self) -> None:
+        """Respawn stopped workers whose backoff delay has elapsed."""
+        now = time.monotonic()
+        for index, worker in enumerate(self._workers):
+            if worker.respawn_at and worker.respawn_at <= now and not worker.abandoned:
+                respawned = self._spawn_worker()
+                respawned.failures = worker.failures
+                self._workers[index] = respawned
+
+    def _supervise(self) -> None:
+        """Dispatch jobs to idle workers and watch for crashed or hung workers."""
+        while self._running:
+            with self._lock:
+                self._respawn_workers()
+                self._dispatch_pending()
+                connections = [worker.conn for worker in self._workers if worker.running]
+
+            ready = wait([self._wakeup_reader, *connections], timeout=0.5)
+
+            with self._lock:
+                if not self._running:
+                    break
+                if self._wakeup_reader in ready:
+                    while self._wakeup_reader.poll():
+                        self._wakeup_reader.recv_bytes()
+                self._collect_results(ready)
+                self._check_worker_health()
+
+    def _dispatch_pending(self) -> None:
+        """Assign queued jobs to idle, initialized workers."""
+        for worker in self._workers:
+            if not worker.running or not worker.ready or worker.job is not None:
+                continue
+
+            # Skip jobs cancelled while queued so the worker is not left idle
+            job = None
+            while self._pending:
+                job = self._pending.popleft()
+                if not job.future.cancelled():
+                    break
+                job = None
+            if job is None:
+                return
+            try:
+                worker.conn.send((job.job_id, job.text, job.style_id))
+            except OSError:
+                # The worker died before receiving the job; the health check restarts it
+                self._pending.appendleft(job)
+                continue
+            worker.job = job
+            worker.job_started_at = time.monotonic()
+
+    def _collect_results(self, ready: List[Any]) -> None:
+        """
+        Receive messages from workers whose pipes are readable.
+
+        Args:
+            ready: Connections reported readable by multiprocessing.connection.wait
+        """
+        for index, worker in enumerate(self._workers):
+            if not worker.running or worker.conn not in ready:
+                continue
+            try:
+                job_id, wav_data, error, synthesis_seconds = worker.conn.recv()
+            except (EOFError, OSError):
+                self._restart_worker(index, "worker process exited")
+                continue
+
+            if job_id == "ready":
+                worker.ready = True
+                worker.failures = 0
+                continue
+
+            job = worker.job
+            worker.job = None
+            if job is None or job.job_id != job_id:
+                continue
+            if error:
+                logger.error(f"Synthesis job {job_id} failed in worker: {error}")
+            elif wav_data:
+                # The worker's own throughput model is not visible here, so record the job in this process
+                synthesis_throughput.record(job.style_id, len(job.text), get_wav_duration(wav_data), synthesis_seconds)
+            _resolve_job(job, wav_data or b"")
+
+    def _check_worker_health(self) -> None:
+        """Restart workers that crashed, hung on a job, or never finished initializing."""
+        now = time.monotonic()
+        for index, worker in enumerate(self._workers):
+            if not worker.running:
+                continue
+            if not worker.process.is_alive():
+                self._restart_worker(index, f"worker process died (exitcode={worker.process.exitcode})")
+            elif worker.job is not None and now - worker.job_started_at > self.job_timeout:
+                self._restart_worker(index, f"job {worker.job.job_id} exceeded {self.job_timeout:.0f}s")
+            elif not worker.ready and now - worker.started_at > self.startup_timeout:
+                self._restart_worker(index, f"initialization exceeded {self.startup_timeout:.0f}s")
+
+
+# Global synthesis worker pool shared by all sessions (None when disabled)
+_global_synthesis_pool: Optional[SynthesisWorkerPool] = None
+
+
+def get_global_synthesis_pool() -> Optional[SynthesisWorkerPool]:
+    """Get the global synthesis worker pool, or None when parallel synthesis is disabled."""
+    return _global_synthesis_pool
+
+
+def initialize_global_synthesis_pool(num_workers: int = SYNTHESIS_WORKERS) -> Optional[SynthesisWorkerPool]:
+    """
+    Initialize the global synthesis worker pool.
+
+    Args:
+        num_workers: Number of worker processes (0 keeps synthesis in-process)
+
+    Returns:
+        Optional[SynthesisWorkerPool]: The running pool, or None when disabled
+    """
+    global _global_synthesis_pool
+    if _global_synthesis_pool is None and num_workers > 0:
+        logger.info(f"Initializing global synthesis worker pool ({num_workers} workers)")
+        _global_synthesis_pool = SynthesisWorkerPool(num_workers)
+        _global_synthesis_pool.start()
+        atexit.register(_global_synthesis_pool.shutdown)
+    return _global_synthesis_pool
@@ -0,0 +1,276 @@
+"""Module providing a fair scheduler for the shared speech synthesizer.
+
+All sessions share one synthesis engine. The scheduler keeps a queue of
+utterances per session and runs them round-robin, so a long job of one user
+does not lock out everyone else. Utterances are split into a priority lane
+(the first turns of newly started jobs) and a background lane, so new
+listeners hear their first part without waiting behind the tail of other jobs.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from yomitalk.utils.logger import logger
+
+# Interleave utterances of concurrent sessions (false runs audio generation one job at a time as before)
+FAIR_SCHEDULING = os.environ.get("YOMITALK_FAIR_SCHEDULING", "true").lower() == "true"
+# Seconds a background utterance may wait before it is served ahead of the priority lane
+PRIORITY_AGING_SECONDS = float(os.environ.get("YOMITALK_PRIORITY_AGING_SECONDS", "10"))
+# Number of recent waiting times kept per session for the progress display
+WAIT_HISTORY_SIZE = 20
+
+
+@dataclass
+class _ScheduledJob:
+    """A single utterance waiting for the synthesis engine."""
+
+    session_id: str
+    func: Callable[[], Any]
+    future: "Future[Any]"
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class SynthesisScheduler:
+    """Round-robin scheduler of per-session utterance queues in front of the synthesizer."""
+
+    def __init__(self, capacity: int = 1, aging_seconds: float = PRIORITY_AGING_SECONDS) -> None:
+        """
+        Initialize the scheduler (runner threads are started by start()).
+
+        Args:
+            capacity: Number of utterances synthesized at the same time (engine capacity)
+            aging_seconds: Seconds a background utterance may wait before it is served
+                ahead of the priority lane (starvation protection)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.aging_seconds = aging_seconds
+        # Per-session queues of the priority lane and the background lane, in round-robin order
+        self._priority_queues: "OrderedDict[str, Deque[_ScheduledJob]]" = OrderedDict()
+        self._queues: "OrderedDict[str, Deque[_ScheduledJob]]" = OrderedDict()
+        self._running_counts: Dict[str, int] = {}
+        self._wait_times: Dict[str, Deque[float]] = {}
+        # Sessions whose statistics are dropped once their last utterance finishes
+        self._released: Set[str] = set()
+        self._condition = threading.Condition()
+        self._runners: List[threading.Thread] = []
+        self._running = False
+
+    def start(self) -> None:
+        """Start the runner threads."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        for index in range(self.capacity):
+            runner = threading.Thread(target=self._run, name=f"synthesis-scheduler-{index}", daemon=True)
+            runner.start()
+            self._runners.append(runner)
+        logger.info(f"Started synthesis scheduler with capacity {self.capacity}")
+
+    def submit(self, session_id: str, func: Callable[[], Any], priority: bool = False) -> "Future[Any]":
+        """
+        Queue an utterance of a session.
+
+        Args:
+            session_id: ID of the session the utterance belongs to
+            func: Function synthesizing the utterance, run on a runner thread
+            priority: Queue the utterance in the priority lane (first turns of a new job)
+
+        Returns:
+            Future[Any]: Future resolved with the return value of func
+        """
+        future: Future[Any] = Future()
+        with self._condition:
+            if not self._running:
+                future.set_exception(RuntimeError("Synthesis scheduler is not running"))
+                return future
+            self._released.discard(session_id)
+            queues = self._priority_queues if priority else self._queues
+            queues.setdefault(session_id, deque()).append(_ScheduledJob(session_id=session_id, func=func, future=future))
+            self._condition.notify()
+        return future
+
+    def get_session_status(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get the queueing status of a session for the progress display.
+
+        Args:
+            session_id: ID of the session
+
+        Returns:
+            Dict[str, Any]: Queue depth of the session and of all sessions, number of
+            active sessions and the average waiting time in seconds of recent utterances
+        """
+        with self._condition:
+            wait_times = self._wait_times.get(session_id)
+            active_sessions = set(self._priority_queues) | set(self._queues) | {sid for sid, count in self._running_counts.items() if count > 0}
+            return {
+                "queue_depth": len(self._priority_queues.get(session_id, ())) + len(self._queues.get(session_id, ())),
+                "total_queued": sum(len(queue) for queues in (self._priority_queues, self._queues) for queue in queues.values()),
+                "active_sessions": len(active_sessions),
+                "average_wait": sum(wait_times) / len(wait_times) if wait_times else 0.0,
+            }
+
+    def cancel_jobs(self, futures: Iterable["Future[Any]"]) -> None:
+        """
+        Cancel queued utterances, e.g. those submitted by an interrupted generation.
+
+        Other utterances of the same session (such as a newer generation) stay queued.
+
+        Args:
+            futures: Futures returned by submit() for the utterances to cancel
+        """
+        targets = set(futures)
+        cancelled: List[_ScheduledJob] = []
+        with self._condition:
+            for queues in (self._priority_queues, self._queues):
+                for session_id in list(queues):
+                    queue = queues[session_id]
+                    remaining = deque(job for job in queue if job.future not in targets)
+                    cancelled.extend(job for job in queue if job.future in targets)
+                    if remaining:
+                        queues[session_id] = remaining
+                    else:
+                        del queues[session_id]
+        for job in cancelled:
+            job.future.cancel()
+
+    def release_session(self, session_id: str) -> None:
+        """
+        Drop the statistics of a session once it has no queued or running utterances.
+
+        Args:
+            session_id: ID of the session
+        """
+        with self._condition:
+            self._released.add(session_id)
+            self._drop_released_session(session_id)
+
+    def _drop_released_session(self, session_id: str) -> None:
+        """Drop the statistics of a released session if it is idle (caller must hold the condition)."""
+        if session_id in self._released and session_id not in self._priority_queues and session_id not in self._queues and not self._running_counts.get(session_id):
+            self._released.discard(session_id)
+            self._wait_times.pop(session_id, None)
+
+    def shutdown(self) -> None:
+        """Stop the runner threads and cancel all queued utterances."""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            queues = [*self._priority_queues.values(), *self._queues.values()]
+            self._priority_queues.clear()
+            self._queues.clear()
+            self._condition.notify_all()
+
+        for queue in queues:
+            for job in queue:
+                job.future.cancel()
+        for runner in self._runners:
+            runner.join(timeout=5)
+        self._runners = []
+        logger.debug("Synthesis scheduler shut down")
+
+    def _next_job(self) -> Optional[_ScheduledJob]:
+        """
+        Take the next utterance (caller must hold the condition).
+
+        The priority lane is served first unless a background utterance has waited
+        longer than aging_seconds. Within a lane, sessions are served round-robin.
+
+        Returns:
+            Optional[_ScheduledJob]: Next job, or None when no session has queued utterances
+        """
+        while self._priority_queues or self._queues:
+            use_priority_lane = bool(self._priority_queues) and not self._background_is_starving()
+            job = self._pop_round_robin(self._priority_queues if use_priority_lane else self._queues)
+            if job.future.set_running_or_notify_cancel():
+                return job
+        return None
+
+    def _background_is_starving(self) -> bool:
+        """Check whether the oldest background utterance has waited longer than aging_seconds."""
+        if not self._queues:
+            return False
+        oldest_submitted_at = min(queue[0].submitted_at for queue in self._queues.values())
+        return time.monotonic() - oldest_submitted_at > self.aging_seconds
+
+    @staticmethod
+    def _pop_round_robin(queues: "OrderedDict[str, Deque[_ScheduledJob]]") -> _ScheduledJob:
+        """
+        Take the next utterance of a lane and move its session to the end of the rotation.
+
+        Args:
+            queues: Per-session queues of the lane (must not be empty)
+
+        Returns:
+            _ScheduledJob: Next job of the lane
+        """
+        session_id, queue = queues.popitem(last=False)
+        job = queue.popleft()
+        if queue:
+            queues[session_id] = queue
+        return job
+
+    def _run(self) -> None:
+        """Runner thread: synthesize queued utterances until shutdown."""
+        while True:
+            with self._condition:
+                job = self._next_job()
+                while job is None and self._running:
+                    self._condition.wait()
+                    job = self._next_job()
+                if job is None:
+                    return
+                self._running_counts[job.session_id] = self._running_counts.get(job.session_id, 0) + 1
+                self._wait_times.setdefault(job.session_id, deque(maxlen=WAIT_HISTORY_SIZE)).append(time.monotonic() - job.submitted_at)
+
+            try:
+                job.future.set_result(job.func())
+            except Exception as e:
+                logger.error(f"Scheduled synthesis failed (session: {job.session_id}): {e}")
+                job.future.set_exception(e)
+            finally:
+                with self._condition:
+                    self._running_counts[job.session_id] -= 1
+                    if self._running_counts[job.session_id] == 0:
+                        del self._running_counts[job.session_id]
+                        self._drop_released_session(job.session_id)
+
+
+# Global synthesis scheduler shared by all sessions (None when fair scheduling is disabled)
+_global_synthesis_scheduler: Optional[SynthesisScheduler] = None
+
+
+def get_global_synthesis_scheduler() -> Optional[SynthesisScheduler]:
+    """Get the global synthesis scheduler, or None when fair scheduling is disabled."""
+    return _global_synthesis_scheduler
+
+
+def initialize_global_synthesis_scheduler(capacity: int = 1) -> Optional[SynthesisScheduler]:
+    """
+    Initialize the global synthesis scheduler.
+
+    Args:
+        capacity: Number of utterances synthesized at the same time
+
+    Returns:
+        Optional[SynthesisScheduler]: The running scheduler, or None when disabled
+    """
+    global _global_synthesis_scheduler
+    if _global_synthesis_scheduler is None and FAIR_SCHEDULING:
+        logger.info(f"Initializing global synthesis scheduler (capacity {capacity})")
+        _global_synthesis_scheduler = SynthesisScheduler(capacity)
+        _global_synthesis_scheduler.start()
+        atexit.register(_global_synthesis_scheduler.shutdown)
+    return _global_synthesis_scheduler
@@ -32,6 +32,7 @@ class UserSession:
         self.audio_generator = AudioGenerator(
             session_output_dir=self.get_output_dir(),
             session_temp_dir=self.get_talk_temp_dir(),
+            session_id=self.session_id,
         )
 
         # Default API type is Gemini
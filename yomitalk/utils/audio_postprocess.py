@@ -0,0 +1,324 @@
+"""Audio post-processing utilities.
+
+Vectorized NumPy processing of synthesized turns on int16 buffers: trimming of
+leading and trailing silence, pauses between turns, per-character loudness
+normalization, and conversion to the output sampling rate and channel layout.
+No per-sample Python loops are used, so processing runs far faster than real
+time even for hour-long podcasts.
+"""
+
+import io
+import os
+import wave
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from yomitalk.common.character import DISPLAY_NAMES
+from yomitalk.utils.logger import logger
+from yomitalk.utils.wav_utils import read_wav_layout
+
+# Post-process synthesized turns (false keeps the audio exactly as synthesized)
+POSTPROCESS_ENABLED = os.environ.get("YOMITALK_POSTPROCESS", "true").lower() == "true"
+# Samples quieter than this level (dBFS) are treated as silence when trimming
+SILENCE_THRESHOLD_DBFS = float(os.environ.get("YOMITALK_SILENCE_THRESHOLD_DBFS", "-50"))
+# Seconds of audio kept before and after the voiced part of a turn
+SILENCE_MARGIN_SECONDS = float(os.environ.get("YOMITALK_SILENCE_MARGIN_SECONDS", "0.05"))
+# Pause inserted before a turn of another speaker, and before a turn of the same speaker
+SPEAKER_CHANGE_PAUSE_SECONDS = float(os.environ.get("YOMITALK_SPEAKER_CHANGE_PAUSE_SECONDS", "0.4"))
+SAME_SPEAKER_PAUSE_SECONDS = float(os.environ.get("YOMITALK_SAME_SPEAKER_PAUSE_SECONDS", "0.2"))
+# Target loudness (RMS of voiced samples, dBFS) and the largest gain applied to reach it
+TARGET_LOUDNESS_DBFS = float(os.environ.get("YOMITALK_TARGET_LOUDNESS_DBFS", "-20"))
+MAX_GAIN_DB = float(os.environ.get("YOMITALK_MAX_GAIN_DB", "12"))
+# Sampling rate of the generated audio (VOICEVOX synthesizes at 24000 Hz; 16000 is enough for speech)
+OUTPUT_SAMPLE_RATE = int(os.environ.get("YOMITALK_OUTPUT_SAMPLE_RATE", "24000"))
+# Generate stereo audio with the characters panned apart (false keeps mono)
+OUTPUT_STEREO = os.environ.get("YOMITALK_OUTPUT_STEREO", "false").lower() == "true"
+# Pan position of the characters in stereo output (0.0 is center, 1.0 is fully left/right)
+STEREO_PAN = float(os.environ.get("YOMITALK_STEREO_PAN", "0.3"))
+# Number of taps of the anti-aliasing filter applied before downsampling
+RESAMPLE_FILTER_TAPS = 63
+
+INT16_FULL_SCALE = 32768.0
+# Characters alternate between the left and the right side in the order of the Character enum
+CHARACTER_ORDER = {name: index for index, name in enumerate(DISPLAY_NAMES)}
+
+
+def _dbfs_to_amplitude(dbfs: float) -> float:
+    """Convert a level in dBFS to an int16 amplitude."""
+    return float(INT16_FULL_SCALE * 10 ** (dbfs / 20))
+
+
+def trim_silence(samples: np.ndarray, framerate: int, threshold_dbfs: float = SILENCE_THRESHOLD_DBFS, margin_seconds: float = SILENCE_MARGIN_SECONDS) -> np.ndarray:
+    """
+    Trim leading and trailing silence.
+
+    Args:
+        samples: int16 samples shaped (frames, channels)
+        framerate: Sampling rate
+        threshold_dbfs: Level below which samples are treated as silence
+        margin_seconds: Seconds of audio kept around the voiced part
+
+    Returns:
+        np.ndarray: Trimmed samples (empty if the turn is entirely silent)
+    """
+    voiced = np.flatnonzero(np.abs(samples.astype(np.int32)).max(axis=1) > _dbfs_to_amplitude(threshold_dbfs))
+    if voiced.size == 0:
+        return samples[:0]
+    margin = int(margin_seconds * framerate)
+    start = max(0, int(voiced[0]) - margin)
+    end = min(len(samples), int(voiced[-1]) + 1 + margin)
+    return samples[start:end]
+
+
+def voiced_rms(samples: np.ndarray, threshold_dbfs: float = SILENCE_THRESHOLD_DBFS) -> float:
+    """
+    Get the RMS amplitude of the voiced samples.
+
+    Args:
+        samples: int16 samples shaped (frames, channels)
+        threshold_dbfs: Level below which samples are ignored
+
+    Returns:
+        float: RMS amplitude (0.0 if there are no voiced samples)
+    """
+    values = samples.astype(np.float64).ravel()
+    voiced = values[np.abs(values) > _dbfs_to_amplitude(threshold_dbfs)]
+    if voiced.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(voiced * voiced)))
+
+
+def apply_gain(samples: np.ndarray, gain: float) -> np.ndarray:
+    """
+    Apply a linear gain, saturating at the int16 range.
+
+    Args:
+        samples: int16 samples
+        gain: Linear gain
+
+    Returns:
+        np.ndarray: int16 samples with the gain applied
+    """
+    if gain == 1.0:
+        return samples
+    scaled: np.ndarray = np.clip(np.rint(samples.astype(np.float32) * gain), -INT16_FULL_SCALE, INT16_FULL_SCALE - 1)
+    return scaled.astype(np.int16)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample int16 samples, low-pass filtering first when downsampling.
+
+    Args:
+        samples: int16 samples shaped (frames, channels)
+        source_rate: Sampling rate of the samples
+        target_rate: Sampling rate to convert to
+
+    Returns:
+        np.ndarray: Resampled int16 samples
+    """
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+    data = samples.astype(np.float32)
+    if target_rate < source_rate:
+        # Windowed-sinc filter just below the new Nyquist frequency keeps removed highs from aliasing
+        cutoff = 0.45 * target_rate / source_rate
+        taps = np.arange(RESAMPLE_FILTER_TAPS) - (RESAMPLE_FILTER_TAPS - 1) / 2
+        kernel = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.hamming(RESAMPLE_FILTER_TAPS)
+        kernel /= kernel.sum()
+        data = np.stack([np.convolve(data[:, channel], kernel, mode="same") for channel in range(data.shape[1])], axis=1)
+
+    target_frames = int(round(len(samples) * target_rate / source_rate))
+    positions = np.arange(target_frames) * (source_rate / target_rate)
+    source_positions = np.arange(len(samples))
+    resampled = np.stack([np.interp(positions, source_positions, data[:, channel]) for channel in range(data.shape[1])], axis=1)
+    scaled: np.ndarray = np.clip(np.rint(resampled), -INT16_FULL_SCALE, INT16_FULL_SCALE - 1)
+    return scaled.astype(np.int16)
+
+
+def pan_to_stereo(samples: np.ndarray, position: float) -> np.ndarray:
+    """
+    Place samples in the stereo field with constant-power panning.
+
+    Args:
+        samples: int16 samples shaped (frames, channels), downmixed to mono first
+        position: Pan position from -1.0 (left) to 1.0 (right)
+
+    Returns:
+        np.ndarray: int16 stereo samples shaped (frames, 2)
+    """
+    mono = samples.astype(np.float32).mean(axis=1)
+    angle = (np.clip(position, -1.0, 1.0) + 1) * np.pi / 4
+    # Scaled so the center position keeps the level of the mono input on both channels
+    gains = np.sqrt(2) * np.array([np.cos(angle), np.sin(angle)], dtype=np.float32)
+    stereo: np.ndarray = np.clip(np.rint(mono[:, np.newaxis] * gains), -INT16_FULL_SCALE, INT16_FULL_SCALE - 1)
+    return stereo.astype(np.int16)
+
+
+class AudioPostProcessor:
+    """Post-processor of the turns of one audio generation job.
+
+    Loudness is normalized per character: the gain of a character is derived from
+    the running average loudness of all of its turns so far, so characters are
+    levelled against each other while the expression within a character is kept.
+    In stereo output, characters are panned alternately left and right in the
+    order they first speak.
+    """
+
+    def __init__(
+        self,
+        speaker_change_pause: float = SPEAKER_CHANGE_PAUSE_SECONDS,
+        same_speaker_pause: float = SAME_SPEAKER_PAUSE_SECONDS,
+        target_loudness_dbfs: float = TARGET_LOUDNESS_DBFS,
+        max_gain_db: float = MAX_GAIN_DB,
+        enabled: Optional[bool] = None,
+        output_sample_rate: int = OUTPUT_SAMPLE_RATE,
+        stereo: bool = OUTPUT_STEREO,
+        stereo_pan: float = STEREO_PAN,
+    ) -> None:
+        """
+        Initialize the post-processor.
+
+        Args:
+            speaker_change_pause: Seconds of silence before a turn of another speaker
+            same_speaker_pause: Seconds of silence before a turn of the same speaker
+            target_loudness_dbfs: Target RMS of voiced samples in dBFS
+            max_gain_db: Largest boost or cut applied for normalization
+            enabled: Trim, normalize and space turns (None follows POSTPROCESS_ENABLED)
+            output_sample_rate: Sampling rate of the processed turns (0 keeps the synthesized rate)
+            stereo: Convert turns to stereo with the characters panned apart
+            stereo_pan: Pan position of the characters in stereo output
+        """
+        self.speaker_change_pause = speaker_change_pause
+        self.same_speaker_pause = same_speaker_pause
+        self.target_loudness_dbfs = target_loudness_dbfs
+        self.max_gain_db = max_gain_db
+        self.enabled = POSTPROCESS_ENABLED if enabled is None else enabled
+        self.output_sample_rate = output_sample_rate
+        self.stereo = stereo
+        self.stereo_pan = stereo_pan
+        # Running (sum of squared RMS, number of turns) per character
+        self._loudness: Dict[str, Tuple[float, int]] = {}
+        # Voiced RMS of the last processed turn before normalization (0.0 if it was not measured)
+        self.last_turn_loudness = 0.0
+
+    @property
+    def output_version(self) -> str:
+        """
+        Get a string identifying the settings that shape the processed turns.
+
+        Returns:
+            str: Output format and processing settings (equal strings produce the same audio for the same input)
+        """
+        processing = "raw" if not self.enabled else f"pause{self.speaker_change_pause:g}/{self.same_speaker_pause:g},loud{self.target_loudness_dbfs:g}/{self.max_gain_db:g}"
+        channels = f"stereo{self.stereo_pan:g}/character" if self.stereo else "mono"
+        return f"{self.output_sample_rate or 'native'}Hz,{channels},{processing}"
+
+    def process_turn(self, wav_data: bytes, speaker: str, previous_speaker: Optional[str] = None) -> bytes:
+        """
+        Trim a turn, normalize its loudness, convert it to the output format and prepend the pause before it.
+
+        Args:
+            wav_data: WAV data of the turn (16-bit PCM)
+            speaker: Speaker of the turn
+            previous_speaker: Speaker of the previous turn (None for the first turn, which gets no pause)
+
+        Returns:
+            bytes: Processed WAV data (the input unchanged if it cannot be processed)
+        """
+        self.last_turn_loudness = 0.0
+        if not wav_data or not (self.enabled or self.output_sample_rate or self.stereo):
+            return wav_data
+        try:
+            layout = read_wav_layout(io.BytesIO(wav_data))
+        except wave.Error as e:
+            logger.warning(f"Skipping post-processing of an unreadable turn: {e}")
+            return wav_data
+        framerate = self.output_sample_rate or layout.framerate
+        if layout.sampwidth != 2 or not (self.enabled or self.stereo or framerate != layout.framerate):
+            return wav_data
+
+        pcm = np.frombuffer(wav_data, dtype="<i2", count=layout.data_size // 2, offset=layout.data_offset)
+        samples = pcm.reshape(-1, layout.nchannels)
+        if self.enabled:
+            samples = trim_silence(samples, layout.framerate)
+            samples = apply_gain(samples, self._gain_for(speaker, samples))
+
+        # Convert the whole turn once, so parts are stored and delivered in the output format
+        samples = resample(samples, layout.framerate, framerate)
+        if self.stereo:
+            samples = pan_to_stereo(samples, self._pan_for(speaker))
+
+        if self.enabled and previous_speaker is not None:
+            pause_seconds = self.same_speaker_pause if previous_speaker == speaker else self.speaker_change_pause
+            pause = np.zeros((int(pause_seconds * framerate), samples.shape[1]), dtype=np.int16)
+            samples = np.concatenate([pause, samples])
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(samples.shape[1])
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(framerate)
+            wav_file.writeframes(samples.astype("<i2").tobytes())
+        return buffer.getvalue()
+
+    def _gain_for(self, speaker: str, samples: np.ndarray) -> float:
+        """
+        Update the running loudness of a character and get its normalization gain.
+
+        Args:
+            speaker: Speaker of the turn
+            samples: Trimmed samples of the turn
+
+        Returns:
+            float: Linear gain, limited to max_gain_db and to the headroom of the turn
+        """
+        rms = voiced_rms(samples)
+        if rms <= 0.0:
+            return 1.0
+        self.last_turn_loudness = rms
+        character_rms = self.observe_loudness(speaker, rms)
+        gain_db = 20 * np.log10(_dbfs_to_amplitude(self.target_loudness_dbfs) / character_rms)
+        gain = float(10 ** (np.clip(gain_db, -self.max_gain_db, self.max_gain_db) / 20))
+        # Never boost a turn into clipping
+        peak = float(np.abs(samples.astype(np.int32)).max())
+        return min(gain, (INT16_FULL_SCALE - 1) / peak) if peak > 0 else gain
+
+    def observe_loudness(self, speaker: str, rms: float) -> float:
+        """
+        Add the loudness of a turn to the running loudness of its character.
+
+        Turns that are not processed again (e.g. reused parts) are fed in here, so
+        the gain of later turns is computed from the same history as in a full run.
+
+        Args:
+            speaker: Speaker of the turn
+            rms: Voiced RMS of the turn before normalization
+
+        Returns:
+            float: Running RMS of the character (0.0 if nothing was measured)
+        """
+        if rms > 0.0:
+            sum_squares, turns = self._loudness.get(speaker, (0.0, 0))
+            self._loudness[speaker] = (sum_squares + rms * rms, turns + 1)
+        sum_squares, turns = self._loudness.get(speaker, (0.0, 0))
+        return float(np.sqrt(sum_squares / turns)) if turns else 0.0
+
+    def _pan_for(self, speaker: str) -> float:
+        """
+        Get the pan position of a character from its order in the Character enum.
+
+        The position does not depend on which turn comes first, so resumed and
+        reused parts keep every character on the same side.
+
+        Args:
+            speaker: Speaker of the turn
+
+        Returns:
+            float: Pan position from -1.0 (left) to 1.0 (right), centered for unknown speakers
+        """
+        index = CHARACTER_ORDER.get(speaker)
+        if index is None:
+            return 0.0
+        return (-1 if index % 2 == 0 else 1) * self.stereo_pan
@@ -0,0 +1,216 @@
+"""Latency and throughput metrics utilities.
+
+Contains a small in-process recorder for latency percentiles that are logged
+periodically and can be inspected for capacity planning, and a throughput model
+of speech synthesis on this host used to predict job durations.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+from yomitalk.utils.logger import logger
+
+
+class LatencyRecorder:
+    """Keeps the most recent latency samples of one metric and reports percentiles."""
+
+    def __init__(self, name: str, window: int = 200, log_interval: int = 10) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            name: Metric name used in log messages
+            window: Number of most recent samples used for percentiles
+            log_interval: Log a summary every N samples
+        """
+        self.name = name
+        self.log_interval = log_interval
+        self.count = 0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            seconds: Measured latency in seconds
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            should_log = self.count % self.log_interval == 0
+        logger.info(f"{self.name}: {seconds:.2f}s")
+        if should_log:
+            summary = self.summary()
+            logger.info(f"{self.name} over last {summary['samples']:.0f} samples: p50={summary['p50']:.2f}s, p95={summary['p95']:.2f}s")
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a percentile of the recent samples (nearest-rank method).
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds, or 0.0 when nothing was recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * len(samples)))
+        return samples[rank - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Get the sample count and the p50/p95 of the recent samples.
+
+        Returns:
+            Dict[str, float]: "samples", "p50" and "p95"
+        """
+        with self._lock:
+            samples = len(self._samples)
+        return {"samples": float(samples), "p50": self.percentile(50), "p95": self.percentile(95)}
+
+
+# Audio seconds per character assumed until a style has been measured on this host
+DEFAULT_AUDIO_SECONDS_PER_CHAR = 0.15
+# Characters synthesized per wall-clock second assumed until a style has been measured on this host
+DEFAULT_CHARS_PER_SECOND = 20.0
+# Weight of a new measurement in the exponential moving averages
+THROUGHPUT_SMOOTHING = 0.2
+
+
+class ThroughputModel:
+    """Per-style speech synthesis throughput on this host.
+
+    Tracks exponential moving averages of the audio seconds produced per
+    character (and per mora when the AudioQuery is available) and of the
+    characters synthesized per wall-clock second, and predicts the audio
+    duration and synthesis time of turns from their text length. Also keeps the
+    predicted remaining synthesis time of running jobs for admission decisions.
+    """
+
+    def __init__(self, smoothing: float = THROUGHPUT_SMOOTHING) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            smoothing: Weight of a new measurement in the moving averages
+        """
+        self.smoothing = smoothing
+        self._audio_seconds_per_char: Dict[int, float] = {}
+        self._audio_seconds_per_mora: Dict[int, float] = {}
+        self._chars_per_second: Dict[int, float] = {}
+        self._jobs: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, style_id: int, chars: int, audio_seconds: float, wall_seconds: float, moras: Optional[int] = None) -> None:
+        """
+        Record one synthesized utterance.
+
+        Args:
+            style_id: VOICEVOX style ID
+            chars: Number of characters of the text
+            audio_seconds: Duration of the synthesized audio
+            wall_seconds: Wall-clock time the synthesis took
+            moras: Number of moras of the AudioQuery (None if unknown)
+        """
+        if chars <= 0 or audio_seconds <= 0:
+            return
+        with self._lock:
+            self._update(self._audio_seconds_per_char, style_id, audio_seconds / chars)
+            if moras:
+                self._update(self._audio_seconds_per_mora, style_id, audio_seconds / moras)
+            if wall_seconds > 0:
+                self._update(self._chars_per_second, style_id, chars / wall_seconds)
+
+    def _update(self, averages: Dict[int, float], style_id: int, value: float) -> None:
+        """Update the moving average of a style (the first measurement is taken as is)."""
+        previous = averages.get(style_id)
+        averages[style_id] = value if previous is None else previous + self.smoothing * (value - previous)
+
+    def predict_audio_seconds(self, style_id: int, chars: int, moras: Optional[int] = None) -> float:
+        """
+        Predict the audio duration of a turn.
+
+        Args:
+            style_id: VOICEVOX style ID
+            chars: Number of characters of the text
+            moras: Number of moras of the AudioQuery (used instead of the characters when the style has been measured by mora)
+
+        Returns:
+            float: Predicted audio duration in seconds
+        """
+        with self._lock:
+            if moras and style_id in self._audio_seconds_per_mora:
+                return moras * self._audio_seconds_per_mora[style_id]
+            return chars * self._audio_seconds_per_char.get(style_id, DEFAULT_AUDIO_SECONDS_PER_CHAR)
+
+    def predict_synthesis_seconds(self, style_id: int, chars: int) -> float:
+        """
+        Predict the wall-clock time needed to synthesize a turn.
+
+        Args:
+            style_id: VOICEVOX style ID
+            chars: Number of characters of the text
+
+        Returns:
+            float: Predicted synthesis time in seconds
+        """
+        with self._lock:
+            return chars / self._chars_per_second.get(style_id, DEFAULT_CHARS_PER_SECOND)
+
+    def predict_turns(self, turns: Sequence[Tuple[int, int]]) -> Tuple[float, float]:
+        """
+        Predict the total audio duration and synthesis time of turns.
+
+        Args:
+            turns: (style ID, number of characters) of each turn
+
+        Returns:
+            Tuple[float, float]: Predicted audio duration and synthesis time in seconds
+        """
+        audio_seconds = sum(self.predict_audio_seconds(style_id, chars) for style_id, chars in turns)
+        synthesis_seconds = sum(self.predict_synthesis_seconds(style_id, chars) for style_id, chars in turns)
+        return audio_seconds, synthesis_seconds
+
+    def update_job(self, job_id: str, remaining_seconds: float) -> None:
+        """
+        Set the predicted remaining synthesis time of a running job.
+
+        Args:
+            job_id: Job identifier
+            remaining_seconds: Predicted remaining synthesis time in seconds
+        """
+        with self._lock:
+            self._jobs[job_id] = max(0.0, remaining_seconds)
+
+    def end_job(self, job_id: str) -> None:
+        """
+        Forget a finished or abandoned job.
+
+        Args:
+            job_id: Job identifier
+        """
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def backlog_seconds(self) -> float:
+        """
+        Get the predicted remaining synthesis time of all running jobs.
+
+        Returns:
+            float: Predicted backlog in seconds
+        """
+        with self._lock:
+            return sum(self._jobs.values())
+
+
+# Time from clicking 「音声を生成」 until the first audio is streamed to the listener
+time_to_first_audio = LatencyRecorder("Time to first audio")
+# Speech synthesis throughput of this host, shared by all sessions
+synthesis_throughput = ThroughputModel()
@@ -3,8 +3,57 @@
 Contains utility functions for text processing, romanization support, and more.
 """
 
+import functools
 import re
 import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+
+# ローマ字の音節パターンリスト（優先順位順に定義）
+# 長いもの、特殊なものから順にマッチさせることで、正しい音節分割を促す。
+_SYLLABLE_PATTERNS = [
+    # 特殊な複合子音
+    r"TSU",  # つ
+    r"SHI",  # し
+    r"CHI",  # ち
+    # 特殊な拗音
+    r"CH[AUO]",  # ちゃ, ちゅ, ちょ
+    r"SH[AUO]",  # しゃ, しゅ, しょ
+    # 拗音 (子音 + Y + 母音)
+    # 例: KYA, SYA (訓令式 しゃ), TYA (訓令式 ちゃ), NYA, HYA, MYA, RYA, GYA, JYA, DYA, BYA, PYA
+    # SH[AUO], CH[AUO] は上で定義済みなので、ここではそれ以外の Y を含む拗音をカバー。
+    # ZY[AUO] (じゃ等)も JYA と同様にここでカバー。
+    r"(?:K|S|T|N|H|M|R|G|Z|J|D|B|P)Y[AUO]",
+    # 通常の子音 + 母音
+    # 例: KA, KI, FU, MI, TO, WA, YA, SU, JI (ZI,DIも含む), ZO
+    # F[AIUEO], W[AIUEO], Y[AUO] (YA,YU,YO) も含む
+    # J[AUO] (JA,JU,JO) も含む
+    # (SI, TI, HU, DI, ZU など、訓令式/日本式に近い表記も許容)
+    r"[BCDFGHJKLMNPQRSTVWXYZ][AIUEO]",
+    # 母音単独
+    r"[AIUEO]",
+    # 撥音「ん」
+    # このNは、正規表現のマッチングプロセスにより、
+    # Nの後に母音やYが続く場合は、上記のより長いパターン(例:NA, NI, NYA)で先にマッチされる。
+    # そのため、このNが単独でマッチするのは、主に後に子音が続く場合(例:HONDAのN)や
+    # 語末(例:KENのN)、またはNの後にさらにNで始まる音節が続く場合(例:GINNANの最初のN)。
+    r"N",
+]
+
+# 単語全体が音節パターンの繰り返しのみで構成されているかを判定する正規表現（インポート時に一度だけコンパイル）
+_ROMAJI_WORD_PATTERN = re.compile("(?:" + "|".join(f"(?:{pattern})" for pattern in _SYLLABLE_PATTERNS) + ")+")
+_UPPERCASE_WORD_PATTERN = re.compile(r"[A-Z]+")
+# 正規表現での優先的なマッチングが難しい複合音（SH+I, CH+I など）の置き換え
+_COMPOUND_SYLLABLES = {"SHI": "SI", "CHI": "TI", "SHA": "SA", "SHU": "SU", "SHO": "SO", "CHA": "TA", "CHU": "TU", "CHO": "TO"}
+_COMPOUND_SYLLABLE_PATTERN = re.compile("|".join(_COMPOUND_SYLLABLES))
+
+# 正規化で除去する空白・ハイフン・記号
+_NORMALIZE_REMOVE_PATTERN = re.compile(r"[\s\-_・−ー]")
+# ひらがな (U+3041-U+3096) をカタカナ (U+30A1-U+30F6) に変換する変換表
+_HIRAGANA_TO_KATAKANA_TABLE = str.maketrans({chr(code): chr(code + 0x60) for code in range(0x3041, 0x3097)})
+
+# 単語ごとの判定・正規化結果のキャッシュサイズ
+TEXT_CACHE_SIZE = 8192
 
 
 def is_romaji_readable(word: str) -> bool:
@@ -17,6 +66,8 @@ def is_romaji_readable(word: str) -> bool:
     - 促音(例: TT, SS, KK)は基本的に考慮しない。(例: URRI, LLA, KITTE, NISSAN は不可)
     - ユーザー指定の例に基づき、HONDAやAIKOは可能、URRIやLLAは不可能とする。
 
+    判定結果は単語ごとにキャッシュされる。
+
     Args:
         word (str): 判定対象の大文字アルファベットの文字列。
 
@@ -25,69 +76,37 @@ def is_romaji_readable(word: str) -> bool:
     """
     if not isinstance(word, str) or not word:  # 空文字列やNoneはFalse
         return False
-    if not re.fullmatch(r"[A-Z]+", word):  # 大文字アルファベット以外が含まれている場合はFalse
+    return _is_romaji_readable_word(word)
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _is_romaji_readable_word(word: str) -> bool:
+    """空でない文字列がローマ字読みできるかを判定する（is_romaji_readableのキャッシュ対象）"""
+    if not _UPPERCASE_WORD_PATTERN.fullmatch(word):  # 大文字アルファベット以外が含まれている場合はFalse
         return False
 
     # 単一の母音のケース（1文字の場合はパターン照合前に判定）
     if len(word) == 1:
         return word in "AIUEO"
 
-    # ローマ字の音節パターンリスト（優先順位順に定義）
-    # 長いもの、特殊なものから順にマッチさせることで、正しい音節分割を促す。
-    syllable_patterns = [
-        # 特殊な複合子音
-        r"TSU",  # つ
-        r"SHI",  # し
-        r"CHI",  # ち
-        # 特殊な拗音
-        r"CH[AUO]",  # ちゃ, ちゅ, ちょ
-        r"SH[AUO]",  # しゃ, しゅ, しょ
-        # 拗音 (子音 + Y + 母音)
-        # 例: KYA, SYA (訓令式 しゃ), TYA (訓令式 ちゃ), NYA, HYA, MYA, RYA, GYA, JYA, DYA, BYA, PYA
-        # SH[AUO], CH[AUO] は上で定義済みなので、ここではそれ以外の Y を含む拗音をカバー。
-        # ZY[AUO] (じゃ等)も JYA と同様にここでカバー。
-        r"(?:K|S|T|N|H|M|R|G|Z|J|D|B|P)Y[AUO]",
-        # 通常の子音 + 母音
-        # 例: KA, KI, FU, MI, TO, WA, YA, SU, JI (ZI,DIも含む), ZO
-        # F[AIUEO], W[AIUEO], Y[AUO] (YA,YU,YO) も含む
-        # J[AUO] (JA,JU,JO) も含む
-        # (SI, TI, HU, DI, ZU など、訓令式/日本式に近い表記も許容)
-        r"[BCDFGHJKLMNPQRSTVWXYZ][AIUEO]",
-        # 母音単独
-        r"[AIUEO]",
-        # 撥音「ん」
-        # このNは、正規表現のマッチングプロセスにより、
-        # Nの後に母音やYが続く場合は、上記のより長いパターン(例:NA, NI, NYA)で先にマッチされる。
-        # そのため、このNが単独でマッチするのは、主に後に子音が続く場合(例:HONDAのN)や
-        # 語末(例:KENのN)、またはNの後にさらにNで始まる音節が続く場合(例:GINNANの最初のN)。
-        r"N",
-    ]
-
-    # 各音節パターンを非キャプチャグループ (?:...) で囲み、OR (|) で結合
-    syllable_regex_part = "|".join([f"(?:{p})" for p in syllable_patterns])
-
-    # 単語全体が「(音節パターン1 | 音節パターン2 | ...)+」に完全一致するかを判定
-    # これにより、単語が上記の音節の繰り返しのみで構成されているかをチェックする。
-    full_word_regex = re.compile(f"^({syllable_regex_part})+$")
-
-    # 文字列がマッチするかどうかを判定
-    if full_word_regex.fullmatch(word):
+    if _ROMAJI_WORD_PATTERN.fullmatch(word):
         return True
 
-    # 一部の複合音（SH+I, CH+I）のパターンを特別に許容する
-    # これは正規表現での優先的なマッチングが難しいため、手動チェックする
-    temp_word = word
-    temp_word = re.sub(r"SHI", "SI", temp_word)
-    temp_word = re.sub(r"CHI", "TI", temp_word)
-    temp_word = re.sub(r"SHA", "SA", temp_word)
-    temp_word = re.sub(r"SHU", "SU", temp_word)
-    temp_word = re.sub(r"SHO", "SO", temp_word)
-    temp_word = re.sub(r"CHA", "TA", temp_word)
-    temp_word = re.sub(r"CHU", "TU", temp_word)
-    temp_word = re.sub(r"CHO", "TO", temp_word)
+    # 一部の複合音（SH+I, CH+I）は置き換えてから再チェックする（置き換えは重ならないため1回の走査で行う）
+    return bool(_ROMAJI_WORD_PATTERN.fullmatch(_COMPOUND_SYLLABLE_PATTERN.sub(lambda match: _COMPOUND_SYLLABLES[match.group()], word)))
+
+
+def classify_romaji_readable(words: Iterable[str]) -> Dict[str, bool]:
+    """
+    複数の単語がローマ字読みできるかをまとめて判定する
+
+    Args:
+        words (Iterable[str]): 判定対象の単語（重複は1回だけ判定する）
 
-    # 置換後の文字列で再チェック
-    return bool(full_word_regex.fullmatch(temp_word))
+    Returns:
+        Dict[str, bool]: 単語ごとの判定結果
+    """
+    return {word: is_romaji_readable(word) for word in dict.fromkeys(words)}
 
 
 def normalize_text(text: str) -> str:
@@ -110,6 +129,8 @@ def normalize_text(text: str) -> str:
     - "Zundamon" → "zundamon"
     - "ｚｕｎｄａ" → "zunda" (全角→半角)
 
+    正規化結果はテキストごとにキャッシュされる。
+
     Args:
         text (str): 正規化するテキスト
 
@@ -118,20 +139,29 @@ def normalize_text(text: str) -> str:
     """
     if not text:
         return ""
+    return _normalize_nonempty_text(text)
 
-    # Unicode正規化
-    normalized = unicodedata.normalize("NFKC", text)
 
-    # 空白、ハイフン、その他の記号を除去
-    normalized = re.sub(r"[\s\-_・−ー]", "", normalized)
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _normalize_nonempty_text(text: str) -> str:
+    """空でないテキストを正規化する（normalize_textのキャッシュ対象）"""
+    # Unicode正規化し、空白・ハイフン・その他の記号を除去
+    normalized = _NORMALIZE_REMOVE_PATTERN.sub("", unicodedata.normalize("NFKC", text))
+    # ひらがなをカタカナに変換し、英字を小文字に統一
+    return normalized.translate(_HIRAGANA_TO_KATAKANA_TABLE).lower()
 
-    # ひらがなをカタカナに変換
-    normalized = hiragana_to_katakana(normalized)
 
-    # 小文字に統一（英字部分）
-    normalized = normalized.lower()
+def normalize_texts(texts: Iterable[str]) -> List[str]:
+    """
+    複数のテキストをまとめて正規化する
 
-    return normalized
+    Args:
+        texts (Iterable[str]): 正規化するテキスト
+
+    Returns:
+        List[str]: 正規化されたテキスト（入力と同じ順序）
+    """
+    return [normalize_text(text) for text in texts]
 
 
 def hiragana_to_katakana(text: str) -> str:
@@ -144,14 +174,7 @@ def hiragana_to_katakana(text: str) -> str:
     Returns:
         str: カタカナに変換されたテキスト
     """
-    result = []
-    for char in text:
-        # ひらがな範囲 (U+3041-U+3096) をカタカナ範囲 (U+30A1-U+30F6) に変換
-        if "\u3041" <= char <= "\u3096":
-            result.append(chr(ord(char) + 0x60))
-        else:
-            result.append(char)
-    return "".join(result)
+    return text.translate(_HIRAGANA_TO_KATAKANA_TABLE)
 
 
 def calculate_text_similarity(str1: str, str2: str) -> float:
@@ -230,25 +253,64 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         int: レーベンシュタイン距離
     """
-    len1, len2 = len(s1), len(s2)
+    return bounded_levenshtein_distance(s1, s2)
 
-    # 動的プログラミング用のテーブルを初期化
-    dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
 
-    # 初期値設定
-    for i in range(len1 + 1):
-        dp[i][0] = i
-    for j in range(len2 + 1):
-        dp[0][j] = j
+def bounded_levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    レーベンシュタイン距離をビット並列アルゴリズム（Myers / Hyyrö）で計算する
 
-    # 動的プログラミング
-    for i in range(1, len1 + 1):
-        for j in range(1, len2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,  # 削除
-                dp[i][j - 1] + 1,  # 挿入
-                dp[i - 1][j - 1] + cost,  # 置換
-            )
+    短い方の文字列の各文字の出現位置をビットマスクにし、DP表の1列をPythonの整数1つで
+    表して長い方の文字列の1文字ごとにまとめて更新する。max_distanceを指定した場合、
+    残りの文字数では距離がmax_distance以下に戻らないと分かった時点で打ち切る。
 
-    return dp[len1][len2]
+    Args:
+        s1 (str): 文字列1
+        s2 (str): 文字列2
+        max_distance (Optional[int]): 打ち切る距離（Noneの場合は打ち切らない）
+
+    Returns:
+        int: レーベンシュタイン距離（打ち切った場合はmax_distance + 1）
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s2) - len(s1) > max_distance:
+        return max_distance + 1
+    if not s1:
+        return len(s2)
+
+    # 短い方の文字列の文字ごとの出現位置のビットマスク
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(s1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    length = len(s1)
+    full_mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    positive_vertical = full_mask
+    negative_vertical = 0
+    distance = length
+
+    for j, char in enumerate(s2):
+        eq = peq.get(char, 0)
+        xv = eq | negative_vertical
+        xh = (((eq & positive_vertical) + positive_vertical) ^ positive_vertical) | eq
+        positive_horizontal = negative_vertical | (~(xh | positive_vertical) & full_mask)
+        negative_horizontal = positive_vertical & xh
+
+        if positive_horizontal & last_bit:
+            distance += 1
+        elif negative_horizontal & last_bit:
+            distance -= 1
+        # 残りの文字で距離は1文字につき最大1しか減らない
+        if max_distance is not None and distance - (len(s2) - j - 1) > max_distance:
+            return max_distance + 1
+
+        positive_horizontal = ((positive_horizontal << 1) | 1) & full_mask
+        negative_horizontal = (negative_horizontal << 1) & full_mask
+        positive_vertical = negative_horizontal | (~(xv | positive_horizontal) & full_mask)
+        negative_vertical = positive_horizontal & xv
+
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
@@ -0,0 +1,423 @@
+"""WAV processing utilities.
+
+Contains helper functions for manipulating WAV data produced by VOICEVOX Core.
+"""
+
+import contextlib
+import io
+import os
+import struct
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+import numpy as np
+
+from yomitalk.utils.logger import logger
+
+# (チャンネル数, サンプル幅, サンプリングレート)
+AudioFormat = Tuple[int, int, int]
+
+# 非圧縮PCMを表すWAVEフォーマットタグ
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# 出力するWAVヘッダーのサイズ（RIFF + fmt + dataチャンクヘッダー）
+_WAV_HEADER_SIZE = 44
+
+
+def combine_wav_data(wav_data_list: List[bytes]) -> bytes:
+    """
+    メモリ上でWAVデータを結合する
+
+    Args:
+        wav_data_list: 結合するWAVデータのバイト列リスト（全て同じフォーマットであること）
+
+    Returns:
+        bytes: 結合されたWAVデータ
+    """
+    if not wav_data_list:
+        return b""
+
+    if len(wav_data_list) == 1:
+        return wav_data_list[0]
+
+    total_files = len(wav_data_list)
+    logger.debug(f"音声ファイル結合: {total_files}ファイル")
+
+    # 全てのWAVファイルのパラメータとデータを読み込む
+    wav_params_and_data: List[Tuple[wave._wave_params, bytes]] = []
+
+    for wav_bytes in wav_data_list:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+            params = wav_file.getparams()
+            frames = wav_file.readframes(wav_file.getnframes())
+            wav_params_and_data.append((params, frames))
+
+    # 結果を書き込むためのメモリバッファを作成
+    output_buffer = io.BytesIO()
+
+    with wave.open(output_buffer, "wb") as output_wav:
+        # WAVパラメータを設定（最初のファイルと同じ）
+        output_wav.setparams(wav_params_and_data[0][0])
+
+        # 全てのフレームデータを書き込む
+        for _, frames in wav_params_and_data:
+            output_wav.writeframes(frames)
+
+    # 結合されたWAVデータを返す
+    return output_buffer.getvalue()
+
+
+def get_wav_duration(wav_data: bytes) -> float:
+    """
+    WAVデータの再生時間を取得する
+
+    Args:
+        wav_data: WAVデータ
+
+    Returns:
+        float: 再生時間（秒）。解析できない場合は0.0
+    """
+    try:
+        with wave.open(io.BytesIO(wav_data), "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return 0.0
+
+
+@dataclass(frozen=True)
+class WavLayout:
+    """WAVファイルのフォーマットとPCMデータの位置"""
+
+    nchannels: int
+    sampwidth: int
+    framerate: int
+    # ファイル先頭からのPCMデータの開始位置とバイト数
+    data_offset: int
+    data_size: int
+
+    @property
+    def audio_format(self) -> AudioFormat:
+        """(チャンネル数, サンプル幅, サンプリングレート)"""
+        return self.nchannels, self.sampwidth, self.framerate
+
+
+def read_wav_layout(f: BinaryIO) -> WavLayout:
+    """
+    WAVのヘッダーを解析し、フォーマットとPCMデータの位置を取得する
+
+    Args:
+        f: 先頭から読み込むWAVファイル（シーク可能であること）
+
+    Returns:
+        WavLayout: フォーマットとPCMデータの位置
+
+    Raises:
+        wave.Error: 非圧縮PCMのWAVとして解析できない場合
+    """
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    f.seek(0)
+    riff_header = f.read(12)
+    if len(riff_header) < 12 or riff_header[:4] != b"RIFF" or riff_header[8:] != b"WAVE":
+        raise wave.Error("not a RIFF/WAVE file")
+
+    audio_format: Optional[AudioFormat] = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise wave.Error("data chunk not found")
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            if len(fmt) < 16:
+                raise wave.Error("fmt chunk is too short")
+            format_tag, nchannels, framerate, _, _, bits_per_sample = struct.unpack("<HHIIHH", fmt[:16])
+            if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE) or nchannels < 1 or bits_per_sample % 8:
+                raise wave.Error(f"unsupported WAV format (tag={format_tag}, channels={nchannels}, bits={bits_per_sample})")
+            audio_format = (nchannels, bits_per_sample // 8, framerate)
+            if chunk_size % 2:
+                f.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if audio_format is None:
+                raise wave.Error("data chunk before fmt chunk")
+            data_offset = f.tell()
+            # 書き込み途中のファイルではサイズが確定していないため、実際のファイルサイズで制限する
+            data_size = min(chunk_size, file_size - data_offset)
+            data_size -= data_size % (audio_format[0] * audio_format[1])
+            return WavLayout(*audio_format, data_offset=data_offset, data_size=data_size)
+        else:
+            f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+
+def convert_pcm(data: bytes, source_format: AudioFormat, target_format: AudioFormat) -> bytes:
+    """
+    PCMデータのチャンネル数・サンプル幅・サンプリングレートを変換する
+
+    サンプリングレートの変換は線形補間で行う。フォーマットの異なるパートを
+    結合する場合のフォールバック用。
+
+    Args:
+        data: 変換するPCMデータ
+        source_format: 変換元の(チャンネル数, サンプル幅, サンプリングレート)
+        target_format: 変換先の(チャンネル数, サンプル幅, サンプリングレート)
+
+    Returns:
+        bytes: 変換後のPCMデータ
+
+    Raises:
+        wave.Error: 対応していないサンプル幅の場合
+    """
+    if source_format == target_format:
+        return data
+
+    source_channels, source_width, source_rate = source_format
+    target_channels, target_width, target_rate = target_format
+    samples = _decode_pcm(data, source_width).reshape(-1, source_channels)
+
+    if source_channels != target_channels:
+        # ダウンミックスしてから必要なチャンネル数に複製する
+        samples = np.repeat(samples.mean(axis=1, keepdims=True), target_channels, axis=1)
+
+    if source_rate != target_rate and len(samples):
+        num_frames = int(round(len(samples) * target_rate / source_rate))
+        source_times = np.arange(len(samples)) / source_rate
+        target_times = np.arange(num_frames) / target_rate
+        samples = np.stack([np.interp(target_times, source_times, samples[:, channel]) for channel in range(target_channels)], axis=1)
+
+    return _encode_pcm(samples, target_width)
+
+
+def _decode_pcm(data: bytes, sampwidth: int) -> np.ndarray:
+    """PCMデータを-1.0〜1.0の浮動小数点数に変換する"""
+    if sampwidth == 1:
+        return (np.frombuffer(data, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+    if sampwidth == 2:
+        return np.frombuffer(data, dtype="<i2").astype(np.float64) / 32768.0
+    if sampwidth == 4:
+        return np.frombuffer(data, dtype="<i4").astype(np.float64) / 2147483648.0
+    raise wave.Error(f"unsupported sample width: {sampwidth}")
+
+
+def _encode_pcm(samples: np.ndarray, sampwidth: int) -> bytes:
+    """-1.0〜1.0の浮動小数点数をPCMデータに変換する"""
+    samples = np.clip(samples, -1.0, 1.0)
+    if sampwidth == 1:
+        return bytes(np.round(samples * 127.0 + 128.0).astype(np.uint8).tobytes())
+    if sampwidth == 2:
+        return bytes(np.round(samples * 32767.0).astype("<i2").tobytes())
+    if sampwidth == 4:
+        return bytes(np.round(samples * 2147483647.0).astype("<i4").tobytes())
+    raise wave.Error(f"unsupported sample width: {sampwidth}")
+
+
+def _copy_file_range(source_fd: int, target_fd: int, offset: int, size: int) -> None:
+    """
+    ファイルの一部を出力ファイルの現在位置にカーネル内でコピーする
+
+    copy_file_range、sendfile、通常の読み書きの順に利用可能な方法を使う。途中で
+    失敗した場合も、次の方法はコピー済みの位置から続ける（データを重複させない）。
+
+    Args:
+        source_fd: コピー元のファイルディスクリプタ
+        target_fd: コピー先のファイルディスクリプタ（書き込み位置が進む）
+        offset: コピー元の開始位置
+        size: コピーするバイト数
+    """
+    end = offset + size
+    for copy in (_copy_with_copy_file_range, _copy_with_sendfile):
+        try:
+            while offset < end:
+                copied = copy(source_fd, target_fd, offset, end - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except (AttributeError, OSError):
+            # 未対応のプラットフォーム・ファイルシステムでは次の方法に切り替える
+            continue
+        if offset >= end:
+            return
+
+    while offset < end:
+        block = os.pread(source_fd, min(end - offset, 1024 * 1024), offset)
+        if not block:
+            raise OSError("unexpected end of file while copying PCM data")
+        # 書き込めたバイト数だけ進める（残りは次の読み込みで書き込む）
+        offset += os.write(target_fd, block)
+
+
+def _copy_with_copy_file_range(source_fd: int, target_fd: int, offset: int, count: int) -> int:
+    """copy_file_rangeで1回コピーし、コピーできたバイト数を返す"""
+    return os.copy_file_range(source_fd, target_fd, count, offset)
+
+
+def _copy_with_sendfile(source_fd: int, target_fd: int, offset: int, count: int) -> int:
+    """sendfileで1回コピーし、コピーできたバイト数を返す"""
+    return os.sendfile(target_fd, source_fd, offset, count)
+
+
+class StreamingWavWriter:
+    """WAVファイルにPCMデータを逐次追記するライター
+
+    各パートのヘッダーは一度だけ解析し、PCMデータはPythonのバイト列を経由せず
+    カーネル内でコピーする（copy_file_range/sendfile）。フォーマットが異なる
+    パートは最初のパートのフォーマットに変換して追記する。音声データをメモリ上に
+    保持せず、close()でRIFFヘッダーのサイズを書き換える。書き込み中は
+    「.partial」付きのファイル名を使い、完成時に本来のファイル名へリネームする。
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        ライターを初期化する（ファイルは最初の追記時に作成される）
+
+        Args:
+            path: 完成後の出力ファイルパス
+        """
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self.nframes = 0
+        self.converted_parts = 0
+        self._file: Optional[BinaryIO] = None
+        self._format: Optional[AudioFormat] = None
+        self._data_size = 0
+
+    def append(self, wav_data: bytes) -> bool:
+        """
+        WAVデータのPCMデータを追記する
+
+        Args:
+            wav_data: 追記するWAVデータ
+
+        Returns:
+            bool: 追記できた場合はTrue
+        """
+        try:
+            layout = read_wav_layout(io.BytesIO(wav_data))
+            pcm_data = memoryview(wav_data)[layout.data_offset : layout.data_offset + layout.data_size]
+            output, output_format = self._prepare_output(layout)
+            if layout.audio_format == output_format:
+                output.write(pcm_data)
+            else:
+                output.write(self._convert(bytes(pcm_data), layout, output_format))
+            self._sync_size(output, output_format)
+        except (OSError, wave.Error) as e:
+            logger.error(f"WAVデータの追記に失敗しました: {e}")
+            return False
+        return True
+
+    def append_file(self, path: Union[str, Path]) -> bool:
+        """
+        WAVファイルのPCMデータをカーネル内でコピーして追記する
+
+        Args:
+            path: 追記するWAVファイルのパス
+
+        Returns:
+            bool: 追記できた場合はTrue
+        """
+        try:
+            with open(path, "rb") as source:
+                layout = read_wav_layout(source)
+                output, output_format = self._prepare_output(layout)
+                if layout.audio_format == output_format:
+                    _copy_file_range(source.fileno(), output.fileno(), layout.data_offset, layout.data_size)
+                else:
+                    source.seek(layout.data_offset)
+                    output.write(self._convert(source.read(layout.data_size), layout, output_format))
+                self._sync_size(output, output_format)
+        except (OSError, wave.Error) as e:
+            logger.error(f"WAVファイルの追記に失敗しました: {path}: {e}")
+            return False
+        return True
+
+    def _prepare_output(self, layout: WavLayout) -> Tuple[BinaryIO, AudioFormat]:
+        """
+        出力ファイルを取得する（最初の追記時にフォーマットを決めてヘッダーを書き込む）
+
+        Args:
+            layout: 追記するWAVのフォーマット
+
+        Returns:
+            Tuple[BinaryIO, AudioFormat]: バッファリングなしで開いた出力ファイルとそのフォーマット
+        """
+        if self._file is None or self._format is None:
+            self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+            # カーネル内コピーとPythonからの書き込みを混在させるためバッファリングしない
+            # （追記のため開いたままにし、close()またはabort()で閉じる）
+            self._file = open(self.partial_path, "wb", buffering=0)  # noqa: SIM115
+            self._format = layout.audio_format
+            self._file.write(self._build_header(self._format, 0))
+        return self._file, self._format
+
+    def _convert(self, pcm_data: bytes, layout: WavLayout, output_format: AudioFormat) -> bytes:
+        """フォーマットの異なるPCMデータを出力ファイルのフォーマットに変換する"""
+        logger.warning(f"WAVフォーマットが一致しないため変換して結合します: {layout.audio_format} -> {output_format}")
+        self.converted_parts += 1
+        return convert_pcm(pcm_data, layout.audio_format, output_format)
+
+    def _sync_size(self, output: BinaryIO, output_format: AudioFormat) -> None:
+        """書き込んだPCMデータのサイズとフレーム数をファイル位置から更新する"""
+        self._data_size = output.tell() - _WAV_HEADER_SIZE
+        self.nframes = self._data_size // (output_format[0] * output_format[1])
+
+    @staticmethod
+    def _build_header(audio_format: AudioFormat, data_size: int) -> bytes:
+        """
+        出力ファイルのWAVヘッダーを作成する
+
+        Args:
+            audio_format: (チャンネル数, サンプル幅, サンプリングレート)
+            data_size: PCMデータのバイト数
+
+        Returns:
+            bytes: 44バイトのWAVヘッダー
+        """
+        nchannels, sampwidth, framerate = audio_format
+        block_align = nchannels * sampwidth
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            _WAV_HEADER_SIZE - 8 + data_size + data_size % 2,
+            b"WAVE",
+            b"fmt ",
+            16,
+            _WAVE_FORMAT_PCM,
+            nchannels,
+            framerate,
+            framerate * block_align,
+            block_align,
+            sampwidth * 8,
+            b"data",
+            data_size,
+        )
+
+    def close(self) -> Optional[Path]:
+        """
+        RIFFヘッダーを確定し、完成したファイルを出力パスに配置する
+
+        Returns:
+            Optional[Path]: 出力ファイルのパス。何も書き込まれていない場合はNone
+        """
+        if self._file is None or self._format is None:
+            return None
+        try:
+            if self._data_size % 2:
+                # RIFFのチャンクは偶数バイトに揃える
+                self._file.write(b"\0")
+            self._file.seek(0)
+            self._file.write(self._build_header(self._format, self._data_size))
+        finally:
+            self._file.close()
+            self._file = None
+        os.replace(self.partial_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """書き込みを中止し、途中のファイルを削除する"""
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+        with contextlib.suppress(OSError):
+            self.partial_path.unlink()